@@ -0,0 +1,88 @@
+import sys
+import time
+import random
+
+from coverage_engine import parse_allowed_values, parse_allowed_values_cached
+
+# Benchmark: per-cell parse_allowed_values loop vs the parse_allowed_values_cached
+# cache on two synthetic 50k-cell sheets (1250 parameters x 40 generations):
+#   repeated - cells drawn from the few shapes seen in real specs (ranges with
+#              "$" bounds, short value lists, blanks), so most cells repeat
+#   distinct - every cell text is different
+# The cache parses each distinct cell once, so its speedup tracks how often
+# cells repeat; on the distinct sheet it is expected to be at or below 1x.
+
+def make_sheet(rows=1250, cols=40, seed=1):
+    rng = random.Random(seed)
+    def cell():
+        kind = rng.random()
+        if kind < 0.1:
+            return None
+        if kind < 0.4:
+            return str(rng.randint(0, 15))
+        if kind < 0.7:
+            lo = rng.randint(0, 64)
+            return f"[{lo}:{lo + rng.choice([3, 7, 15, 255])}]"
+        if kind < 0.8:
+            return f"[{rng.randint(1, 64)}:$]"
+        return ",".join(str(v) for v in sorted(rng.sample(range(12), rng.randint(2, 6))))
+    return [[cell() for _ in range(cols)] for _ in range(rows)]
+
+def make_distinct_sheet(rows=1250, cols=40, seed=2):
+    rng = random.Random(seed)
+    seen = set()
+    def cell():
+        while True:
+            kind = rng.random()
+            if kind < 0.3:
+                text = str(rng.randint(0, 10 ** 6))
+            elif kind < 0.6:
+                lo = rng.randint(0, 10 ** 6)
+                text = f"[{lo}:{lo + rng.randint(1, 10 ** 4)}]"
+            elif kind < 0.7:
+                text = f"[{rng.randint(1, 10 ** 6)}:$]"
+            else:
+                text = ",".join(str(v) for v in sorted(rng.sample(range(10 ** 6), rng.randint(2, 6))))
+            if text not in seen:
+                seen.add(text)
+                return text
+    return [[cell() for _ in range(cols)] for _ in range(rows)]
+
+def best_of(fn, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(name, sheet):
+    columns = [list(col) for col in zip(*sheet)]
+    n_cells = sum(len(col) for col in columns)
+    n_distinct = len({cell for col in columns for cell in col})
+
+    per_cell = [[parse_allowed_values(c) for c in col] for col in columns]
+    cached = [parse_allowed_values_cached(col) for col in columns]
+    if per_cell != cached:
+        print(f"FAIL: cached parsing disagrees with parse_allowed_values on the {name} sheet")
+        return False
+
+    t_cell = best_of(lambda: [[parse_allowed_values(c) for c in col] for col in columns])
+    def cached_columns():
+        memo = {}
+        return [parse_allowed_values_cached(col, memo) for col in columns]
+    t_cached = best_of(cached_columns)
+    print(f"{name} sheet: {n_cells} cells, {n_distinct} distinct")
+    print(f"    per-cell loop:    {t_cell * 1e3:8.2f} ms")
+    print(f"    cached:           {t_cached * 1e3:8.2f} ms")
+    print(f"    speedup:          {t_cell / t_cached:8.1f}x")
+    return True
+
+def main():
+    ok = run("repeated", make_sheet())
+    ok = run("distinct", make_distinct_sheet()) and ok
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
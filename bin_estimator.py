@@ -0,0 +1,224 @@
+from coverage_engine import is_open_low, is_open_high
+from interval_set import IntervalSet
+from bin_expressions import select_matches
+
+# Pre-generation bin counts. Each coverpoint is modelled as a list of BinGroups,
+# one per emitted "bins ..." line, so counts come straight from the inputs
+# without elaborating anything. A count of None means unbounded (an open "$"
+# range expanded one bin per value).
+
+DEFAULT_BIN_BUDGET = 100000
+
+# One "bins" declaration: the values it covers and how SystemVerilog splits them
+#   single - one bin for all values            bins x = {...}
+#   each   - one bin per value                 bins x[] = {...}
+#   fixed  - size bins spread over the values  bins x[size] = {...}
+#   chunk  - consecutive chunks of chunk_size values, each chunk one bin, or
+#            "fixed" with size bins when size is set (Range split)
+class BinGroup:
+    __slots__ = ("values", "mode", "size", "chunk_size")
+
+    def __init__(self, values, mode, size=None, chunk_size=None):
+        self.values = values
+        self.mode = mode
+        self.size = size
+        self.chunk_size = chunk_size
+
+    @property
+    def is_open(self):
+        return self.values.open_low or self.values.open_high
+
+    def bin_count(self):
+        card = self.values.cardinality()
+        if self.mode == "single":
+            return 1 if self.values else 0
+        if self.mode == "each":
+            return card
+        if self.mode == "fixed":
+            return self.size if card is None else min(self.size, card)
+        full, rest = divmod(card, self.chunk_size)
+        per_chunk = (lambda n: min(self.size, n)) if self.size else (lambda n: 1)
+        return full * per_chunk(self.chunk_size) + (per_chunk(rest) if rest else 0)
+
+    # Value set of each bin, in order. "each" groups yield one set per value,
+    # so callers that only need the union handle that mode as a whole instead
+    # of calling this.
+    def iter_bin_sets(self):
+        if self.mode == "single":
+            yield self.values
+        elif self.mode == "each":
+            for a, b in self.values:
+                for v in range(a, b + 1):
+                    yield IntervalSet([(v, v)])
+        elif self.mode == "fixed":
+            yield from _fixed_bin_sets(self.values, self.size)
+        else:
+            lo, hi = self.values.min, self.values.max
+            for start in range(lo, hi + 1, self.chunk_size):
+                chunk = IntervalSet([(start, min(start + self.chunk_size - 1, hi))])
+                if self.size:
+                    yield from _fixed_bin_sets(chunk, self.size)
+                else:
+                    yield chunk
+
+# Values of a finite set whose rank (position in sorted order) is in [first:last]
+def _slice_by_rank(values, first, last):
+    pieces = []
+    rank = 0
+    for a, b in values:
+        n = b - a + 1
+        lo, hi = max(first, rank), min(last, rank + n - 1)
+        if lo <= hi:
+            pieces.append((a + lo - rank, a + hi - rank))
+        rank += n
+        if rank > last:
+            break
+    return IntervalSet(pieces)
+
+# Bins of "bins x[size] = {values}": card // size values each, the last bin
+# taking the remainder, or one value per bin when size >= card
+def _fixed_bin_sets(values, size):
+    card = values.cardinality()
+    if size >= card:
+        yield from BinGroup(values, "each").iter_bin_sets()
+        return
+    per_bin = card // size
+    for k in range(size):
+        yield _slice_by_rank(values, k * per_bin, card - 1 if k == size - 1 else (k + 1) * per_bin - 1)
+
+# BinGroups for one custom input row recorded by build_user_inputs
+def row_bin_groups(row):
+    parsed, bins_count, range_div = row["parsed"], row["bins_count"], row["range_div"]
+    fixed = bins_count if bins_count is not None and bins_count > 1 else None
+    if row.get("value_set") is not None:
+        # Per-value row trimmed by resolve_bin_overlaps
+        return [BinGroup(row["value_set"], "each")]
+    if row.get("chunks"):
+        mode = "fixed" if fixed else "single"
+        return [BinGroup(IntervalSet([chunk]), mode, fixed) for chunk in row["chunks"]]
+    if parsed["type"] == "range":
+        min_val, max_val = parsed["range"]
+        values = IntervalSet([(min_val, max_val)])
+        if range_div is not None and not (is_open_low(min_val) or is_open_high(max_val)):
+            return [BinGroup(values, "chunk", fixed, range_div)]
+    else:
+        values = IntervalSet.from_values(parsed["values"])
+    return [BinGroup(values, "fixed", fixed)] if fixed else [BinGroup(values, "each")]
+
+# BinGroups per emitted coverpoint of one generation, keyed by parameter
+def coverpoint_bin_groups(spec, user_inputs, gen):
+    allowed = spec["allowed_values"][gen]
+    groups = {}
+    for param in spec["parameters"]:
+        if param == "pkt_type":
+            if "pkt_type" in allowed:
+                groups[param] = [BinGroup(IntervalSet.from_items([item]), "single") for item in allowed[param]]
+            continue
+        param_inputs = user_inputs.get(param)
+        if not param_inputs:
+            continue
+        if param_inputs['use_default']:
+            if allowed.get(param):
+                groups[param] = [BinGroup(IntervalSet.from_items([item]), "each") for item in allowed[param]]
+        elif param_inputs['custom_rows']:
+            groups[param] = [group for row in param_inputs['custom_rows'] for group in row_bin_groups(row)]
+    return groups
+
+# Value set of every bin of a coverpoint, in order; bins over an open range
+# are placed by the tool, so those coverpoints are refused
+def coverpoint_bin_sets(groups):
+    bins = []
+    for group in groups:
+        if group.is_open and group.mode != "single":
+            raise ValueError("has an unbounded number of bins")
+        bins.extend(group.iter_bin_sets())
+    return bins
+
+# Counts for a covering-array cross: one bin per tuple, every other cross bin
+# ignored. Same keys as cross_calculator.effective_cross_bins.
+def tuple_cross_bins(tuples, ignore_expr=None, illegal_exprs=()):
+    illegal = ignored = 0
+    for cross_bin in tuples:
+        if any(select_matches(expr, cross_bin) for expr in illegal_exprs):
+            illegal += 1
+        elif ignore_expr is not None and select_matches(ignore_expr, cross_bin):
+            ignored += 1
+    return {"bins": len(tuples), "ignored": ignored, "illegal": illegal,
+            "effective": len(tuples) - ignored - illegal, "clauses": [], "dead": [], "overlaps": []}
+
+def _sum_counts(counts):
+    return None if any(c is None for c in counts) else sum(counts)
+
+# Map the names a cross may use ("cov_mcs", "mcs") to parameters
+def coverpoint_names(spec):
+    names = {}
+    for param in spec["parameters"]:
+        names[f"cov_{param.lower()}"] = param
+        names[param.lower()] = param
+    return names
+
+# Estimate per-coverpoint bin counts and exact per-cross counts for every
+# selected generation. Crosses are counted by cross_calculator after their
+# ignore_bins and illegal_bins, which also reports dead and overlapping clauses;
+# covering-array crosses are counted tuple by tuple.
+def estimate_bins(spec, user_inputs, wifi_specs=None):
+    names = coverpoint_names(spec)
+    estimate = {}
+    for gen in spec["generations"]:
+        if wifi_specs is not None and not wifi_specs.get(gen, True):
+            continue
+        groups = coverpoint_bin_groups(spec, user_inputs, gen)
+        coverpoints = {f"cov_{param.lower()}": _sum_counts([g.bin_count() for g in group_list])
+                       for param, group_list in groups.items()}
+        crosses = {}
+        for cross in user_inputs.get(gen, {}).get('crosses', []):
+            if cross.get("tuples") is not None:
+                crosses[cross["name"]] = tuple_cross_bins(
+                    cross["tuples"], cross.get("ignore_expr"), cross.get("illegal_exprs", []))
+                continue
+            # NumPy is only needed once there is a cross to count
+            from cross_calculator import effective_cross_bins
+            cp_groups = {cp: groups.get(names.get(cp), []) for cp in cross["coverpoints"]}
+            crosses[cross["name"]] = effective_cross_bins(
+                cp_groups, cross.get("ignore_expr"), cross.get("illegal_exprs", []))
+        counts = list(coverpoints.values()) + [c["effective"] for c in crosses.values()]
+        estimate[gen] = {"coverpoints": coverpoints, "crosses": crosses, "total": _sum_counts(counts)}
+    return estimate
+
+# Human-readable problems for any coverpoint or cross that is unbounded or over budget
+def check_bin_budget(estimate, budget=DEFAULT_BIN_BUDGET):
+    problems = []
+    for gen, counts in estimate.items():
+        items = list(counts["coverpoints"].items()) + [(name, c["effective"]) for name, c in counts["crosses"].items()]
+        for name, count in items:
+            if count is None:
+                problems.append(f"{gen}: {name} has an unbounded number of bins")
+            elif budget is not None and count > budget:
+                problems.append(f"{gen}: {name} has {count} bins (budget {budget})")
+    return problems
+
+def _fmt(count):
+    return "unbounded" if count is None else str(count)
+
+# Text table of an estimate, shared by the CLI and the GUI
+def format_estimate(estimate):
+    lines = []
+    for gen, counts in estimate.items():
+        lines.append(f"{gen}: {_fmt(counts['total'])} bins")
+        for name, count in counts["coverpoints"].items():
+            lines.append(f"    {name}: {_fmt(count)}")
+        for name, c in counts["crosses"].items():
+            lines.append(f"    {name}: {_fmt(c['effective'])} (cross {_fmt(c['bins'])}, "
+                         f"ignored {_fmt(c['ignored'])}, illegal {_fmt(c['illegal'])})")
+    return "\n".join(lines)
+
+# Human-readable notes on cross clauses that match no cross bin or overlap another
+def check_cross_clauses(estimate):
+    problems = []
+    for gen, counts in estimate.items():
+        for name, c in counts["crosses"].items():
+            for clause in c["dead"]:
+                problems.append(f"{gen}: {name}: {clause} matches no cross bin")
+            for first, second, count in c["overlaps"]:
+                problems.append(f"{gen}: {name}: {first} and {second} both match {_fmt(count)} cross bins")
+    return problems
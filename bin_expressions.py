@@ -0,0 +1,336 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from interval_set import IntervalSet, OPEN_LOW, OPEN_HIGH, is_open_low, is_open_high
+
+# Tokenizer, parser and AST for cross bin expressions.
+#
+# ignore_bins take SystemVerilog select expressions:
+#     binsof(cov_mcs) intersect {1,[4:$]} && !(binsof(cov_bw) intersect {40} || binsof(cov_nss))
+# illegal_bins take conditions over coverpoint variables, which are turned into
+# the same select AST for the cross they belong to:
+#     mcs=3 && chan_bw != 20 || nss inside {[2:4]}
+#
+# Precedence is ! over && over ||, parentheses group, "$" is an open bound.
+# Both parsers are memoized by input text, so the same expression typed into
+# several crosses is parsed once; AST nodes are immutable and safe to share.
+# The AST drives both emission (render_select) and Python-side evaluation
+# (select_matches).
+
+# Raised for malformed expressions; a ValueError so existing handlers catch it
+class ExprSyntaxError(ValueError):
+    pass
+
+# Select AST. items are parse_allowed_values-style tuples, ("value", v) or
+# ("range", (a, b)); items is None for a bare binsof(cp).
+Binsof = namedtuple("Binsof", "coverpoint items")
+Not = namedtuple("Not", "operand")
+And = namedtuple("And", "operands")
+Or = namedtuple("Or", "operands")
+# Condition leaves, only produced by parse_condition: op is one of
+# == != < <= > >= (a lone "=" means ==); Inside holds a value list
+Compare = namedtuple("Compare", "name op value")
+Inside = namedtuple("Inside", "name items")
+
+_TOKEN_RE = re.compile(r"\s*(?:(\d+)|([A-Za-z_][A-Za-z0-9_]*)|(&&|\|\||==|!=|<=|>=|[!=<>(){}\[\]:,.$-]))")
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match:
+            raise ExprSyntaxError(f"unexpected character '{text[pos:].lstrip()[0]}' at position {pos}")
+        number, name, symbol = match.groups()
+        if number is not None:
+            tokens.append(("int", int(number), match.start(1)))
+        elif name is not None:
+            tokens.append(("name", name, match.start(2)))
+        else:
+            tokens.append(("op", symbol, match.start(3)))
+        pos = match.end()
+    tokens.append(("end", None, len(text)))
+    return tokens
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    def peek(self, value=None):
+        kind, tok, _ = self.tokens[self.pos]
+        if value is None:
+            return kind != "end"
+        return tok == value and kind in ("op", "name")
+
+    def take(self, value=None):
+        kind, tok, where = self.tokens[self.pos]
+        if value is not None and not (tok == value and kind in ("op", "name")):
+            found = "end of input" if kind == "end" else f"'{tok}'"
+            raise ExprSyntaxError(f"expected '{value}' but found {found} at position {where}")
+        self.pos += 1
+        return kind, tok
+
+    def expect_end(self):
+        kind, tok, where = self.tokens[self.pos]
+        if kind != "end":
+            raise ExprSyntaxError(f"unexpected '{tok}' at position {where}")
+
+    def name(self):
+        kind, tok, where = self.tokens[self.pos]
+        if kind != "name":
+            raise ExprSyntaxError(f"expected a name at position {where}")
+        self.pos += 1
+        return tok
+
+    def integer(self):
+        negative = False
+        if self.peek("-"):
+            self.take("-")
+            negative = True
+        kind, tok, where = self.tokens[self.pos]
+        if kind != "int":
+            raise ExprSyntaxError(f"expected a number at position {where}")
+        self.pos += 1
+        return -tok if negative else tok
+
+    def bound(self, open_value):
+        if self.peek("$"):
+            self.take("$")
+            return open_value
+        return self.integer()
+
+    # {item, item, ...} where an item is v or [a:b]
+    def value_list(self):
+        self.take("{")
+        items = []
+        while True:
+            if self.peek("["):
+                self.take("[")
+                a = self.bound(OPEN_LOW)
+                self.take(":")
+                b = self.bound(OPEN_HIGH)
+                self.take("]")
+                items.append(("range", (a, b)))
+            else:
+                items.append(("value", self.integer()))
+            if not self.peek(","):
+                break
+            self.take(",")
+        self.take("}")
+        return tuple(items)
+
+    # Left-associative chain of one operator; a single operand is returned as is
+    def chain(self, op, node_type, operand):
+        operands = [operand()]
+        while self.peek(op):
+            self.take(op)
+            operands.append(operand())
+        return operands[0] if len(operands) == 1 else node_type(tuple(operands))
+
+    def select_or(self):
+        return self.chain("||", Or, self.select_and)
+
+    def select_and(self):
+        return self.chain("&&", And, self.select_unary)
+
+    def select_unary(self):
+        if self.peek("!"):
+            self.take("!")
+            return Not(self.select_unary())
+        if self.peek("("):
+            self.take("(")
+            node = self.select_or()
+            self.take(")")
+            return node
+        return self.binsof()
+
+    def binsof(self):
+        self.take("binsof")
+        self.take("(")
+        coverpoint = self.name()
+        if self.peek("."):
+            self.take(".")
+            coverpoint += "." + self.name()
+        self.take(")")
+        items = None
+        if self.peek("intersect"):
+            self.take("intersect")
+            items = self.value_list()
+        return Binsof(coverpoint, items)
+
+    def condition_or(self):
+        return self.chain("||", Or, self.condition_and)
+
+    def condition_and(self):
+        return self.chain("&&", And, self.condition_unary)
+
+    def condition_unary(self):
+        if self.peek("!"):
+            self.take("!")
+            return Not(self.condition_unary())
+        if self.peek("("):
+            self.take("(")
+            node = self.condition_or()
+            self.take(")")
+            return node
+        if self.peek("binsof"):
+            return self.binsof()
+        name = self.name()
+        if self.peek("inside"):
+            self.take("inside")
+            return Inside(name, self.value_list())
+        kind, op = self.take()
+        if kind != "op" or op not in ("=", "==", "!=", "<", "<=", ">", ">="):
+            raise ExprSyntaxError(f"expected a comparison after '{name}'")
+        if op == "=":
+            op = "=="
+        return Compare(name, op, self.integer())
+
+# Parse an ignore_bins select expression; None for empty text
+@lru_cache(maxsize=1024)
+def parse_select_expression(text):
+    if not text.strip():
+        return None
+    parser = _Parser(text)
+    node = parser.select_or()
+    parser.expect_end()
+    return node
+
+# Parse one illegal_bins condition; None for empty text
+@lru_cache(maxsize=1024)
+def parse_condition(text):
+    if not text.strip():
+        return None
+    parser = _Parser(text)
+    node = parser.condition_or()
+    parser.expect_end()
+    return node
+
+# The cross coverpoint a condition variable refers to: "mcs" -> "cov_mcs"
+def resolve_coverpoint(name, coverpoints):
+    lowered = name.lower()
+    for cp in coverpoints:
+        if cp.lower() in (lowered, f"cov_{lowered}"):
+            return cp
+    raise ExprSyntaxError(f"'{name}' is not a coverpoint of this cross ({', '.join(coverpoints)})")
+
+# Rewrite a condition as a select expression over the cross's coverpoints.
+# A comparison selects the cross bins whose coverpoint bin holds a matching value.
+def condition_to_select(node, coverpoints):
+    if isinstance(node, Compare):
+        cp = resolve_coverpoint(node.name, coverpoints)
+        v = node.value
+        if node.op == "!=":
+            return Not(Binsof(cp, (("value", v),)))
+        items = {
+            "==": ("value", v),
+            "<": ("range", (OPEN_LOW, v - 1)),
+            "<=": ("range", (OPEN_LOW, v)),
+            ">": ("range", (v + 1, OPEN_HIGH)),
+            ">=": ("range", (v, OPEN_HIGH)),
+        }[node.op]
+        return Binsof(cp, (items,))
+    if isinstance(node, Inside):
+        return Binsof(resolve_coverpoint(node.name, coverpoints), node.items)
+    if isinstance(node, Binsof):
+        return node
+    if isinstance(node, Not):
+        return Not(condition_to_select(node.operand, coverpoints))
+    return type(node)(tuple(condition_to_select(child, coverpoints) for child in node.operands))
+
+# Value list text; integer-only lists are compacted by format_value
+def _items_text(items, format_values):
+    if all(item_type == "value" for item_type, _ in items):
+        return format_values([item for _, item in items])
+    parts = []
+    for item_type, item in items:
+        if item_type == "value":
+            parts.append(str(item))
+        else:
+            a, b = item
+            parts.append(f"[{'$' if is_open_low(a) else a}:{'$' if is_open_high(b) else b}]")
+    return "{" + ",".join(parts) + "}"
+
+def _default_format_values(values):
+    return "{" + ",".join(map(str, values)) + "}"
+
+# SystemVerilog text for a select AST. A plain binsof && binsof chain is joined
+# without spaces, as the GUI's ignore_bins lines always have been, unless spaced;
+# nested expressions use spaced operators and parentheses where precedence needs them.
+def render_select(node, spaced=False, format_values=_default_format_values):
+    if isinstance(node, Binsof):
+        if node.items is None:
+            return f"binsof ({node.coverpoint})"
+        return f"binsof ({node.coverpoint}) intersect {_items_text(node.items, format_values)}"
+    if isinstance(node, Not):
+        inner = render_select(node.operand, spaced, format_values)
+        return f"!{inner}" if isinstance(node.operand, Binsof) else f"!({inner})"
+    if isinstance(node, And) and all(isinstance(child, Binsof) for child in node.operands):
+        return (" && " if spaced else "&&").join(render_select(child, spaced, format_values) for child in node.operands)
+    joiner = " && " if isinstance(node, And) else " || "
+    parts = []
+    for child in node.operands:
+        text = render_select(child, spaced, format_values)
+        parts.append(f"({text})" if isinstance(child, (And, Or)) else text)
+    return joiner.join(parts)
+
+# Apply the GUI's Operator field to a parsed ignore expression. The field has
+# always joined the clauses of each plain binsof && binsof term, so with "||"
+# those terms become Or nodes; the AST then means what is emitted.
+def apply_clause_operator(node, operator):
+    if operator not in ("&&", "||"):
+        raise ExprSyntaxError(f"unknown operator '{operator}' (use && or ||)")
+    if node is None or operator == "&&":
+        return node
+    terms = [Or(term.operands) if isinstance(term, And) and all(isinstance(c, Binsof) for c in term.operands)
+             else term for term in select_terms(node)]
+    return terms[0] if len(terms) == 1 else Or(tuple(terms))
+
+# Top-level || terms of a select expression, one per emitted ignore line
+def select_terms(node):
+    if node is None:
+        return []
+    return list(node.operands) if isinstance(node, Or) else [node]
+
+# Coverpoints a select expression names
+def select_coverpoints(node):
+    if isinstance(node, Binsof):
+        return {node.coverpoint}
+    if isinstance(node, Not):
+        return select_coverpoints(node.operand)
+    return set().union(*(select_coverpoints(child) for child in node.operands))
+
+@lru_cache(maxsize=4096)
+def _items_set(items):
+    return IntervalSet.from_items(items)
+
+# Evaluate a select AST on one cross bin, given as {coverpoint: IntervalSet of
+# the values in that coverpoint's bin}. binsof(cp) intersect {...} holds when the
+# bin shares a value with the list; a bare binsof(cp) holds for any bin of cp.
+def select_matches(node, cross_bin):
+    if isinstance(node, Binsof):
+        values = cross_bin.get(node.coverpoint)
+        if values is None:
+            return False
+        return node.items is None or bool(values & _items_set(node.items))
+    if isinstance(node, Not):
+        return not select_matches(node.operand, cross_bin)
+    if isinstance(node, And):
+        return all(select_matches(child, cross_bin) for child in node.operands)
+    return any(select_matches(child, cross_bin) for child in node.operands)
+
+# Legacy [(coverpoint, [value text, ...]), ...] clause lists for the terms of a
+# select expression that are plain binsof-intersect chains; other terms are skipped
+def select_to_conditions(node):
+    conditions = []
+    for term in select_terms(node):
+        clauses = term.operands if isinstance(term, And) else (term,)
+        if not all(isinstance(c, Binsof) and c.items is not None for c in clauses):
+            continue
+        conditions.append([(c.coverpoint, [_items_text((item,), _default_format_values)[1:-1] for item in c.items])
+                           for c in clauses])
+    return conditions
@@ -0,0 +1,65 @@
+import json
+
+import numpy as np
+
+# Non-uniform ways to split a finite range [lo:hi] into chunks, for parameters
+# such as packet length where equal-width chunks spend most bins on values that
+# are rarely hit. Every strategy computes a sorted array of chunk start edges
+# with NumPy; _chunks_from_edges turns them into closed [a:b] chunks.
+#   log      - count chunks with geometrically growing widths
+#   pow2     - chunk edges at powers of two ([1:1], [2:3], [4:7], ...)
+#   quantile - count chunks holding roughly equal shares of observed samples
+
+SPLIT_STRATEGIES = ("equal", "log", "pow2", "quantile")
+
+# Chunks [edge_k : edge_k+1 - 1] covering [lo:hi]; edges are deduplicated, so
+# strategies that round several edges onto one value just yield fewer chunks
+def _chunks_from_edges(lo, hi, edges):
+    edges = np.unique(np.clip(np.asarray(edges, dtype=np.int64), lo, hi))
+    edges = edges[edges > lo]
+    starts = np.r_[np.int64(lo), edges]
+    ends = np.r_[edges - 1, np.int64(hi)]
+    return [(int(a), int(b)) for a, b in zip(starts, ends)]
+
+def log_chunks(lo, hi, count):
+    # Geometric spacing over the offsets 1..width+1 so ranges starting at or
+    # below zero work too
+    width = hi - lo + 1
+    edges = lo - 1 + np.rint(np.geomspace(1, width + 1, count + 1)[1:-1])
+    return _chunks_from_edges(lo, hi, edges)
+
+def pow2_chunks(lo, hi):
+    edges = [0] if lo < 0 else []
+    if hi >= 1:
+        edges.extend(np.left_shift(np.int64(1), np.arange(int(hi).bit_length(), dtype=np.int64)))
+    return _chunks_from_edges(lo, hi, edges)
+
+def quantile_chunks(lo, hi, count, samples):
+    samples = np.asarray(samples, dtype=np.int64)
+    samples = samples[(samples >= lo) & (samples <= hi)]
+    if samples.size == 0:
+        raise ValueError(f"no samples inside [{lo}:{hi}]")
+    # A chunk starts just after each inner quantile, so equal sample values stay together
+    cuts = np.quantile(samples, np.linspace(0, 1, count + 1)[1:-1], method="inverted_cdf")
+    return _chunks_from_edges(lo, hi, np.asarray(cuts, dtype=np.int64) + 1)
+
+# Chunks of [min_val:max_val] for a non-equal strategy. count is ignored by pow2;
+# quantile needs the parameter's observed samples.
+def split_chunks(min_val, max_val, strategy, count=None, samples=None):
+    if strategy == "log":
+        return log_chunks(min_val, max_val, count)
+    if strategy == "pow2":
+        return pow2_chunks(min_val, max_val)
+    if strategy == "quantile":
+        if samples is None or len(samples) == 0:
+            raise ValueError("quantile split needs value samples")
+        return quantile_chunks(min_val, max_val, count, samples)
+    raise ValueError(f"unknown split strategy '{strategy}'")
+
+# Observed values per parameter from a JSON file: {"pkt_len": [64, 1500, ...], ...}
+def load_samples(path):
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("samples file must map parameter names to value lists")
+    return {param: [int(v) for v in values] for param, values in data.items()}
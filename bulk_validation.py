@@ -0,0 +1,97 @@
+import numpy as np
+
+from coverage_engine import get_domain_index, parse_user_input
+from interval_set import within_sentinels
+
+# Batch validation for scripted sweeps. Each candidate input becomes one or more
+# [lo:hi] segments (a range is one segment, a value list one per value); every
+# segment is located in each generation's sorted interval table with a single
+# np.searchsorted call, and the per-segment results are folded back per input
+# with reduceat. Nothing loops over inputs x allowed items in Python.
+
+# Per-generation (starts, ends) int64 arrays for one parameter
+def build_interval_tables(spec, param):
+    index = get_domain_index(spec)
+    tables = []
+    for gen in spec["generations"]:
+        allowed = index.allowed_set(param, gen)
+        tables.append((np.asarray(allowed.starts, dtype=np.int64), np.asarray(allowed.ends, dtype=np.int64)))
+    return tables
+
+# Flatten parsed inputs into segment arrays; owner[i] is the input each segment
+# came from. A segment with a bound past the "$" sentinels does not fit int64;
+# it is stored as [0:0] with representable[i] False, so its input is illegal
+# with mask 0, as the per-row checks report it.
+def _segments(parsed_inputs):
+    lows, highs, owners, representable = [], [], [], []
+    for i, parsed in enumerate(parsed_inputs):
+        if parsed is None:
+            continue
+        pairs = [parsed["range"]] if parsed["type"] == "range" else [(v, v) for v in parsed["values"]]
+        for lo, hi in pairs:
+            fits = within_sentinels(lo) and within_sentinels(hi)
+            lows.append(lo if fits else 0)
+            highs.append(hi if fits else 0)
+            owners.append(i)
+            representable.append(fits)
+    return (np.asarray(lows, dtype=np.int64), np.asarray(highs, dtype=np.int64),
+            np.asarray(owners, dtype=np.int64), np.asarray(representable, dtype=bool))
+
+# True where [lo:hi] lies inside a single interval of the table
+def _segments_inside(lows, highs, starts, ends):
+    if len(starts) == 0:
+        return np.zeros(len(lows), dtype=bool)
+    idx = np.searchsorted(starts, lows, side="right") - 1
+    inside = idx >= 0
+    return inside & (highs <= ends[np.maximum(idx, 0)])
+
+# Fold per-segment booleans into per-input "all segments pass"
+def _all_per_input(segment_ok, owners, n_inputs, has_segments):
+    result = np.zeros(n_inputs, dtype=bool)
+    if len(owners):
+        starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        result[owners[starts]] = np.logical_and.reduceat(segment_ok, starts)
+    return result & has_segments
+
+# Validate many candidate inputs for one parameter. inputs may be raw strings
+# (parsed with parse_user_input) or already-parsed dicts. Returns arrays:
+#   parsed           - input parsed successfully
+#   legal            - parsed and inside the combined allowed range (the check
+#                      generate_coverage applies to each GUI row)
+#   generation_mask  - bit g set when spec["generations"][g] allows every value
+#                      of the input (uint64 array, or a list of ints past 64 generations)
+def validate_param_inputs(spec, param, inputs):
+    parsed_inputs = [parse_user_input(item) if isinstance(item, str) else item for item in inputs]
+    n_inputs = len(parsed_inputs)
+    has_segments = np.array([parsed is not None for parsed in parsed_inputs], dtype=bool)
+    lows, highs, owners, representable = _segments(parsed_inputs)
+
+    overall_min, overall_max = get_domain_index(spec).combined_range(param)
+    if overall_min is None:
+        legal = np.zeros(n_inputs, dtype=bool)
+    else:
+        in_range = representable & (lows >= overall_min) & (highs <= overall_max)
+        legal = _all_per_input(in_range, owners, n_inputs, has_segments)
+
+    tables = build_interval_tables(spec, param)
+    accepts = np.zeros((n_inputs, len(tables)), dtype=bool)
+    for g, (starts, ends) in enumerate(tables):
+        inside = representable & _segments_inside(lows, highs, starts, ends)
+        accepts[:, g] = _all_per_input(inside, owners, n_inputs, has_segments)
+
+    if len(tables) <= 64:
+        weights = np.left_shift(np.uint64(1), np.arange(len(tables), dtype=np.uint64))
+        generation_mask = (accepts.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+    else:
+        generation_mask = [sum(1 << g for g in np.flatnonzero(row)) for row in accepts]
+
+    return {"parsed": has_segments, "legal": legal, "generation_mask": generation_mask}
+
+# Validate {param: [inputs...]} for many parameters at once
+def validate_inputs_bulk(spec, inputs_by_param):
+    return {param: validate_param_inputs(spec, param, inputs) for param, inputs in inputs_by_param.items()}
+
+# Generation names whose bit is set in a mask
+def mask_to_generations(spec, mask):
+    mask = int(mask)
+    return [gen for g, gen in enumerate(spec["generations"]) if mask >> g & 1]
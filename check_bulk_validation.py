@@ -0,0 +1,76 @@
+import sys
+import random
+
+from coverage_engine import get_domain_index, parse_user_input
+from bulk_validation import validate_param_inputs, mask_to_generations
+from interval_set import OPEN_LOW, OPEN_HIGH
+
+# Parity check of bulk_validation against the per-row checks the GUI and CLI
+# apply (DomainIndex.is_within_combined_range / is_allowed_for_generation).
+# Random inputs, including "$" bounds, values at the sentinels and bounds far
+# past int64, are validated both ways on an open-ended spec and on a closed
+# one; legal flags and generation masks must agree for every input.
+
+def spec_from_items(allowed_values):
+    generations = list(allowed_values)
+    parameters = sorted({param for params in allowed_values.values() for param in params})
+    return {"parameters": parameters, "generations": generations, "allowed_values": allowed_values}
+
+SPECS = {
+    "open": spec_from_items({
+        "11b": {"pkt_len": [("range", (0, OPEN_HIGH))], "mcs": [("range", (0, 3))]},
+        "11n": {"pkt_len": [("range", (OPEN_LOW, 100))], "mcs": [("range", (0, 7)), ("value", 32)]},
+        "11ax": {"pkt_len": [("range", (64, 4095))], "mcs": [("range", (0, 11))]},
+    }),
+    "closed": spec_from_items({
+        "11b": {"pkt_len": [("range", (1, 4095))], "mcs": [("value", 0), ("value", 2)]},
+        "11n": {"pkt_len": [("range", (1, 65535))], "mcs": [("range", (0, 7))]},
+    }),
+}
+
+BIG = [10 ** 20, 99999999999999999999, 1 << 63, (1 << 64) + 5]
+
+def random_bound(rng):
+    kind = rng.random()
+    if kind < 0.15:
+        return str(rng.choice(BIG) * rng.choice([1, -1]))
+    if kind < 0.25:
+        return str(rng.choice([OPEN_LOW, OPEN_HIGH, OPEN_LOW - 1, OPEN_HIGH + 1]))
+    return str(rng.randint(-10, 5000))
+
+def random_input(rng):
+    kind = rng.random()
+    if kind < 0.4:
+        lo, hi = random_bound(rng), random_bound(rng)
+        if rng.random() < 0.1:
+            lo = "$"
+        if rng.random() < 0.1:
+            hi = "$"
+        return f"[{lo}:{hi}]"
+    if kind < 0.95:
+        return ",".join(random_bound(rng) for _ in range(rng.randint(1, 3)))
+    return rng.choice(["", "abc", "[1:x]"])
+
+def main(count=2000, seed=1):
+    rng = random.Random(seed)
+    failures = 0
+    for spec_name, spec in SPECS.items():
+        index = get_domain_index(spec)
+        for param in spec["parameters"]:
+            inputs = [random_input(rng) for _ in range(count)] + ["99999999999999999999", "[5:99999999999999999999]"]
+            result = validate_param_inputs(spec, param, inputs)
+            for i, text in enumerate(inputs):
+                parsed = parse_user_input(text)
+                legal = parsed is not None and index.is_within_combined_range(parsed, param)
+                gens = [] if parsed is None else [gen for gen in spec["generations"]
+                                                  if index.is_allowed_for_generation(parsed, param, gen)]
+                bulk_gens = mask_to_generations(spec, result["generation_mask"][i])
+                if bool(result["legal"][i]) != legal or bulk_gens != gens:
+                    failures += 1
+                    print(f"FAIL {spec_name} {param} '{text}': bulk legal={bool(result['legal'][i])} {bulk_gens}, "
+                          f"per row legal={legal} {gens}")
+    print(f"{count} random inputs per parameter, {failures} mismatches")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main(*map(int, sys.argv[1:3])))
@@ -0,0 +1,108 @@
+import sys
+import random
+import itertools
+
+from interval_set import IntervalSet
+from bin_expressions import Binsof, Not, And, Or, render_select, select_matches, select_terms
+from bin_estimator import BinGroup
+from cross_calculator import effective_cross_bins
+
+# Brute-force check of cross_calculator.effective_cross_bins. Random small
+# crosses (every BinGroup mode, random select expressions for ignore and
+# illegal bins) are counted twice: by the class-splitting calculator, and by
+# enumerating every cross bin and evaluating each clause with select_matches.
+# Counts, dead clauses and overlapping clause pairs must agree exactly.
+
+def random_values(rng, lo=0, hi=20):
+    pieces = []
+    for _ in range(rng.randint(1, 3)):
+        a = rng.randint(lo, hi)
+        pieces.append((a, min(hi, a + rng.choice([0, 0, 1, 3, 6]))))
+    return IntervalSet(pieces)
+
+def random_group(rng):
+    values = random_values(rng)
+    mode = rng.choice(["single", "each", "fixed", "chunk"])
+    if mode == "fixed":
+        return BinGroup(values, "fixed", rng.randint(2, 5))
+    if mode == "chunk":
+        values = IntervalSet([(values.min, values.max)])
+        return BinGroup(values, "chunk", rng.choice([None, 2, 3]), rng.randint(2, 5))
+    return BinGroup(values, mode)
+
+def random_binsof(rng, cps):
+    cp = rng.choice(cps)
+    if rng.random() < 0.15:
+        return Binsof(cp, None)
+    return Binsof(cp, tuple(random_values(rng).to_items()))
+
+def random_select(rng, cps, depth=0):
+    kind = rng.random()
+    if depth >= 2 or kind < 0.4:
+        return random_binsof(rng, cps)
+    if kind < 0.55:
+        return Not(random_select(rng, cps, depth + 1))
+    operands = tuple(random_select(rng, cps, depth + 1) for _ in range(rng.randint(2, 3)))
+    return And(operands) if kind < 0.8 else Or(operands)
+
+def random_cross(rng):
+    cps = [f"cov_p{k}" for k in range(rng.randint(1, 3))]
+    cp_groups = {cp: [random_group(rng) for _ in range(rng.randint(1, 2))] for cp in cps}
+    ignore_terms = [random_select(rng, cps) for _ in range(rng.randint(0, 3))]
+    ignore_expr = None if not ignore_terms else ignore_terms[0] if len(ignore_terms) == 1 else Or(tuple(ignore_terms))
+    illegal_exprs = [random_select(rng, cps) for _ in range(rng.randint(0, 2))]
+    return cp_groups, ignore_expr, illegal_exprs
+
+# Same result keys as effective_cross_bins, by enumerating every cross bin
+def brute_force(cp_groups, ignore_expr, illegal_exprs):
+    clauses = ([("ignore", term) for term in select_terms(ignore_expr)] +
+               [("illegal", expr) for expr in illegal_exprs])
+    labels = ([f"ignore {k}" for k in range(1, len(select_terms(ignore_expr)) + 1)] +
+              [f"illegal {k}" for k in range(1, len(illegal_exprs) + 1)])
+    texts = [f"{label}: {render_select(node)}" for label, (_, node) in zip(labels, clauses)]
+    cps = list(cp_groups)
+    bins_by_cp = [[s for group in cp_groups[cp] for s in group.iter_bin_sets()] for cp in cps]
+    total = ignored = illegal = 0
+    matched = [0] * len(clauses)
+    pairs = {}
+    for combo in itertools.product(*bins_by_cp):
+        cross_bin = dict(zip(cps, combo))
+        hits = [select_matches(node, cross_bin) for _, node in clauses]
+        total += 1
+        if any(hit for (kind, _), hit in zip(clauses, hits) if kind == "illegal"):
+            illegal += 1
+        elif any(hits):
+            ignored += 1
+        for i, hit in enumerate(hits):
+            matched[i] += hit
+            for j in range(i + 1, len(clauses)):
+                if hit and hits[j]:
+                    pairs[(i, j)] = pairs.get((i, j), 0) + 1
+    if not cps:
+        total = 0
+    return {
+        "bins": total,
+        "ignored": ignored,
+        "illegal": illegal,
+        "effective": total - ignored - illegal,
+        "dead": [texts[i] for i in range(len(clauses)) if matched[i] == 0],
+        "overlaps": [(texts[i], texts[j], count) for (i, j), count in sorted(pairs.items())],
+    }
+
+def main(count=200, seed=1):
+    rng = random.Random(seed)
+    failures = 0
+    for n in range(count):
+        cp_groups, ignore_expr, illegal_exprs = random_cross(rng)
+        expected = brute_force(cp_groups, ignore_expr, illegal_exprs)
+        actual = effective_cross_bins(cp_groups, ignore_expr, illegal_exprs)
+        for key, value in expected.items():
+            if actual[key] != value:
+                failures += 1
+                print(f"FAIL cross {n}: {key} is {actual[key]}, brute force gives {value}")
+                break
+    print(f"{count} random crosses, {failures} mismatches")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main(*map(int, sys.argv[1:3])))
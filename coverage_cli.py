@@ -0,0 +1,135 @@
+import sys
+import argparse
+
+from coverage_engine import (
+    DEFAULT_SPEC_FILE, DEFAULT_SHEET_NAME, DEFAULT_OUTPUT_FILE, DEFAULT_MAX_BIN_LINES, SpecError,
+    load_spec, load_inputs, empty_inputs, build_user_inputs, selected_specs, render_coverage_to_file,
+    render_split_coverage, parse_cross_mode, duplicate_row_warnings
+)
+from spec_cache import load_spec_cached
+from spec_sources import parse_source, load_merged_spec
+from bin_estimator import DEFAULT_BIN_BUDGET, estimate_bins, check_bin_budget, check_cross_clauses, format_estimate
+
+# Headless entry point: spec workbook + saved inputs JSON -> combined coverage module
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate combined WiFi functional coverage without the GUI.")
+    parser.add_argument("spec", nargs="?", default=DEFAULT_SPEC_FILE, help="spec workbook (default: %(default)s)")
+    parser.add_argument("inputs", nargs="?", default=None, help="saved inputs JSON from 'Save Inputs to JSON'")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT_FILE, help="output .sv file (default: %(default)s)")
+    parser.add_argument("--sheet", default=DEFAULT_SHEET_NAME, help="sheet name (default: %(default)s)")
+    parser.add_argument("--reader", choices=("stream", "pandas"), default="stream",
+                        help="workbook reader: streaming openpyxl or pandas DataFrame (default: %(default)s)")
+    parser.add_argument("--cache-dir", default=None, help="parsed spec cache directory (default: .spec_cache next to the workbook)")
+    parser.add_argument("--no-cache", action="store_true", help="always re-parse the workbook")
+    parser.add_argument("--max-bin-lines", type=int, default=DEFAULT_MAX_BIN_LINES,
+                        help="most bin lines one Range split may emit (default: %(default)s)")
+    parser.add_argument("--estimate", action="store_true", help="print bin counts per coverpoint/cross and exit")
+    parser.add_argument("--bin-budget", type=int, default=DEFAULT_BIN_BUDGET,
+                        help="warn when a coverpoint or cross exceeds this many bins (default: %(default)s)")
+    parser.add_argument("--strict-budget", action="store_true", help="refuse to write output when the budget is exceeded")
+    parser.add_argument("--split", action="store_true",
+                        help="write each generation's covergroup to coverage_<gen>.sv and `include them from the output")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="processes rendering covergroups in parallel; 0 = one per CPU (default: %(default)s)")
+    parser.add_argument("--auto-ignore", action="store_true",
+                        help="add ignore_bins for cross bins the spec makes unreachable, for every cross")
+    parser.add_argument("--cross-mode", default=None, metavar="MODE",
+                        help="mode for every cross: full, pairwise, N-wise (covering-array bins), "
+                             "or pairwise crosses / N-wise crosses (one cross per N >= 2 coverpoints); "
+                             "3-wise and above over many wide coverpoints can take minutes")
+    parser.add_argument("--overlap", choices=("merge", "flag"), default="merge",
+                        help="overlapping per-value input rows: drop values an earlier per-value row bins, or only warn "
+                             "(default: %(default)s)")
+    parser.add_argument("--samples", default=None, metavar="JSON",
+                        help="observed values per parameter ({\"pkt_len\": [...]}) for quantile:N splits")
+    parser.add_argument("--source", action="append", default=[], metavar="BOOK[:SHEET]",
+                        help="additional spec workbook/sheet to merge (repeatable; loaded in parallel)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.source:
+            sources = [(args.spec, args.sheet)] + [parse_source(text, args.sheet) for text in args.source]
+            spec = load_merged_spec(sources, args.reader, not args.no_cache)
+        elif args.no_cache:
+            spec = load_spec(args.spec, args.sheet, args.reader)
+        else:
+            spec = load_spec_cached(args.spec, args.sheet, args.cache_dir, args.reader)
+    except SpecError as e:
+        print(f"Error: {e}")
+        return 1
+
+    for warning in duplicate_row_warnings(spec):
+        print(f"Warning: {warning}")
+
+    try:
+        inputs_data = load_inputs(args.inputs) if args.inputs else empty_inputs(spec)
+    except (OSError, ValueError) as e:
+        print(f"Error reading inputs file '{args.inputs}': {e}")
+        return 1
+
+    if args.auto_ignore:
+        for cross_entries in inputs_data["cross_coverage"].values():
+            for cross_entry in cross_entries:
+                cross_entry["auto_ignore"] = True
+
+    if args.cross_mode is not None:
+        try:
+            parse_cross_mode(args.cross_mode)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        for cross_entries in inputs_data["cross_coverage"].values():
+            for cross_entry in cross_entries:
+                cross_entry["cross_mode"] = args.cross_mode
+
+    samples = None
+    if args.samples:
+        # Imported here so NumPy is only needed when samples are given
+        from bin_strategies import load_samples
+        try:
+            samples = load_samples(args.samples)
+        except (OSError, ValueError) as e:
+            print(f"Error reading samples file '{args.samples}': {e}")
+            return 1
+
+    # Built once: the estimate and the output share it, so every diagnostic prints once
+    built = build_user_inputs(spec, inputs_data, args.max_bin_lines, samples, args.overlap)
+    user_inputs = built[0]
+    estimate = estimate_bins(spec, user_inputs, selected_specs(spec, inputs_data))
+    if args.estimate:
+        print(format_estimate(estimate))
+    for note in check_cross_clauses(estimate):
+        print(f"Note: {note}")
+    problems = check_bin_budget(estimate, args.bin_budget)
+    for problem in problems:
+        print(f"Warning: {problem}")
+    if args.estimate:
+        return 1 if problems and args.strict_budget else 0
+    if problems and args.strict_budget:
+        print("Error: bin budget exceeded; no output written.")
+        return 1
+
+    if args.split:
+        results, errors = render_split_coverage(spec, inputs_data, args.output, args.max_bin_lines,
+                                                samples, args.overlap, args.jobs, built)
+    else:
+        output_file, changed, errors = render_coverage_to_file(spec, inputs_data, args.output, args.max_bin_lines,
+                                                               samples, args.overlap, args.jobs, built)
+        results = None if output_file is None else [(output_file, changed)]
+    for param, rows in errors.items():
+        for i, message in sorted(rows.items()):
+            print(f"Warning: {param} input {i + 1}: {message}")
+
+    if results is None:
+        print("Error: coverage generation failed.")
+        return 1
+
+    for output_file, changed in results:
+        if changed:
+            print(f"Combined functional coverage saved to: {output_file}")
+        else:
+            print(f"Combined functional coverage unchanged, not rewritten: {output_file}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
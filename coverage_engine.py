@@ -0,0 +1,1570 @@
+import os
+import json
+import hashlib
+import tempfile
+from collections import deque
+from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+
+from interval_set import (
+    IntervalSet, OPEN_LOW, OPEN_HIGH, is_open_low, is_open_high, within_sentinels, overlapping_pairs
+)
+from bin_expressions import (
+    Binsof, And, Or, parse_select_expression, parse_condition, condition_to_select, render_select,
+    select_terms, select_coverpoints, select_to_conditions, apply_clause_operator
+)
+
+# Core coverage engine: spec loading, input parsing and SystemVerilog emission.
+# Nothing here imports tkinter, so regression scripts can drive it headless.
+
+DEFAULT_SPEC_FILE = "data_fc_2.xlsx"
+DEFAULT_SHEET_NAME = "Sheet1"
+DEFAULT_OUTPUT_FILE = "combined_wifi_functional_coverage.sv"
+MAX_INPUT_ROWS = 10
+# Most bin lines a single Range split may stream before it is refused
+DEFAULT_MAX_BIN_LINES = 10000
+
+# Raised when a spec workbook cannot be loaded or has the wrong layout
+class SpecError(Exception):
+    pass
+
+# Raised when a Range split would emit more bin lines than the configured budget
+class BinBudgetError(ValueError):
+    pass
+
+# True for empty Excel cells (None, NaN, pandas NA) without importing pandas
+def is_missing(value):
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:
+        return True
+
+# Parse allowed values from Excel cell strings
+def parse_allowed_values(s):
+    try:
+        if is_missing(s):
+            return []
+        s = str(s).strip()
+        parts = [part.strip() for part in s.split(",") if part.strip()]
+        result = []
+        for part in parts:
+            if part.startswith("[") and part.endswith("]") and ":" in part:
+                range_str = part[1:-1]
+                a, b = range_str.split(":")
+                a = int(a) if a != "$" else OPEN_LOW
+                b = int(b) if b != "$" else OPEN_HIGH
+                result.append(("range", (a, b)))
+            else:
+                try:
+                    value = int(part)
+                    result.append(("value", value))
+                except ValueError:
+                    continue
+        return result
+    except Exception as e:
+        print(f"Error parsing allowed values: {e}")
+        return []
+
+# Parse many allowed-value cells through a cache keyed by cell text. Spec sheets
+# repeat the same few cell texts ("0", "[0:7]", "20,40", blanks) thousands of
+# times, so each distinct cell is parsed once with parse_allowed_values and the
+# rest is dict lookups done in C. The gain is only as large as the repetition; a
+# run of all-distinct cells parses slightly slower than a per-cell loop. Cells
+# with the same content share one result list, so treat results as read-only.
+# Pass the same memo dict across calls to share the cache between rows.
+def parse_allowed_values_cached(cells, memo=None):
+    if memo is None:
+        memo = {}
+    keys = cells if isinstance(cells, list) else list(cells)
+    uniques = dict.fromkeys(keys)
+    # Only str and None cells are used as keys directly; anything else is keyed
+    # by str(cell), which is all parse_allowed_values looks at, so 1, 1.0 and
+    # True cannot collide.
+    for key in uniques:
+        if key.__class__ is not str and key is not None:
+            keys = list(map(str, keys))
+            uniques = dict.fromkeys(keys)
+            break
+    for key in uniques:
+        if key not in memo:
+            memo[key] = parse_allowed_values(key)
+    return list(map(memo.__getitem__, keys))
+
+# Shortest runs worth writing as [a:b] ("1,2" is shorter than "[1:2]") and the
+# fewest values worth a "with (item % s == r)" stride filter
+MIN_RUN_LENGTH = 3
+MIN_STRIDE_VALUES = 4
+
+# Runs of consecutive values in list order: 1,2,3,7,5,6 -> (1,3),(7,7),(5,6)
+def _value_runs(values):
+    runs = []
+    for v in values:
+        if runs and v == runs[-1][1] + 1:
+            runs[-1][1] = v
+        else:
+            runs.append([v, v])
+    return runs
+
+def _runs_text(runs):
+    parts = []
+    for a, b in runs:
+        if b - a + 1 >= MIN_RUN_LENGTH:
+            parts.append(f"[{a}:{b}]")
+        else:
+            parts.extend(map(str, range(a, b + 1)))
+    return ",".join(parts)
+
+# Step of a strictly increasing, non-negative arithmetic progression, else None
+def _value_stride(values):
+    if len(values) < MIN_STRIDE_VALUES or values[0] < 0:
+        return None
+    step = values[1] - values[0]
+    if step <= 1 or any(b - a != step for a, b in zip(values, values[1:])):
+        return None
+    return step
+
+# Values a compact list denotes, in order: "{[1:3],7}" or "{[0:14]} with (item % 2 == 0)"
+def expand_value_list(text):
+    body, _, condition = text.partition(" with ")
+    values = []
+    for part in body.strip()[1:-1].split(","):
+        part = part.strip()
+        if part.startswith("["):
+            a, b = part[1:-1].split(":")
+            values.extend(range(int(a), int(b) + 1))
+        else:
+            values.append(int(part))
+    if condition:
+        step, rest = condition.strip()[1:-1].replace("item %", "").split("==")
+        step, rest = int(step), int(rest)
+        values = [v for v in values if v % step == rest]
+    return values
+
+# Brace list for a bin's values with consecutive runs collapsed to [a:b], or a
+# whole progression written as a range with a stride filter. Fixed-count bins
+# (ordered=True) distribute values in list order and keep duplicates, so only
+# runs that are already consecutive in order are collapsed and nothing is
+# sorted; otherwise the list is a set and is sorted and deduplicated first.
+# The result is expanded again and compared before use; any mismatch falls
+# back to the literal list. allow_stride=False suits "intersect {...}", which
+# takes no with clause.
+def format_value_list(values, ordered=False, allow_stride=True):
+    literal = "{" + ",".join(map(str, values)) + "}"
+    expected = list(values) if ordered else sorted(set(values))
+    stride = _value_stride(expected) if allow_stride else None
+    if stride:
+        text = f"{{[{expected[0]}:{expected[-1]}]}} with (item % {stride} == {expected[0] % stride})"
+    else:
+        text = "{" + _runs_text(_value_runs(expected)) + "}"
+    try:
+        if expand_value_list(text) != expected:
+            return literal
+    except ValueError:
+        return literal
+    return text if len(text) < len(literal) else literal
+
+# Display form of "$" bounds: open low bounds have always printed as "inf"
+def format_low_bound(bound):
+    return "inf" if is_open_low(bound) else str(bound)
+
+def format_high_bound(bound):
+    return "$" if is_open_high(bound) else str(bound)
+
+# Parse user input (single range or list of values)
+def parse_user_input(s):
+    try:
+        s = s.strip()
+        if not s:
+            return None
+        if s.startswith("[") and s.endswith("]") and ":" in s:
+            range_str = s[1:-1]
+            try:
+                a, b = range_str.split(":")
+                a = int(a) if a != "$" else OPEN_LOW
+                b = int(b) if b != "$" else OPEN_HIGH
+                return {"type": "range", "range": (a, b)}
+            except ValueError:
+                return None
+        else:
+            try:
+                values = [int(v.strip()) for v in s.split(",") if v.strip()]
+                if values:
+                    return {"type": "list", "values": values}
+                return None
+            except ValueError:
+                return None
+    except Exception as e:
+        print(f"Error parsing user input: {e}")
+        return None
+
+# Parse bins input - return None if empty or invalid
+def parse_bins_input(s):
+    try:
+        s = s.strip()
+        if not s:
+            return None
+        try:
+            bins = int(s)
+            if bins <= 0:
+                return None
+            return bins
+        except ValueError:
+            return None
+    except Exception as e:
+        print(f"Error parsing bins input: {e}")
+        return None
+
+# Parse range input - return None if empty or invalid
+def parse_range_input(s):
+    try:
+        s = s.strip()
+        if not s:
+            return None
+        try:
+            range_val = int(s)
+            if range_val <= 0:
+                return None
+            return range_val
+        except ValueError:
+            return None
+    except Exception as e:
+        print(f"Error parsing range input: {e}")
+        return None
+
+# Parse the Range field as a split request: "8" (or "equal:8") splits into
+# equal chunks of 8 values; "log:N", "quantile:N" and "pow2" pick one of the
+# non-uniform strategies in bin_strategies. Returns {"strategy", "count"} or None.
+def parse_split_input(s):
+    try:
+        s = s.strip().lower()
+        if not s:
+            return None
+        strategy, sep, count_text = s.partition(":")
+        if not sep:
+            if strategy == "pow2":
+                return {"strategy": "pow2", "count": None}
+            strategy, count_text = "equal", s
+        if strategy not in ("equal", "log", "quantile"):
+            return None
+        count = parse_range_input(count_text)
+        if count is None:
+            return None
+        return {"strategy": strategy, "count": count}
+    except Exception as e:
+        print(f"Error parsing range input: {e}")
+        return None
+
+# Parse ignore bins input into [(coverpoint, [values...]), ...] clause lists, one
+# per || term. The expression is parsed by bin_expressions; terms that are not a
+# plain binsof-intersect chain (negation, nested ||) are left out of this list
+# but still emitted from the parsed expression.
+def parse_ignore_bins(s):
+    try:
+        return select_to_conditions(parse_select_expression(s.strip()))
+    except Exception as e:
+        print(f"Error parsing ignore bins: {e}")
+        return []
+
+# Generate automatic bins based on range division
+def generate_automatic_bins(parsed_input, range_div, bin_name_prefix):
+    try:
+        if parsed_input["type"] != "range":
+            return []
+        
+        min_val, max_val = parsed_input["range"]
+        if is_open_low(min_val) or is_open_high(max_val):
+            return []
+        
+        bins = []
+        current = min_val
+        bin_num = 1
+        
+        while current <= max_val:
+            next_val = min(current + range_div - 1, max_val)
+            bin_name = f"{bin_name_prefix}_v{current}_{next_val}"
+            bins.append({
+                "cross_name": bin_name,
+                "range": (current, next_val)
+            })
+            current = next_val + 1
+            bin_num += 1
+        
+        return bins
+    except Exception as e:
+        print(f"Error generating automatic bins: {e}")
+        return []
+
+# Parse illegal bins input
+def parse_illegal_bins(s):
+    try:
+        s = s.strip()
+        if not s:
+            return []
+        conditions = [cond.strip() for cond in s.split(";") if cond.strip()]
+        return conditions
+    except Exception as e:
+        print(f"Error parsing illegal bins: {e}")
+        return []
+
+# Get default bin cross_name with updated format
+def get_default_bin_name(parsed, param_name):
+    try:
+        if parsed["type"] == "range":
+            a, b = parsed["range"]
+            a_str = format_low_bound(a)
+            b_str = format_high_bound(b)
+            return f"{param_name}_v{a_str}_{b_str}"
+        elif parsed["type"] == "list":
+            values = parsed["values"]
+            if len(values) == 1:
+                return f"{param_name}_v{values[0]}_{values[0]}"
+            else:
+                min_val = min(values)
+                max_val = max(values)
+                return f"{param_name}_v{min_val}_{max_val}"
+    except Exception as e:
+        print(f"Error getting default bin cross_name: {e}")
+        return f"{param_name}_default_bin"
+
+# Union of a parameter's allowed values across every generation
+def get_combined_allowed_set(param, allowed_values):
+    combined = IntervalSet()
+    for gen in allowed_values:
+        combined = combined | IntervalSet.from_items(allowed_values[gen].get(param, []))
+    return combined
+
+# Get combined allowed range for a parameter (bounds of the union of all ranges/values)
+def get_combined_allowed_range(param, allowed_values):
+    try:
+        combined = get_combined_allowed_set(param, allowed_values)
+        if not combined:
+            return None, None
+        return combined.min, combined.max
+    except Exception as e:
+        print(f"Error getting combined allowed range: {e}")
+        return None, None
+
+# Get maximum allowed range or values for feedback display
+def get_max_allowed_range(param, allowed_values):
+    try:
+        ranges = []
+        values = []
+        for gen in allowed_values:
+            for item_type, item in allowed_values[gen].get(param, []):
+                if item_type == "range":
+                    ranges.append(item)
+                elif item_type == "value":
+                    values.append(item)
+        if ranges:
+            min_val = min(a for a, _ in ranges if not is_open_low(a))
+            max_val = max(b for _, b in ranges if not is_open_high(b))
+            min_str = format_low_bound(min_val)
+            max_str = format_high_bound(max_val)
+            return f"[{min_str}:{max_str}]"
+        elif values:
+            return ",".join(map(str, sorted(values)))
+        return "No valid data"
+    except Exception as e:
+        print(f"Error getting max allowed range: {e}")
+        return "Error getting range"
+
+# Check if input is within the combined allowed range
+def is_input_within_combined_range(parsed, param, allowed_values):
+    try:
+        overall_min, overall_max = get_combined_allowed_range(param, allowed_values)
+        return is_input_within_bounds(parsed, overall_min, overall_max)
+    except Exception as e:
+        print(f"Error checking if input is within combined range: {e}")
+        return False
+
+# Every typed bound of a parsed input is within the "$" sentinels. An input past
+# them is illegal for every generation, also as a reversed range such as
+# [5:-99999999999999999999] whose ends would otherwise each pass a bound check.
+def _bounds_within_sentinels(parsed):
+    values = parsed["range"] if parsed["type"] == "range" else parsed["values"]
+    return all(within_sentinels(v) for v in values)
+
+def is_input_within_bounds(parsed, overall_min, overall_max):
+    if overall_min is None or overall_max is None or not _bounds_within_sentinels(parsed):
+        return False
+    
+    if parsed["type"] == "range":
+        min_val, max_val = parsed["range"]
+        return overall_min <= min_val and max_val <= overall_max
+    elif parsed["type"] == "list":
+        values = parsed["values"]
+        return all(overall_min <= v <= overall_max for v in values)
+    
+    return False
+
+# Per-parameter lookups built once per loaded spec: per-generation and union
+# interval sets, combined bounds and the GUI/error display strings. Everything
+# the validation path and the GUI labels ask for is then a dict lookup.
+class DomainIndex:
+    __slots__ = ("generation_sets", "union_sets", "bounds", "max_allowed_text", "combined_text")
+
+    def __init__(self, parameters, generations, allowed_values):
+        self.generation_sets = {}
+        self.union_sets = {}
+        self.bounds = {}
+        self.max_allowed_text = {}
+        self.combined_text = {}
+        for param in parameters:
+            gen_sets = {gen: IntervalSet.from_items(allowed_values[gen].get(param, [])) for gen in generations}
+            union = IntervalSet(interval for gen_set in gen_sets.values() for interval in gen_set)
+            self.generation_sets[param] = gen_sets
+            self.union_sets[param] = union
+            self.bounds[param] = (union.min, union.max) if union else (None, None)
+            self.max_allowed_text[param] = get_max_allowed_range(param, allowed_values)
+            if union:
+                min_str = format_low_bound(union.min)
+                max_str = format_high_bound(union.max)
+                self.combined_text[param] = f"Combined range: [{min_str}:{max_str}]"
+            else:
+                self.combined_text[param] = "No valid range found"
+
+    def combined_range(self, param):
+        return self.bounds.get(param, (None, None))
+
+    def allowed_set(self, param, gen=None):
+        if gen is None:
+            return self.union_sets.get(param, IntervalSet())
+        return self.generation_sets.get(param, {}).get(gen, IntervalSet())
+
+    def is_within_combined_range(self, parsed, param):
+        return is_input_within_bounds(parsed, *self.combined_range(param))
+
+    def is_allowed_for_generation(self, parsed, param, gen):
+        return is_input_allowed_for_generation(parsed, self.allowed_set(param, gen))
+
+    def max_allowed_range(self, param):
+        return self.max_allowed_text.get(param, "No valid data")
+
+    def combined_range_text(self, param):
+        return self.combined_text.get(param, "No valid range found")
+
+# Domain index for a spec, built on first use and kept on the spec dict. Loading
+# or merging a spec creates a new dict, so a reload always gets a fresh index.
+def get_domain_index(spec):
+    index = spec.get("domain_index")
+    if index is None:
+        index = spec["domain_index"] = DomainIndex(spec["parameters"], spec["generations"], spec["allowed_values"])
+    return index
+
+# Check if input is allowed for a specific generation: every value it covers must
+# lie in the generation's allowed set (allowed may be an item list or IntervalSet)
+def is_input_allowed_for_generation(parsed, allowed):
+    try:
+        if not _bounds_within_sentinels(parsed):
+            return False
+        allowed_set = allowed if isinstance(allowed, IntervalSet) else IntervalSet.from_items(allowed)
+        if parsed["type"] == "range":
+            min_val, max_val = parsed["range"]
+            return allowed_set.contains_range(min_val, max_val)
+        elif parsed["type"] == "list":
+            return allowed_set.contains_all(parsed["values"])
+        
+        return False
+    except Exception as e:
+        print(f"Error checking if input is allowed for generation: {e}")
+        return False
+
+# Number of [a:b] chunks a Range split of a finite range produces
+def count_range_chunks(min_val, max_val, range_div):
+    if max_val < min_val:
+        return 0
+    return (max_val - min_val) // range_div + 1
+
+# Whole chunks of a Range split that one array bin "bins x[N] = {[a:b]}" can
+# hold, or 0 to write one line per chunk. An array bin spreads its values evenly
+# over its N bins, so it matches the per-chunk layout when there is no Bins
+# count or each chunk divides evenly into bins_count bins; fewer than two whole
+# chunks gain nothing from it.
+def _range_array_chunks(min_val, max_val, bins_count, range_div):
+    if bins_count is not None and bins_count > 1 and range_div % bins_count:
+        return 0
+    full = (max_val - min_val + 1) // range_div
+    return full if full > 1 else 0
+
+# Number of bin lines a Range split emits: the array bin plus a remainder bin
+# for a shorter last chunk, or one line per chunk
+def count_range_divided_lines(min_val, max_val, bins_count, range_div):
+    full = _range_array_chunks(min_val, max_val, bins_count, range_div)
+    if not full:
+        return count_range_chunks(min_val, max_val, range_div)
+    return 1 if full * range_div == max_val - min_val + 1 else 2
+
+# [a:b] chunks of range_div values covering [min_val:max_val], the last one shorter
+def iter_range_chunks(min_val, max_val, range_div):
+    current = min_val
+    while current <= max_val:
+        next_val = min(current + range_div - 1, max_val)
+        yield current, next_val
+        current = next_val + 1
+
+# Lazily yield the bin lines for a Range split of a finite [min_val:max_val].
+# Every chunk is one bin (bins_count bins when set). The whole chunks go into one
+# array bin named bin_name (or {param}_v{a}_{b}) and a shorter last chunk follows
+# as {bin_name}_{N}, continuing the array's numbering; splits the array cannot
+# express are written one line per chunk, named like iter_chunked_bins. Refuses
+# up front if the lines exceed max_lines.
+def iter_range_divided_bins(min_val, max_val, bins_count, range_div, bin_name, param, max_lines=DEFAULT_MAX_BIN_LINES):
+    lines = count_range_divided_lines(min_val, max_val, bins_count, range_div)
+    if max_lines is not None and lines > max_lines:
+        raise BinBudgetError(f"Range split of [{min_val}:{max_val}] by {range_div} needs {lines} bin lines (limit {max_lines})")
+    full = _range_array_chunks(min_val, max_val, bins_count, range_div)
+    if not full:
+        yield from iter_chunked_bins(iter_range_chunks(min_val, max_val, range_div), bins_count, bin_name, param)
+        return
+    per_chunk = bins_count if bins_count is not None and bins_count > 1 else 1
+    end = min_val + full * range_div - 1
+    yield f"        bins {bin_name or f'{param}_v{min_val}_{end}'}[{full * per_chunk}] = {{[{min_val}:{end}]}};"
+    if end < max_val:
+        yield _chunk_bin_line(f"{bin_name}_{full}" if bin_name else f"{param}_v{end + 1}_{max_val}",
+                              end + 1, max_val, bins_count)
+
+# Re-iterable handle on a Range split's bin lines. The emitter walks it once per
+# selected generation, regenerating the lines each time instead of keeping them.
+class RangeDividedBins:
+    __slots__ = ("args",)
+
+    def __init__(self, min_val, max_val, bins_count, range_div, bin_name, param, max_lines=DEFAULT_MAX_BIN_LINES):
+        self.args = (min_val, max_val, bins_count, range_div, bin_name, param, max_lines)
+
+    def __iter__(self):
+        return iter_range_divided_bins(*self.args)
+
+# Bin lines for an explicit chunk list from a log/pow2/quantile split. Each chunk
+# is one bin (or bins_count bins) rather than one bin per value, which is the
+# point of a non-uniform split; a user bin name is numbered per chunk.
+def iter_chunked_bins(chunks, bins_count, bin_name, param):
+    for k, (a, b) in enumerate(chunks):
+        yield _chunk_bin_line(f"{bin_name}_{k}" if bin_name else f"{param}_v{a}_{b}", a, b, bins_count)
+
+# One chunk as one bin, or as bins_count bins
+def _chunk_bin_line(name, a, b, bins_count):
+    if bins_count is not None and bins_count > 1:
+        return f"        bins {name}[{bins_count}] = {{[{a}:{b}]}};"
+    return f"        bins {name} = {{[{a}:{b}]}};"
+
+class ChunkedBins:
+    __slots__ = ("args",)
+
+    def __init__(self, chunks, bins_count, bin_name, param):
+        self.args = (chunks, bins_count, bin_name, param)
+
+    def __iter__(self):
+        return iter_chunked_bins(*self.args)
+
+# Lines of a custom bin entry: a bin_code string, RangeDividedBins or ChunkedBins
+def iter_bin_code_lines(bin_code):
+    if isinstance(bin_code, str):
+        yield bin_code
+    else:
+        yield from bin_code
+
+def generate_systemverilog_bins(parsed, bins_count, range_div, bin_name, param):
+    try:
+        if parsed["type"] == "range":
+            min_val, max_val = parsed["range"]
+            min_str = format_low_bound(min_val)
+            max_str = format_high_bound(max_val)
+            if range_div is not None and (is_open_low(min_val) or is_open_high(max_val)):
+                # An open-ended range cannot be split into finite chunks
+                print(f"Warning: Range division ignored for open-ended range [{min_str}:{max_str}] of {param}")
+                range_div = None
+            if range_div is not None:
+                return "\n".join(iter_range_divided_bins(min_val, max_val, bins_count, range_div, bin_name, param))
+            else:
+                if not bin_name:
+                    bin_name = f"{param}_v{min_str}_{max_str}"
+                if bins_count is not None and bins_count > 1:
+                    return f"        bins {bin_name}[{bins_count}] = {{[{min_str}:{max_str}]}};"
+                else:
+                    return f"        bins {bin_name}[] = {{[{min_str}:{max_str}]}};"
+        elif parsed["type"] == "list":
+            values = parsed["values"]
+            if len(values) == 1:
+                v = values[0]
+                bin_name_v = f"{param}_v{v}_{v}" if not bin_name else bin_name
+                if bins_count is not None and bins_count > 1:
+                    return f"        bins {bin_name_v}[{bins_count}] = {{{v}}};"
+                else:
+                    return f"        bins {bin_name_v}[] = {{{v}}};"
+            else:
+                bin_name_v = f"{param}_v{min(values)}_{max(values)}" if not bin_name else bin_name
+                if bins_count is not None and bins_count > 1:
+                    return f"        bins {bin_name_v}[{bins_count}] = {format_value_list(values, ordered=True)};"
+                else:
+                    return f"        bins {bin_name_v}[] = {format_value_list(values)};"
+    except Exception as e:
+        print(f"Error generating SystemVerilog bins: {e}")
+        return ""
+
+# Brace list for an intersect clause; integer lists are compacted into runs
+def _intersect_values(values):
+    return format_value_list(values, allow_stride=False)
+
+# Select AST for legacy [(coverpoint, [values...]), ...] clause lists
+def _conditions_to_select(conditions):
+    terms = []
+    for cond in conditions:
+        clauses = tuple(Binsof(cp, tuple(parse_allowed_values(",".join(vals)))) for cp, vals in cond)
+        terms.append(clauses[0] if len(clauses) == 1 else And(clauses))
+    return terms[0] if len(terms) == 1 else Or(tuple(terms))
+
+# Select AST for one illegal_bins condition ("mcs=3 && chan_bw != 20") of a cross
+def illegal_condition_select(condition, coverpoints):
+    return condition_to_select(parse_condition(condition), coverpoints)
+
+# Cross modes of the "cross_mode" field, as (mode, strength):
+#   full (or empty)                    - one cross over every coverpoint
+#   pairwise, N-wise                   - a t-wise covering array of the coverpoints'
+#                                        bins, emitted as explicit cross bins
+#   pairwise crosses, N-wise crosses   - one full cross per N coverpoints, so N
+#                                        is at least 2 (a cross needs two items)
+def parse_cross_mode(text):
+    words = str(text or "").strip().lower().split()
+    if not words or words == ["full"]:
+        return "full", None
+    strength = None
+    if words[0] == "pairwise":
+        strength = 2
+    elif words[0].endswith("-wise") and words[0][:-5].isdigit():
+        strength = int(words[0][:-5])
+    if not strength or len(words) > 2 or words[1:] not in ([], ["crosses"]):
+        raise ValueError(f"unknown cross mode '{text.strip()}' "
+                         "(use full, pairwise, N-wise, pairwise crosses or N-wise crosses)")
+    if len(words) == 2 and strength < 2:
+        raise ValueError(f"cross mode '{text.strip()}' would cross single coverpoints (use 2-wise crosses or more)")
+    return ("crosses" if len(words) == 2 else "tuples"), strength
+
+# Select AST for one covering-array tuple, {coverpoint: IntervalSet of its bin}
+def _tuple_select(cross_bin, coverpoints):
+    clauses = tuple(Binsof(cp, tuple(cross_bin[cp].to_items())) for cp in coverpoints)
+    return clauses[0] if len(clauses) == 1 else And(clauses)
+
+# Generate cross coverage code with illegal and ignore bins. illegal_bins is a
+# list of condition strings; ignore_bins is a select AST from
+# parse_select_expression (or legacy clause lists from parse_ignore_bins). Each
+# top-level || term of the ignore expression is its own ignore_bins
+# {cross}_ignore_{k}, numbered like the "ignore k" clauses the estimator reports.
+# tuples, for a covering-array cross, lists the cross bins to keep as
+# {coverpoint: IntervalSet} dicts: each becomes a named bin and every other
+# cross bin is ignored.
+def generate_cross_coverage_code(cross_name, coverpoints, illegal_bins, ignore_bins, tuples=None):
+    try:
+        if isinstance(ignore_bins, list):
+            ignore_bins = _conditions_to_select(ignore_bins) if ignore_bins else None
+        tuple_lines = []
+        if tuples:
+            selects = [render_select(_tuple_select(cross_bin, coverpoints), True, _intersect_values)
+                       for cross_bin in tuples]
+            tuple_lines = [f"        bins {cross_name}_t{k} = {select};" for k, select in enumerate(selects, 1)]
+            tuple_lines.append(f"        ignore_bins {cross_name}_untested = !(")
+            tuple_lines.append(" ||\n".join(f"            ({select})" for select in selects))
+            tuple_lines.append("        );")
+        illegal_lines = []
+        for k, condition in enumerate(illegal_bins, 1):
+            try:
+                select = illegal_condition_select(condition, coverpoints)
+            except ValueError as e:
+                print(f"Error parsing illegal bins '{condition}' of {cross_name}: {e}")
+                continue
+            illegal_lines.append(f"        illegal_bins {cross_name}_illegal_{k} = "
+                                 f"{render_select(select, True, _intersect_values)};")
+
+        coverpoint_code = f"    {cross_name}: cross {','.join(coverpoints)}"
+        if tuple_lines or illegal_lines or ignore_bins:
+            coverpoint_code += " {\n"
+            if tuple_lines:
+                coverpoint_code += "\n".join(tuple_lines) + "\n"
+            if illegal_lines:
+                coverpoint_code += "\n".join(illegal_lines) + "\n"
+            if ignore_bins:
+                ignore_lines = [f"        ignore_bins {cross_name}_ignore_{k} = "
+                                f"{render_select(term, False, _intersect_values)};"
+                                for k, term in enumerate(select_terms(ignore_bins), 1)]
+                coverpoint_code += "\n".join(ignore_lines) + "\n"
+            coverpoint_code += "    }"
+        else:
+            coverpoint_code += ";"
+        return coverpoint_code
+    except Exception as e:
+        print(f"Error generating cross coverage code: {e}")
+        return ""
+
+# The combined module is emitted as a stream of text fragments, so it can go
+# straight to a file (write_output) without ever being held whole in memory.
+
+def _gen_name(gen):
+    return gen.lower().replace(' ', '_')
+
+# Module header: variable, clock and event declarations
+def iter_module_header(parameters, generations):
+    yield "module rxpktgen_fcov;\n"
+    yield "// Variables\n"
+
+    # Declare only parameters from Excel sheet
+    for param in parameters:
+        yield f"integer {param.lower()};\n"
+
+    yield "\n// Clock signal\n"
+    yield "logic clk;\n"
+
+    yield "\n// Events\n"
+    yield "event trigger_cov;\n"
+    for gen in generations:
+        yield f"event trigger_{_gen_name(gen)}_cov;\n"
+
+    yield "\n// Combined Coverage Groups\n"
+
+# One generation's covergroup and its instantiation
+def iter_covergroup(gen, parameters, allowed_values, user_inputs):
+    covergroup_name = f"pkt_{_gen_name(gen)}_cov"
+    yield f"covergroup {covergroup_name} @trigger_{_gen_name(gen)}_cov;\n"
+
+    # Always include pkt_type coverpoint
+    if "pkt_type" in allowed_values[gen]:
+        coverpoint_name = "cov_pkt_type"
+        yield f"    {coverpoint_name}: coverpoint pkt_type {{\n"
+        for item_type, item in allowed_values[gen]["pkt_type"]:
+            if item_type == "value":
+                yield f"        bins pkt_type_tb = {{{item}}};\n"
+            elif item_type == "range":
+                min_val, max_val = item
+                min_str = format_low_bound(min_val)
+                max_str = format_high_bound(max_val)
+                yield f"        bins pkt_type_tb = {{[{min_str}:{max_str}]}};\n"
+        yield "    }\n"
+
+    for param in parameters:
+        if param == "pkt_type":
+            continue  # Skip pkt_type as it's already handled
+        if param in user_inputs and user_inputs[param]['use_default']:
+            if param in allowed_values[gen] and allowed_values[gen][param]:
+                coverpoint_name = f"cov_{param.lower()}"
+                yield f"    {coverpoint_name}: coverpoint {param.lower()} {{\n"
+                for item_type, item in allowed_values[gen][param]:
+                    if item_type == "range":
+                        min_val, max_val = item
+                        min_str = format_low_bound(min_val)
+                        max_str = format_high_bound(max_val)
+                        bin_name = f"{param.lower()}_v{min_str}_{max_str}"
+                        yield f"        bins {bin_name}[] = {{[{min_str}:{max_str}]}};\n"
+                    elif item_type == "value":
+                        bin_name = f"{param.lower()}_v{item}_{item}"
+                        yield f"        bins {bin_name}[] = {{{item}}};\n"
+                yield "    }\n"
+        else:
+            if param in user_inputs and user_inputs[param]['custom_bins']:
+                coverpoint_name = f"cov_{param.lower()}"
+                yield f"    {coverpoint_name}: coverpoint {param.lower()} {{\n"
+                for bin_code in user_inputs[param]['custom_bins']:
+                    for line in iter_bin_code_lines(bin_code):
+                        yield line + "\n"
+                yield "    }\n"
+
+    if gen in user_inputs and 'cross_coverage' in user_inputs[gen]:
+        for cross_code in user_inputs[gen]['cross_coverage']:
+            yield cross_code + "\n"
+
+    yield f"endgroup: {covergroup_name}\n"
+    yield f"{covergroup_name} = new();\n\n"
+
+# Tasks and endmodule
+def iter_module_footer(parameters, generations, pkt_types):
+    yield "// Tasks\n"
+    yield "task run(integer dpi);\n"
+    yield "    cover_rxpktgen(dpi);\n"
+    yield "    -> trigger_cov;\n"
+
+    # Generate if statements based on pkt_type values from Excel
+    for gen in generations:
+        pkt_type_value = pkt_types.get(gen)
+        if not is_missing(pkt_type_value):
+            try:
+                pkt_type = int(pkt_type_value)
+                yield f"    if (pkt_type == {pkt_type}) -> trigger_{_gen_name(gen)}_cov;\n"
+            except (ValueError, TypeError):
+                print(f"Warning: Invalid pkt_type value for {gen}: {pkt_type_value}")
+    yield "endtask: run\n\n"
+
+    # Generate cover_rxpktgen task with parameters from Excel (excluding pkt_type)
+    task_params = [param.lower() for param in parameters if param != "pkt_type"]
+    yield "task cover_rxpktgen(integer dpi);\n"
+    yield f"    doi_rxpktgen_GetPktFuncCov(dpi, {', '.join(task_params)});\n"
+    yield "endtask: cover_rxpktgen\n\n"
+
+    yield "endmodule\n"
+
+# Covergroups are independent, so with workers > 1 each one is rendered in a
+# process pool. Workers receive the shared inputs once through the pool
+# initializer and only a generation name per task; results are taken back in
+# spec order with a bounded window of tasks in flight, so the output is
+# byte-identical to the serial path and only a few covergroups are held at once.
+_worker_state = {}
+
+def _init_covergroup_worker(parameters, allowed_values, user_inputs):
+    _worker_state["args"] = (parameters, allowed_values, user_inputs)
+
+def _render_covergroup(gen):
+    return "".join(iter_covergroup(gen, *_worker_state["args"]))
+
+def _iter_covergroups_parallel(gens, parameters, allowed_values, user_inputs, workers):
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_covergroup_worker,
+                             initargs=(parameters, allowed_values, user_inputs)) as pool:
+        pending = deque()
+        for gen in gens:
+            pending.append(pool.submit(_render_covergroup, gen))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+# Stream the combined module definition for all selected WiFi specifications.
+# workers=0 uses one process per CPU; None or 1 renders serially.
+def iter_combined_module(parameters, generations, allowed_values, wifi_specs, user_inputs, pkt_types, workers=None):
+    selected_specs = [spec for spec, selected in wifi_specs.items() if selected]
+    gens = [gen for gen in generations if gen in selected_specs]
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    yield from iter_module_header(parameters, generations)
+    if workers and workers > 1 and len(gens) > 1:
+        yield from _iter_covergroups_parallel(gens, parameters, allowed_values, user_inputs, min(workers, len(gens)))
+    else:
+        for gen in gens:
+            yield from iter_covergroup(gen, parameters, allowed_values, user_inputs)
+    yield from iter_module_footer(parameters, generations, pkt_types)
+
+# Split-output mode: each selected generation's covergroup goes to its own file
+# next to the top-level output, and the top-level module `includes them. Every
+# file goes through write_output, so only files whose content changed are
+# rewritten and an edit to one generation recompiles just that file.
+
+def split_output_path(output_file, gen):
+    return os.path.join(os.path.dirname(output_file), f"coverage_{_gen_name(gen)}.sv")
+
+# Top-level module for split output: header, one `include per covergroup file, tasks
+def iter_split_top_module(parameters, generations, wifi_specs, pkt_types, output_file):
+    yield from iter_module_header(parameters, generations)
+    for gen in generations:
+        if wifi_specs.get(gen):
+            yield f'`include "{os.path.basename(split_output_path(output_file, gen))}"\n'
+    yield from iter_module_footer(parameters, generations, pkt_types)
+
+# Write the per-generation files and the top-level module. Returns a list of
+# (path, changed) with the generation files first, in spec order.
+def write_split_output(parameters, generations, allowed_values, wifi_specs, user_inputs, pkt_types,
+                       output_file=DEFAULT_OUTPUT_FILE, workers=None):
+    gens = [gen for gen in generations if wifi_specs.get(gen)]
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers and workers > 1 and len(gens) > 1:
+        covergroups = _iter_covergroups_parallel(gens, parameters, allowed_values, user_inputs, min(workers, len(gens)))
+    else:
+        covergroups = (iter_covergroup(gen, parameters, allowed_values, user_inputs) for gen in gens)
+    results = [write_output(covergroup, split_output_path(output_file, gen)) for gen, covergroup in zip(gens, covergroups)]
+    results.append(write_output(iter_split_top_module(parameters, generations, wifi_specs, pkt_types, output_file),
+                                output_file))
+    return results
+
+# Generate combined module definition for all WiFi specifications as one string
+def generate_combined_module_definition(parameters, generations, allowed_values, wifi_specs, user_inputs, pkt_types):
+    try:
+        return "".join(iter_combined_module(parameters, generations, allowed_values, wifi_specs, user_inputs, pkt_types))
+    except Exception as e:
+        print(f"Error generating combined module definition: {e}")
+        return ""
+
+# Unwrap numpy scalars so spec dicts stay plain Python (JSON-serialisable)
+def to_python_scalar(value):
+    return value.item() if hasattr(value, "item") else value
+
+# Load the wide-format spec sheet (Parameters | Bins | <gen>...) into plain dicts.
+# The default streaming reader never builds a DataFrame; reader="pandas" keeps
+# the original read_excel path.
+def load_spec(excel_file=DEFAULT_SPEC_FILE, sheet_name=DEFAULT_SHEET_NAME, reader="stream"):
+    if not os.path.exists(excel_file):
+        raise SpecError(f"Excel file '{excel_file}' not found (current directory: {os.getcwd()}).")
+    if reader == "stream":
+        return load_spec_streaming(excel_file, sheet_name)
+    if reader != "pandas":
+        raise SpecError(f"Unknown spec reader '{reader}' (expected 'stream' or 'pandas').")
+
+    pd = _import_pandas()
+    try:
+        df = pd.read_excel(excel_file, sheet_name=sheet_name, engine='openpyxl')
+    except Exception as e:
+        raise SpecError(f"Error reading Excel file '{excel_file}': {e}")
+
+    if is_long_format(df.columns):
+        return build_spec_from_long_df(df)
+    return build_spec_from_rows(df.columns.tolist(), df.itertuples(index=False, name=None))
+
+def _import_pandas():
+    try:
+        import pandas as pd
+    except ImportError:
+        raise SpecError("pandas is not installed. Please install it using: pip install pandas")
+    return pd
+
+# Yield the sheet's rows as value tuples from an openpyxl read-only workbook.
+# Rows are parsed as they arrive, so memory stays proportional to one row.
+def iter_sheet_rows(excel_file, sheet_name=DEFAULT_SHEET_NAME):
+    try:
+        import openpyxl
+    except ImportError:
+        raise SpecError("openpyxl is not installed. Please install it using: pip install openpyxl")
+
+    try:
+        workbook = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
+    except Exception as e:
+        raise SpecError(f"Error reading Excel file '{excel_file}': {e}")
+    try:
+        if sheet_name not in workbook.sheetnames:
+            raise SpecError(f"Sheet '{sheet_name}' not found in '{excel_file}'. Available sheets: {workbook.sheetnames}")
+        for row in workbook[sheet_name].iter_rows(values_only=True):
+            yield row
+    finally:
+        workbook.close()
+
+# Stream a spec sheet straight into build_spec_from_rows (or, for a long-format
+# sheet, build_spec_from_long_rows) without pandas or holding the sheet in memory
+def load_spec_streaming(excel_file, sheet_name=DEFAULT_SHEET_NAME):
+    rows = iter_sheet_rows(excel_file, sheet_name)
+    header = next(rows, None)
+    if header is None:
+        raise SpecError("Excel file is empty.")
+    if is_long_format(header):
+        return build_spec_from_long_rows(header, rows)
+    return build_spec_from_rows(header, rows)
+
+# Parse a spec's "Bins" cell into an integer default bin count or None
+def parse_default_bins(param, bins_value):
+    if is_missing(bins_value):
+        return None
+    try:
+        return int(bins_value)
+    except (ValueError, TypeError):
+        print(f"Warning: Invalid bins value for parameter '{param}': {bins_value}. Using default value None.")
+        return None
+
+# Build the spec dicts from a header row and an iterable of data rows in a single
+# pass. Each row is parsed once, indexed by parameter, so loading is linear in the
+# sheet size. Repeated parameter rows keep the first occurrence and are reported
+# in spec["duplicate_rows"] as {param: [sheet row numbers]}.
+def build_spec_from_rows(header, rows):
+    header = list(header)
+    if "Parameters" not in header:
+        raise SpecError(f"'Parameters' column not found in Excel file, and no long-format "
+                        f"{list(LONG_FORMAT_COLUMNS)} columns either. Available columns: {header}")
+    if len(header) < 3:
+        raise SpecError("Excel file must have at least 3 columns (Parameters, Bins, and at least one covergroup).")
+
+    param_col = header.index("Parameters")
+    bins_col = 1
+    gen_cols = [(i, col) for i, col in enumerate(header[2:], start=2) if not is_missing(col) and str(col).strip()]
+    gen_cols = [(i, str(col)) for i, col in gen_cols]
+    generations = [col for _, col in gen_cols]
+    if not generations:
+        raise SpecError("No generation columns found (should start from column 3).")
+
+    parameters = []
+    default_bins = {}
+    allowed_values = {gen: {} for gen in generations}
+    pkt_types = {gen: None for gen in generations}
+    first_row = {}
+    duplicate_rows = {}
+    row_count = 0
+    memo = {}
+
+    # Sheet row numbers: header is row 1, data starts at row 2
+    for sheet_row, row in enumerate(rows, start=2):
+        row_count += 1
+        param = row[param_col] if param_col < len(row) else None
+        if is_missing(param):
+            continue
+        if param in first_row:
+            duplicate_rows.setdefault(param, [first_row[param]]).append(sheet_row)
+            continue
+        first_row[param] = sheet_row
+        parameters.append(param)
+
+        default_bins[param] = parse_default_bins(param, row[bins_col] if bins_col < len(row) else None)
+        cells = [row[i] if i < len(row) else None for i, _ in gen_cols]
+        for (_, gen), parsed_values in zip(gen_cols, parse_allowed_values_cached(cells, memo)):
+            allowed_values[gen][param] = parsed_values
+        # Raw pkt_type cells drive the trigger dispatch in the run task
+        if param == "pkt_type":
+            for (_, gen), cell_value in zip(gen_cols, cells):
+                pkt_types[gen] = None if is_missing(cell_value) else to_python_scalar(cell_value)
+
+    if row_count == 0:
+        raise SpecError("Excel file is empty.")
+    if not parameters:
+        raise SpecError("No valid parameters found in 'Parameters' column.")
+
+    return {
+        "parameters": parameters,
+        "generations": generations,
+        "allowed_values": allowed_values,
+        "default_bins": default_bins,
+        "pkt_types": pkt_types,
+        "duplicate_rows": duplicate_rows,
+    }
+
+# Long-format specs have one row per (generation, parameter) pair, as exported by
+# the fc.txt-style prototypes. An optional "bins" column gives default bins.
+LONG_FORMAT_COLUMNS = ("generation", "parameter", "allowed_values")
+
+def _normalise_column(col):
+    return str(col).strip().lower() if not is_missing(col) else ""
+
+def is_long_format(columns):
+    names = {_normalise_column(col) for col in columns}
+    return "Parameters" not in list(columns) and all(col in names for col in LONG_FORMAT_COLUMNS)
+
+# Build the same spec dicts as build_spec_from_rows from a long-format DataFrame,
+# parsing the allowed-values column through the cell cache and using groupby
+# instead of iterrows.
+def build_spec_from_long_df(df):
+    df = df.rename(columns=_normalise_column)
+    if df.empty:
+        raise SpecError("Excel file is empty.")
+
+    df = df[df["generation"].notna() & df["parameter"].notna()]
+    df = df.assign(generation=df["generation"].astype(str).str.strip(),
+                   parameter=df["parameter"].astype(str).str.strip())
+    df = df[(df["generation"] != "") & (df["parameter"] != "")]
+    if df.empty:
+        raise SpecError("No valid parameters found in 'parameter' column.")
+
+    parameters = df["parameter"].drop_duplicates().tolist()
+    generations = df["generation"].drop_duplicates().tolist()
+
+    # Sheet row numbers: header is row 1, data starts at row 2
+    sheet_rows = df.index.to_series() + 2
+    dup_mask = df.duplicated(["generation", "parameter"], keep=False)
+    duplicate_rows = {}
+    if dup_mask.any():
+        for (_, param), rows in sheet_rows[dup_mask].groupby([df["generation"][dup_mask], df["parameter"][dup_mask]], sort=False):
+            duplicate_rows.setdefault(param, []).extend(rows.tolist())
+    df = df.drop_duplicates(["generation", "parameter"], keep="first")
+
+    parsed = parse_allowed_values_cached(df["allowed_values"].tolist())
+    df = df.assign(parsed=parsed)
+
+    allowed_values = {}
+    for gen, group in df.groupby("generation", sort=False):
+        gen_values = dict.fromkeys(parameters)
+        gen_values.update(zip(group["parameter"], group["parsed"]))
+        allowed_values[gen] = {param: values if values is not None else [] for param, values in gen_values.items()}
+
+    default_bins = dict.fromkeys(parameters)
+    if "bins" in df.columns:
+        bins_rows = df[df["bins"].notna()].drop_duplicates("parameter", keep="first")
+        for param, bins_value in zip(bins_rows["parameter"], bins_rows["bins"]):
+            default_bins[param] = parse_default_bins(param, bins_value)
+
+    pkt_types = dict.fromkeys(generations)
+    pkt_rows = df[df["parameter"] == "pkt_type"]
+    for gen, cell_value in zip(pkt_rows["generation"], pkt_rows["allowed_values"]):
+        pkt_types[gen] = None if is_missing(cell_value) else to_python_scalar(cell_value)
+
+    return {
+        "parameters": parameters,
+        "generations": generations,
+        "allowed_values": allowed_values,
+        "default_bins": default_bins,
+        "pkt_types": pkt_types,
+        "duplicate_rows": duplicate_rows,
+    }
+
+# Streaming counterpart of build_spec_from_long_df: the same spec dicts built in
+# one pass over a header row and an iterable of data rows, so a long-format sheet
+# is never held in memory either. Only each (generation, parameter) pair's first
+# row is kept; repeats of a pair are reported in spec["duplicate_rows"].
+def build_spec_from_long_rows(header, rows):
+    names = [_normalise_column(col) for col in header]
+    gen_col, param_col, values_col = (names.index(col) for col in LONG_FORMAT_COLUMNS)
+    bins_col = names.index("bins") if "bins" in names else None
+
+    def cell(row, i):
+        return row[i] if i is not None and i < len(row) else None
+
+    parameters = {}
+    generations = {}
+    parsed = {}  # (gen, param) -> allowed values of the pair's first row
+    first_row = {}
+    repeats = {}
+    default_bins = {}
+    pkt_types = {}
+    row_count = 0
+    memo = {}
+    # Sheet row numbers: header is row 1, data starts at row 2
+    for sheet_row, row in enumerate(rows, start=2):
+        row_count += 1
+        gen, param = cell(row, gen_col), cell(row, param_col)
+        if is_missing(gen) or is_missing(param):
+            continue
+        gen, param = str(gen).strip(), str(param).strip()
+        if not gen or not param:
+            continue
+        key = (gen, param)
+        if key in first_row:
+            repeats.setdefault(key, [first_row[key]]).append(sheet_row)
+            continue
+        first_row[key] = sheet_row
+        parameters.setdefault(param, None)
+        generations.setdefault(gen, None)
+
+        values_cell = cell(row, values_col)
+        parsed[key] = parse_allowed_values_cached([values_cell], memo)[0]
+        bins_value = cell(row, bins_col)
+        if param not in default_bins and not is_missing(bins_value):
+            default_bins[param] = parse_default_bins(param, bins_value)
+        if param == "pkt_type":
+            pkt_types[gen] = None if is_missing(values_cell) else to_python_scalar(values_cell)
+
+    if row_count == 0:
+        raise SpecError("Excel file is empty.")
+    if not parsed:
+        raise SpecError("No valid parameters found in 'parameter' column.")
+
+    duplicate_rows = {}
+    for key in sorted(repeats, key=first_row.get):
+        duplicate_rows.setdefault(key[1], []).extend(repeats[key])
+
+    return {
+        "parameters": list(parameters),
+        "generations": list(generations),
+        "allowed_values": {gen: {param: parsed.get((gen, param), []) for param in parameters} for gen in generations},
+        "default_bins": {param: default_bins.get(param) for param in parameters},
+        "pkt_types": {gen: pkt_types.get(gen) for gen in generations},
+        "duplicate_rows": duplicate_rows,
+    }
+
+# Warnings for repeated parameter rows recorded in spec["duplicate_rows"].
+# Reported from the loaded spec rather than while parsing, so a spec served
+# from the cache warns as well. A merged spec (spec_sources.merge_specs) keeps
+# (source, row) pairs; each source uses its own first row and the source that
+# listed the parameter first takes precedence.
+def duplicate_row_warnings(spec):
+    warnings = []
+    for param, sheet_rows in spec.get("duplicate_rows", {}).items():
+        if sheet_rows and isinstance(sheet_rows[0], tuple):
+            rows_text = ", ".join(f"{source} row {row}" for source, row in sheet_rows)
+            winner = spec.get("parameter_sources", {}).get(param, sheet_rows[0][0])
+            first_rows = {}
+            for source, row in sheet_rows:
+                first_rows.setdefault(source, row)
+            used = ", ".join(f"row {row} of {source}" for source, row in first_rows.items())
+            warnings.append(f"Parameter '{param}' appears on rows [{rows_text}]; using {used}, "
+                            f"with {winner} taking precedence.")
+        else:
+            warnings.append(f"Parameter '{param}' appears on rows {sheet_rows}; using row {sheet_rows[0]}.")
+    return warnings
+
+# Empty saved-inputs structure, same layout the GUI writes to user_inputs.json
+def empty_inputs(spec):
+    return {
+        "parameters": {},
+        "cross_coverage": {},
+        "wifi_specifications": {gen: True for gen in spec["generations"]}
+    }
+
+# Load a saved-inputs JSON file written by "Save Inputs to JSON"
+def load_inputs(path):
+    with open(path, 'r') as f:
+        inputs_data = json.load(f)
+    for key in ("parameters", "cross_coverage", "wifi_specifications"):
+        inputs_data.setdefault(key, {})
+    return inputs_data
+
+# Write a saved-inputs structure, e.g. a GUI session; returns (path, changed)
+# like write_output, so saving an unchanged session leaves the file alone
+def save_inputs(inputs_data, path):
+    return write_output(json.dumps(inputs_data, indent=4), path)
+
+# A custom row whose bins are one per value ("bins x[] = {...}"). Dropping values
+# an earlier per-value row already bins leaves the coverage goal unchanged, since
+# each value keeps exactly one bin of its own.
+def _is_per_value_row(row):
+    return (row.get("value_set") is not None or
+            (row["range_div"] is None and not row.get("chunks") and
+             not (row["bins_count"] is not None and row["bins_count"] > 1)))
+
+def _row_value_set(row):
+    if row.get("value_set") is not None:
+        return row["value_set"]
+    return IntervalSet.from_parsed(row["parsed"])
+
+# SystemVerilog value list for a set: "[1:3],7,[9:$]"
+def format_value_set(values):
+    return ",".join(str(a) if a == b else f"[{format_low_bound(a)}:{format_high_bound(b)}]" for a, b in values)
+
+# Check one parameter's custom rows for overlaps before emission. Rows covering
+# exactly the values of an earlier row with the same bin layout are dropped. With
+# overlap="merge", a per-value row keeps only the values earlier per-value rows do
+# not already bin, so no value gets two per-value bins; a trimmed row with a
+# generated name is renamed after what it keeps. Overlaps with single, fixed or
+# chunked rows, in either order, are flagged in errors and emitted unchanged.
+# Results therefore do not depend on where a coarser row sits.
+def resolve_bin_overlaps(param, entry, errors, overlap="merge"):
+    rows = entry['custom_rows']
+    if len(rows) < 2:
+        return
+    value_sets = [_row_value_set(row) for row in rows]
+    overlaps = {}
+    for j, k in overlapping_pairs(value_sets):
+        overlaps.setdefault(k, []).append(j)
+
+    keep = [True] * len(rows)
+    for k in sorted(overlaps):
+        row = rows[k]
+        earlier = [j for j in overlaps[k] if keep[j] and value_sets[j] & value_sets[k]]
+        if not earlier:
+            continue
+        layout = (row["bins_count"], row["range_div"], row.get("chunks"))
+        duplicate = next((j for j in earlier if value_sets[j] == value_sets[k] and
+                          (rows[j]["bins_count"], rows[j]["range_div"], rows[j].get("chunks")) == layout), None)
+        if duplicate is not None:
+            keep[k] = False
+            errors.setdefault(param, {})[row["row"]] = f"Duplicate of input {rows[duplicate]['row'] + 1} (dropped)"
+            continue
+        merged = []
+        if overlap == "merge" and _is_per_value_row(row):
+            merged = [j for j in earlier if _is_per_value_row(rows[j])]
+        flagged = [j for j in earlier if j not in merged]
+        messages = []
+        if merged:
+            labels = ", ".join(str(rows[j]["row"] + 1) for j in merged)
+            covered = IntervalSet()
+            for j in merged:
+                covered = covered | value_sets[j]
+            remaining = value_sets[k] - covered
+            if not remaining:
+                keep[k] = False
+                errors.setdefault(param, {})[row["row"]] = f"Covered by input {labels} (dropped)"
+                continue
+            value_sets[k] = remaining
+            bin_name = row["bin_name"]
+            if row.get("auto_name"):
+                bin_name = get_default_bin_name({"type": "range", "range": (remaining.min, remaining.max)},
+                                                param.lower())
+            entry['custom_bins'][k] = f"        bins {bin_name}[] = {{{format_value_set(remaining)}}};"
+            rows[k] = dict(row, value_set=remaining, bin_name=bin_name)
+            messages.append(f"Overlap with input {labels} removed")
+        if flagged:
+            labels = ", ".join(str(rows[j]["row"] + 1) for j in flagged)
+            messages.append(f"{'overlaps' if messages else 'Overlaps'} input {labels}")
+        errors.setdefault(param, {})[row["row"]] = "; ".join(messages)
+
+    entry['custom_bins'] = [code for code, kept in zip(entry['custom_bins'], keep) if kept]
+    entry['custom_rows'] = [row for row, kept in zip(rows, keep) if kept]
+
+# Turn raw saved inputs into the user_inputs mapping consumed by the emitter.
+# Returns (user_inputs, errors) where errors maps param -> {row index: message}.
+# samples maps param -> observed values, used by "quantile:N" splits; overlap is
+# "merge" or "flag" (see resolve_bin_overlaps).
+def build_user_inputs(spec, inputs_data, max_bin_lines=DEFAULT_MAX_BIN_LINES, samples=None, overlap="merge"):
+    parameters = spec["parameters"]
+    generations = spec["generations"]
+    default_bins = spec["default_bins"]
+    index = get_domain_index(spec)
+
+    user_inputs = {}
+    errors = {}
+
+    for param in parameters:
+        if param == "pkt_type":
+            user_inputs[param] = {
+                'use_default': True,  # Always use default for pkt_type
+                'default_bins': default_bins[param],
+                'custom_bins': [],
+                'custom_rows': []
+            }
+            continue
+        param_data = inputs_data["parameters"].get(param, {})
+        use_default = bool(param_data.get("use_default", False))
+        user_inputs[param] = {
+            'use_default': use_default,
+            'default_bins': default_bins[param],
+            'custom_bins': [],
+            'custom_rows': []
+        }
+        if use_default:
+            continue
+
+        for i, row in enumerate(param_data.get("inputs", [])[:MAX_INPUT_ROWS]):
+            input_text = row.get("input", "").strip()
+            if not input_text:
+                continue
+
+            parsed = parse_user_input(input_text)
+            if parsed is None:
+                errors.setdefault(param, {})[i] = "Invalid input format"
+                continue
+
+            if not index.is_within_combined_range(parsed, param):
+                max_range = index.max_allowed_range(param)
+                errors.setdefault(param, {})[i] = f"Out of range: {max_range}"
+                continue
+
+            bins_count = parse_bins_input(row.get("bins", ""))
+            split = parse_split_input(row.get("range", ""))
+            range_div = split["count"] if split and split["strategy"] == "equal" else None
+            bin_name = row.get("bin_name", "").strip()
+
+            if split and split["strategy"] != "equal":
+                if parsed["type"] != "range" or is_open_low(parsed["range"][0]) or is_open_high(parsed["range"][1]):
+                    errors.setdefault(param, {})[i] = f"{split['strategy']} split needs a finite [min:max]"
+                    continue
+                # NumPy is only needed once a non-uniform split is asked for
+                from bin_strategies import split_chunks
+                min_val, max_val = parsed["range"]
+                try:
+                    chunks = split_chunks(min_val, max_val, split["strategy"], split["count"],
+                                          (samples or {}).get(param))
+                except ValueError as e:
+                    errors.setdefault(param, {})[i] = str(e).capitalize()
+                    continue
+                if len(chunks) > max_bin_lines:
+                    errors.setdefault(param, {})[i] = f"Too many bins: {len(chunks)} (limit {max_bin_lines})"
+                    continue
+                user_inputs[param]['custom_bins'].append(ChunkedBins(chunks, bins_count, bin_name, param.lower()))
+                user_inputs[param]['custom_rows'].append(
+                    {"row": i, "parsed": parsed, "bins_count": bins_count, "range_div": None, "bin_name": bin_name,
+                     "chunks": chunks})
+                continue
+
+            # Structured copy of each emitted row, for the bin estimator
+            custom_row = {"row": i, "parsed": parsed, "bins_count": bins_count, "range_div": range_div, "bin_name": bin_name}
+
+            if range_div is not None and parsed["type"] == "range":
+                min_val, max_val = parsed["range"]
+                if not (is_open_low(min_val) or is_open_high(max_val)):
+                    # Whole chunks share one array bin, so even a million-chunk split is one line
+                    lines = count_range_divided_lines(min_val, max_val, bins_count, range_div)
+                    if lines > max_bin_lines:
+                        errors.setdefault(param, {})[i] = f"Too many bins: {lines} (limit {max_bin_lines})"
+                        continue
+                    user_inputs[param]['custom_bins'].append(
+                        RangeDividedBins(min_val, max_val, bins_count, range_div, bin_name, param.lower(), max_bin_lines))
+                    user_inputs[param]['custom_rows'].append(custom_row)
+                    continue
+                custom_row["range_div"] = None
+
+            if not bin_name:
+                bin_name = custom_row["bin_name"] = get_default_bin_name(parsed, param.lower())
+                custom_row["auto_name"] = True
+
+            bin_code = generate_systemverilog_bins(parsed, bins_count, range_div, bin_name, param.lower())
+            if bin_code:
+                user_inputs[param]['custom_bins'].append(bin_code)
+                user_inputs[param]['custom_rows'].append(custom_row)
+
+        resolve_bin_overlaps(param, user_inputs[param], errors, overlap)
+
+    for gen in generations:
+        user_inputs[gen] = {'cross_coverage': [], 'crosses': []}
+        for cross_entry in inputs_data["cross_coverage"].get(gen, []):
+            cross_name = cross_entry.get("cross_name", "").strip()
+            coverpoints_text = cross_entry.get("coverpoints", "").strip()
+            illegal_text = cross_entry.get("illegal_bins", "").strip()
+            ignore_text = cross_entry.get("ignore_bins", "").strip()
+            operator = cross_entry.get("operator", "").strip() or "&&"
+
+            if cross_name and coverpoints_text:
+                coverpoints = [cp.strip() for cp in coverpoints_text.split(',') if cp.strip()]
+                if coverpoints:
+                    illegal_bins = parse_illegal_bins(illegal_text)
+                    try:
+                        ignore_expr = parse_select_expression(ignore_text)
+                    except ValueError as e:
+                        print(f"Error parsing ignore bins of {cross_name}: {e}")
+                        ignore_expr = None
+                    try:
+                        ignore_expr = apply_clause_operator(ignore_expr, operator)
+                    except ValueError as e:
+                        print(f"Error in operator of {cross_name}: {e}; using &&")
+                    try:
+                        mode, strength = parse_cross_mode(cross_entry.get("cross_mode", ""))
+                    except ValueError as e:
+                        print(f"Error in cross mode of {cross_name}: {e}")
+                        mode, strength = "full", None
+                    auto_ignore = bool(cross_entry.get("auto_ignore"))
+                    if mode == "crosses" and strength < len(coverpoints):
+                        # One full cross per combination of strength coverpoints, keeping
+                        # the ignore terms and illegal conditions that fit inside it
+                        for subset in combinations(coverpoints, strength):
+                            subset = list(subset)
+                            sub_name = cross_name + "".join(f"_{_short_coverpoint(cp)}" for cp in subset)
+                            terms = [term for term in select_terms(ignore_expr) if select_coverpoints(term) <= set(subset)]
+                            sub_ignore = None if not terms else terms[0] if len(terms) == 1 else Or(tuple(terms))
+                            sub_illegal = [c for c in illegal_bins if _condition_applies(c, subset, coverpoints)]
+                            _add_cross(spec, user_inputs, gen, sub_name, subset, sub_illegal, sub_ignore,
+                                       auto_ignore)
+                    else:
+                        _add_cross(spec, user_inputs, gen, cross_name, coverpoints, illegal_bins, ignore_expr,
+                                   auto_ignore, strength if mode == "tuples" else None)
+
+    return user_inputs, errors
+
+# "cov_mcs" -> "mcs", for the names of the crosses a cross mode splits into
+def _short_coverpoint(cp):
+    return cp[4:] if cp.lower().startswith("cov_") else cp
+
+# Whether an illegal condition belongs in a sub-cross over coverpoints.
+# Malformed conditions are kept so generate_cross_coverage_code reports them.
+def _condition_applies(condition, coverpoints, all_coverpoints):
+    try:
+        illegal_condition_select(condition, coverpoints)
+        return True
+    except ValueError:
+        pass
+    try:
+        illegal_condition_select(condition, all_coverpoints)
+        return False
+    except ValueError:
+        return True
+
+# Record one cross of gen in user_inputs: its code and the structured form the
+# estimator counts. strength, when set, makes it a covering-array cross.
+def _add_cross(spec, user_inputs, gen, cross_name, coverpoints, illegal_bins, ignore_expr,
+               auto_ignore=False, strength=None):
+    if auto_ignore:
+        # Imported here: cross_reachability builds on bin_estimator, which imports this module
+        from cross_reachability import derive_ignore_bins
+        derived = derive_ignore_bins(spec, user_inputs, gen, coverpoints, ignore_expr)
+        terms = select_terms(ignore_expr) + select_terms(derived)
+        if terms:
+            ignore_expr = terms[0] if len(terms) == 1 else Or(tuple(terms))
+    illegal_exprs = []
+    for condition in illegal_bins:
+        try:
+            illegal_exprs.append(illegal_condition_select(condition, coverpoints))
+        except ValueError:
+            pass  # reported by generate_cross_coverage_code
+    tuples = None
+    if strength is not None:
+        # Imported here so NumPy is only needed for covering-array crosses
+        from covering_array import covering_tuples
+        try:
+            tuples = covering_tuples(spec, user_inputs, gen, coverpoints, strength)
+        except ValueError as e:
+            print(f"Error building the {strength}-wise covering array of {cross_name}: {e}; using a full cross")
+    cross_code = generate_cross_coverage_code(cross_name, coverpoints, illegal_bins, ignore_expr, tuples)
+    user_inputs[gen]['cross_coverage'].append(cross_code)
+    user_inputs[gen]['crosses'].append({
+        "name": cross_name,
+        "coverpoints": coverpoints,
+        "illegal_bins": illegal_bins,
+        "ignore_bins": select_to_conditions(ignore_expr),
+        "ignore_expr": ignore_expr,
+        "illegal_exprs": illegal_exprs,
+        "tuples": tuples
+    })
+
+# Which generations the saved inputs select (unlisted ones default to selected)
+def selected_specs(spec, inputs_data):
+    return {gen: bool(inputs_data["wifi_specifications"].get(gen, True)) for gen in spec["generations"]}
+
+# Render the combined module for a loaded spec and raw saved inputs
+# built, when given, is the (user_inputs, errors) pair build_user_inputs already
+# returned for these inputs, so diagnostics and derived crosses are not redone.
+def render_coverage(spec, inputs_data, max_bin_lines=DEFAULT_MAX_BIN_LINES, samples=None, overlap="merge",
+                    built=None):
+    user_inputs, errors = built or build_user_inputs(spec, inputs_data, max_bin_lines, samples, overlap)
+    wifi_specs = selected_specs(spec, inputs_data)
+    combined_code = generate_combined_module_definition(
+        spec["parameters"], spec["generations"], spec["allowed_values"], wifi_specs, user_inputs, spec["pkt_types"]
+    )
+    return combined_code, errors
+
+# Stream the combined module for a loaded spec and raw saved inputs straight to
+# output_file. Returns (output_file, changed, errors); output_file is None if
+# emission failed, in which case any existing output is left untouched. built
+# is as for render_coverage.
+def render_coverage_to_file(spec, inputs_data, output_file=DEFAULT_OUTPUT_FILE, max_bin_lines=DEFAULT_MAX_BIN_LINES,
+                            samples=None, overlap="merge", workers=None, built=None):
+    user_inputs, errors = built or build_user_inputs(spec, inputs_data, max_bin_lines, samples, overlap)
+    wifi_specs = selected_specs(spec, inputs_data)
+    fragments = iter_combined_module(
+        spec["parameters"], spec["generations"], spec["allowed_values"], wifi_specs, user_inputs, spec["pkt_types"],
+        workers
+    )
+    try:
+        output_file, changed = write_output(fragments, output_file)
+        return output_file, changed, errors
+    except Exception as e:
+        print(f"Error generating combined module definition: {e}")
+        return None, False, errors
+
+# Split-output counterpart of render_coverage_to_file. Returns (results, errors)
+# where results is write_split_output's [(path, changed), ...], or None on failure.
+def render_split_coverage(spec, inputs_data, output_file=DEFAULT_OUTPUT_FILE, max_bin_lines=DEFAULT_MAX_BIN_LINES,
+                          samples=None, overlap="merge", workers=None, built=None):
+    user_inputs, errors = built or build_user_inputs(spec, inputs_data, max_bin_lines, samples, overlap)
+    wifi_specs = selected_specs(spec, inputs_data)
+    try:
+        results = write_split_output(spec["parameters"], spec["generations"], spec["allowed_values"], wifi_specs,
+                                     user_inputs, spec["pkt_types"], output_file, workers)
+        return results, errors
+    except Exception as e:
+        print(f"Error generating split coverage output: {e}")
+        return None, errors
+
+# Permissions for a new output: keep an existing file's mode, otherwise what
+# open() would have given (mkstemp always creates files as 0600)
+def _output_mode(output_file):
+    try:
+        return os.stat(output_file).st_mode & 0o777
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+# SHA-256 of a file's contents, read in chunks
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# True when two files hold the same bytes; sizes are compared before hashing
+def _same_content(path, other_path):
+    try:
+        if os.path.getsize(path) != os.path.getsize(other_path):
+            return False
+        return file_sha256(path) == file_sha256(other_path)
+    except OSError:
+        return False
+
+# Write generated SystemVerilog to disk. combined_code is a string or an
+# iterable of fragments (iter_combined_module), which is written as it is
+# produced. The file is written under a temporary name and renamed into place,
+# so a failure part-way never leaves a truncated output behind. When the new
+# content hashes the same as the existing file, the file is left untouched so
+# its mtime does not trigger a simulator recompile.
+# Returns (output_file, changed).
+def write_output(combined_code, output_file=DEFAULT_OUTPUT_FILE):
+    fragments = [combined_code] if isinstance(combined_code, str) else combined_code
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(output_file) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.writelines(fragments)
+        if _same_content(tmp_path, output_file):
+            os.remove(tmp_path)
+            return output_file, False
+        os.chmod(tmp_path, _output_mode(output_file))
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return output_file, True
@@ -1,419 +1,56 @@
-import pandas as pd
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import sys
-import os
-import math
-import uuid
 import json
 
-# Parse allowed values from Excel cell strings
-def parse_allowed_values(s):
-    try:
-        if pd.isna(s):
-            return []
-        s = str(s).strip()
-        parts = [part.strip() for part in s.split(",") if part.strip()]
-        result = []
-        for part in parts:
-            if part.startswith("[") and part.endswith("]") and ":" in part:
-                range_str = part[1:-1]
-                a, b = range_str.split(":")
-                a = int(a) if a != "$" else float('-inf')
-                b = int(b) if b != "$" else float('inf')
-                result.append(("range", (a, b)))
-            else:
-                try:
-                    value = int(part)
-                    result.append(("value", value))
-                except ValueError:
-                    continue
-        return result
-    except Exception as e:
-        print(f"Error parsing allowed values: {e}")
-        return []
-
-# Parse user input (single range or list of values)
-def parse_user_input(s):
-    try:
-        s = s.strip()
-        if not s:
-            return None
-        if s.startswith("[") and s.endswith("]") and ":" in s:
-            range_str = s[1:-1]
-            try:
-                a, b = range_str.split(":")
-                a = int(a) if a != "$" else float('-inf')
-                b = int(b) if b != "$" else float('inf')
-                return {"type": "range", "range": (a, b)}
-            except ValueError:
-                return None
-        else:
-            try:
-                values = [int(v.strip()) for v in s.split(",") if v.strip()]
-                if values:
-                    return {"type": "list", "values": values}
-                return None
-            except ValueError:
-                return None
-    except Exception as e:
-        print(f"Error parsing user input: {e}")
-        return None
-
-# Parse bins input - return None if empty or invalid
-def parse_bins_input(s):
-    try:
-        s = s.strip()
-        if not s:
-            return None
-        try:
-            bins = int(s)
-            if bins <= 0:
-                return None
-            return bins
-        except ValueError:
-            return None
-    except Exception as e:
-        print(f"Error parsing bins input: {e}")
-        return None
-
-# Parse range input - return None if empty or invalid
-def parse_range_input(s):
-    try:
-        s = s.strip()
-        if not s:
-            return None
-        try:
-            range_val = int(s)
-            if range_val <= 0:
-                return None
-            return range_val
-        except ValueError:
-            return None
-    except Exception as e:
-        print(f"Error parsing range input: {e}")
-        return None
-
-# Parse ignore bins input
-def parse_ignore_bins(s):
-    try:
-        s = s.strip()
-        if not s:
-            return []
-        # Split into conditions using || (OR)
-        conditions = [cond.strip() for cond in s.split("||") if cond.strip()]
-        parsed_conditions = []
-        for cond in conditions:
-            # Split into clauses using the operator (&&, ||, etc.)
-            clauses = [clause.strip() for clause in cond.split("&&") if clause.strip()]
-            parsed_clauses = []
-            for clause in clauses:
-                if "binsof" not in clause or "intersect" not in clause:
-                    raise ValueError(f"Invalid ignore bins clause syntax: {clause}")
-                # Extract coverpoint and values
-                parts = clause.split("intersect")
-                if len(parts) != 2:
-                    raise ValueError(f"Invalid intersect syntax in: {clause}")
-                coverpoint_part = parts[0].strip()
-                values_part = parts[1].strip()
-                # Extract coverpoint name
-                coverpoint = coverpoint_part.replace("binsof", "").replace("(", "").replace(")", "").strip()
-                # Extract values (handle {val1, val2, ...} or single value)
-                values_str = values_part.replace("{", "").replace("}", "").strip()
-                values = [v.strip() for v in values_str.split(",") if v.strip()]
-                parsed_clauses.append((coverpoint, values))
-            parsed_conditions.append(parsed_clauses)
-        return parsed_conditions
-    except Exception as e:
-        print(f"Error parsing ignore bins: {e}")
-        return []
-
-# Generate automatic bins based on range division
-def generate_automatic_bins(parsed_input, range_div, bin_name_prefix):
-    try:
-        if parsed_input["type"] != "range":
-            return []
-        
-        min_val, max_val = parsed_input["range"]
-        if min_val == float('-inf') or max_val == float('inf'):
-            return []
-        
-        bins = []
-        current = min_val
-        bin_num = 1
-        
-        while current <= max_val:
-            next_val = min(current + range_div - 1, max_val)
-            bin_name = f"{bin_name_prefix}_v{current}_{next_val}"
-            bins.append({
-                "cross_name": bin_name,
-                "range": (current, next_val)
-            })
-            current = next_val + 1
-            bin_num += 1
-        
-        return bins
-    except Exception as e:
-        print(f"Error generating automatic bins: {e}")
-        return []
-
-# Parse illegal bins input
-def parse_illegal_bins(s):
-    try:
-        s = s.strip()
-        if not s:
-            return []
-        conditions = [cond.strip() for cond in s.split(";") if cond.strip()]
-        return conditions
-    except Exception as e:
-        print(f"Error parsing illegal bins: {e}")
-        return []
-
-# Get default bin cross_name with updated format
-def get_default_bin_name(parsed, param_name):
-    try:
-        if parsed["type"] == "range":
-            a, b = parsed["range"]
-            a_str = str(a) if a != float('-inf') else "inf"
-            b_str = str(b) if b != float('inf') else "$"
-            return f"{param_name}_v{a_str}_{b_str}"
-        elif parsed["type"] == "list":
-            values = parsed["values"]
-            if len(values) == 1:
-                return f"{param_name}_v{values[0]}_{values[0]}"
-            else:
-                min_val = min(values)
-                max_val = max(values)
-                return f"{param_name}_v{min_val}_{max_val}"
-    except Exception as e:
-        print(f"Error getting default bin cross_name: {e}")
-        return f"{param_name}_default_bin"
-
-# Get combined allowed range for a parameter (union of all ranges/values)
-def get_combined_allowed_range(param, allowed_values):
-    try:
-        all_ranges = []
-        all_values = []
-        
-        for gen in allowed_values:
-            for item_type, item in allowed_values[gen].get(param, []):
-                if item_type == "range":
-                    all_ranges.append(item)
-                elif item_type == "value":
-                    all_values.append(item)
-        
-        min_vals = []
-        max_vals = []
-        
-        for a, b in all_ranges:
-            if a != float('-inf'):
-                min_vals.append(a)
-            if b != float('inf'):
-                max_vals.append(b)
-        
-        if all_values:
-            min_vals.extend(all_values)
-            max_vals.extend(all_values)
-        
-        if min_vals and max_vals:
-            overall_min = min(min_vals)
-            overall_max = max(max_vals)
-            return overall_min, overall_max
-        
-        return None, None
-    except Exception as e:
-        print(f"Error getting combined allowed range: {e}")
-        return None, None
-
-# Get maximum allowed range or values for feedback display
-def get_max_allowed_range(param, allowed_values):
-    try:
-        ranges = []
-        values = []
-        for gen in allowed_values:
-            for item_type, item in allowed_values[gen].get(param, []):
-                if item_type == "range":
-                    ranges.append(item)
-                elif item_type == "value":
-                    values.append(item)
-        if ranges:
-            min_val = min(a for a, _ in ranges if a != float('-inf'))
-            max_val = max(b for _, b in ranges if b != float('inf'))
-            min_str = str(min_val) if min_val != float('-inf') else "inf"
-            max_str = str(max_val) if max_val != float('inf') else "$"
-            return f"[{min_str}:{max_str}]"
-        elif values:
-            return ",".join(map(str, sorted(values)))
-        return "No valid data"
-    except Exception as e:
-        print(f"Error getting max allowed range: {e}")
-        return "Error getting range"
-
-# Check if input is within the combined allowed range
-def is_input_within_combined_range(parsed, param, allowed_values):
-    try:
-        overall_min, overall_max = get_combined_allowed_range(param, allowed_values)
-        if overall_min is None or overall_max is None:
-            return False
-        
-        if parsed["type"] == "range":
-            min_val, max_val = parsed["range"]
-            return overall_min <= min_val and max_val <= overall_max
-        elif parsed["type"] == "list":
-            values = parsed["values"]
-            return all(overall_min <= v <= overall_max for v in values)
-        
-        return False
-    except Exception as e:
-        print(f"Error checking if input is within combined range: {e}")
-        return False
-
-# Check if input is allowed for a specific generation
-def is_input_allowed_for_generation(parsed, allowed):
-    try:
-        if parsed["type"] == "range":
-            min_val, max_val = parsed["range"]
-            for item_type, item in allowed:
-                if item_type == "range":
-                    a, b = item
-                    if a <= min_val and max_val <= b:
-                        return True
-        elif parsed["type"] == "list":
-            values = parsed["values"]
-            for v in values:
-                allowed_v = False
-                for item_type, item in allowed:
-                    if item_type == "range" and item[0] <= v <= item[1]:
-                        allowed_v = True
-                        break
-                    elif item_type == "value" and item == v:
-                        allowed_v = True
-                        break
-                if not allowed_v:
-                    return False
-            return True
-        
-        return False
-    except Exception as e:
-        print(f"Error checking if input is allowed for generation: {e}")
-        return False
-
-def generate_systemverilog_bins(parsed, bins_count, range_div, bin_name, param):
-    try:
-        if parsed["type"] == "range":
-            min_val, max_val = parsed["range"]
-            min_str = str(min_val) if min_val != float('-inf') else "inf"
-            max_str = str(max_val) if max_val != float('inf') else "$"
-            if range_div is not None:
-                bins = []
-                current = min_val
-                while current <= max_val:
-                    next_val = min(current + range_div - 1, max_val)
-                    next_str = str(next_val) if next_val != float('inf') else "$"
-                    bin_name_i = f"{param}_v{current}_{next_str}" if not bin_name else bin_name
-                    if bins_count is not None and bins_count > 1:
-                        bins.append(f"        bins {bin_name_i}[{bins_count}] = {{[{current}:{next_str}]}};")
-                    else:
-                        bins.append(f"        bins {bin_name_i}[] = {{[{current}:{next_str}]}};")
-                    current = next_val + 1
-                return "\n".join(bins)
-            else:
-                if not bin_name:
-                    bin_name = f"{param}_v{min_str}_{max_str}"
-                if bins_count is not None and bins_count > 1:
-                    return f"        bins {bin_name}[{bins_count}] = {{[{min_str}:{max_str}]}};"
-                else:
-                    return f"        bins {bin_name}[] = {{[{min_str}:{max_str}]}};"
-        elif parsed["type"] == "list":
-            values = parsed["values"]
-            if len(values) == 1:
-                v = values[0]
-                bin_name_v = f"{param}_v{v}_{v}" if not bin_name else bin_name
-                if bins_count is not None and bins_count > 1:
-                    return f"        bins {bin_name_v}[{bins_count}] = {{{v}}};"
-                else:
-                    return f"        bins {bin_name_v}[] = {{{v}}};"
-            else:
-                values_str = ",".join(map(str, values))
-                bin_name_v = f"{param}_v{min(values)}_{max(values)}" if not bin_name else bin_name
-                if bins_count is not None and bins_count > 1:
-                    return f"        bins {bin_name_v}[{bins_count}] = {{{values_str}}};"
-                else:
-                    return f"        bins {bin_name_v}[] = {{{values_str}}};"
-    except Exception as e:
-        print(f"Error generating SystemVerilog bins: {e}")
-        return ""
-
-# Generate cross coverage code with ignore bins
-def generate_cross_coverage_code(cross_name, coverpoints, illegal_bins, ignore_bins, operator):
-    try:
-        coverpoint_code = f"    {cross_name}: cross {','.join(coverpoints)}"
-        if illegal_bins or ignore_bins:
-            coverpoint_code += " {\n"
-            if illegal_bins:
-                illegal_code = "\n".join(f"        illegal_bins {illegal_bin.replace('=', '==')} = 1 when {{{illegal_bin}}};" 
-                                       for illegal_bin in illegal_bins)
-                coverpoint_code += illegal_code + "\n"
-            if ignore_bins:
-                coverpoint_code += "        ignore_bins bignore = {\n"
-                cond_lines = []
-                for cond in ignore_bins:
-                    clause_exprs = [f"binsof ({cp}) intersect {{{','.join(vals)}}}" 
-                                  for cp, vals in cond]
-                    cond_lines.append(f"            ({operator.join(clause_exprs)})")
-                coverpoint_code += "\n".join(cond_lines) + "\n"
-                coverpoint_code += "        };\n"
-            coverpoint_code += "    }"
-        else:
-            coverpoint_code += ";"
-        return coverpoint_code
-    except Exception as e:
-        print(f"Error generating cross coverage code: {e}")
-        return ""
+from coverage_engine import (
+    DEFAULT_SPEC_FILE, DEFAULT_SHEET_NAME, DEFAULT_OUTPUT_FILE, SpecError,
+    build_user_inputs, iter_combined_module, write_output, write_split_output,
+    get_domain_index, load_inputs, save_inputs, duplicate_row_warnings
+)
+from cross_model import CrossModel
+from spec_cache import load_spec_cached
+from bin_estimator import estimate_bins, check_bin_budget, check_cross_clauses, format_estimate
+
+# Read current widget values into the saved-inputs structure
+def collect_inputs(entries, bins_entries, range_entries, bin_name_entries, check_vars, cross_model, wifi_specs_vars):
+    inputs_data = {
+        "parameters": {},
+        "cross_coverage": {},
+        "wifi_specifications": {}
+    }
+    
+    # Save parameter inputs
+    for param in entries:
+        if param == "pkt_type":
+            continue
+        param_data = {
+            "use_default": check_vars[param].get(),
+            "inputs": []
+        }
+        for i in range(len(entries[param])):
+            input_data = {
+                "input": entries[param][i].get().strip() if i < len(entries[param]) else "",
+                "bins": bins_entries[param][i].get().strip() if i < len(bins_entries[param]) else "",
+                "range": range_entries[param][i].get().strip() if i < len(range_entries[param]) else "",
+                "bin_name": bin_name_entries[param][i].get().strip() if i < len(bin_name_entries[param]) else ""
+            }
+            param_data["inputs"].append(input_data)
+        inputs_data["parameters"][param] = param_data
+    
+    # Cross coverage comes from the model the cross rows are bound to
+    inputs_data["cross_coverage"] = cross_model.to_inputs()
+    
+    # Save WiFi specifications selections
+    for gen, var in wifi_specs_vars.items():
+        inputs_data["wifi_specifications"][gen] = var.get()
+    
+    return inputs_data
 
 # Save user inputs to JSON file
-def save_inputs_to_json(entries, bins_entries, range_entries, bin_name_entries, check_vars, cross_coverage_entries, wifi_specs_vars):
+def save_inputs_to_json(entries, bins_entries, range_entries, bin_name_entries, check_vars, cross_model, wifi_specs_vars):
     try:
-        inputs_data = {
-            "parameters": {},
-            "cross_coverage": {},
-            "wifi_specifications": {}
-        }
-        
-        # Save parameter inputs
-        for param in entries:
-            if param == "pkt_type":
-                continue
-            param_data = {
-                "use_default": check_vars[param].get(),
-                "inputs": []
-            }
-            for i in range(len(entries[param])):
-                input_data = {
-                    "input": entries[param][i].get().strip() if i < len(entries[param]) else "",
-                    "bins": bins_entries[param][i].get().strip() if i < len(bins_entries[param]) else "",
-                    "range": range_entries[param][i].get().strip() if i < len(range_entries[param]) else "",
-                    "bin_name": bin_name_entries[param][i].get().strip() if i < len(bin_name_entries[param]) else ""
-                }
-                param_data["inputs"].append(input_data)
-            inputs_data["parameters"][param] = param_data
-        
-        # Save cross coverage inputs
-        for gen in cross_coverage_entries:
-            cross_data = []
-            for cross_entry in cross_coverage_entries[gen]:
-                cross_data.append({
-                    "cross_name": cross_entry['name'].get().strip(),
-                    "coverpoints": cross_entry['coverpoints'].get().strip(),
-                    "illegal_bins": cross_entry['illegal'].get().strip(),
-                    "ignore_bins": cross_entry['ignore'].get().strip(),
-                    "operator": cross_entry['operator'].get().strip()
-                })
-            inputs_data["cross_coverage"][gen] = cross_data
-        
-        # Save WiFi specifications selections
-        for gen, var in wifi_specs_vars.items():
-            inputs_data["wifi_specifications"][gen] = var.get()
+        inputs_data = collect_inputs(entries, bins_entries, range_entries, bin_name_entries, check_vars, cross_model, wifi_specs_vars)
         
         output_file = "user_inputs.json"
         with open(output_file, 'w') as f:
@@ -425,48 +62,9 @@ def save_inputs_to_json(entries, bins_entries, range_entries, bin_name_entries,
         print(f"Detailed error: {e}")
 
 # Save user inputs to TXT file in JSON format
-def save_inputs_to_txt(entries, bins_entries, range_entries, bin_name_entries, check_vars, cross_coverage_entries, wifi_specs_vars):
+def save_inputs_to_txt(entries, bins_entries, range_entries, bin_name_entries, check_vars, cross_model, wifi_specs_vars):
     try:
-        inputs_data = {
-            "parameters": {},
-            "cross_coverage": {},
-            "wifi_specifications": {}
-        }
-        
-        # Save parameter inputs
-        for param in entries:
-            if param == "pkt_type":
-                continue
-            param_data = {
-                "use_default": check_vars[param].get(),
-                "inputs": []
-            }
-            for i in range(len(entries[param])):
-                input_data = {
-                    "input": entries[param][i].get().strip() if i < len(entries[param]) else "",
-                    "bins": bins_entries[param][i].get().strip() if i < len(bins_entries[param]) else "",
-                    "range": range_entries[param][i].get().strip() if i < len(range_entries[param]) else "",
-                    "bin_name": bin_name_entries[param][i].get().strip() if i < len(bin_name_entries[param]) else ""
-                }
-                param_data["inputs"].append(input_data)
-            inputs_data["parameters"][param] = param_data
-        
-        # Save cross coverage inputs
-        for gen in cross_coverage_entries:
-            cross_data = []
-            for cross_entry in cross_coverage_entries[gen]:
-                cross_data.append({
-                    "cross_name": cross_entry['name'].get().strip(),
-                    "coverpoints": cross_entry['coverpoints'].get().strip(),
-                    "illegal_bins": cross_entry['illegal'].get().strip(),
-                    "ignore_bins": cross_entry['ignore'].get().strip(),
-                    "operator": cross_entry['operator'].get().strip()
-                })
-            inputs_data["cross_coverage"][gen] = cross_data
-        
-        # Save WiFi specifications selections
-        for gen, var in wifi_specs_vars.items():
-            inputs_data["wifi_specifications"][gen] = var.get()
+        inputs_data = collect_inputs(entries, bins_entries, range_entries, bin_name_entries, check_vars, cross_model, wifi_specs_vars)
         
         output_file = "user_inputs.txt"
         with open(output_file, 'w') as f:
@@ -477,220 +75,29 @@ def save_inputs_to_txt(entries, bins_entries, range_entries, bin_name_entries, c
         messagebox.showerror("Error", f"Error saving inputs to TXT: {str(e)}")
         print(f"Detailed error: {e}")
 
-# Generate combined module definition for all WiFi specifications
-def generate_combined_module_definition(parameters, generations, allowed_values, wifi_specs_vars, user_inputs):
-    try:
-        selected_specs = [spec for spec, var in wifi_specs_vars.items() if var.get()]
-        
-        module_definition = "module rxpktgen_fcov;\n"
-        module_definition += "// Variables\n"
-
-        # Declare only parameters from Excel sheet
-        for param in parameters:
-            module_definition += f"integer {param.lower()};\n"
-        
-        module_definition += "\n// Clock signal\n"
-        module_definition += "logic clk;\n"
-        
-        module_definition += "\n// Events\n"
-        module_definition += "event trigger_cov;\n"
-        for gen in generations:
-            module_definition += f"event trigger_{gen.lower().replace(' ', '_')}_cov;\n"
-        
-        module_definition += "\n// Combined Coverage Groups\n"
-
-        for gen in generations:
-            if gen not in selected_specs:
-                continue
-            covergroup_name = f"pkt_{gen.lower().replace(' ', '_')}_cov"
-            module_definition += f"covergroup {covergroup_name} @trigger_{gen.lower().replace(' ', '_')}_cov;\n"
-
-            # Always include pkt_type coverpoint
-            if "pkt_type" in allowed_values[gen]:
-                coverpoint_name = "cov_pkt_type"
-                module_definition += f"    {coverpoint_name}: coverpoint pkt_type {{\n"
-                for item_type, item in allowed_values[gen]["pkt_type"]:
-                    if item_type == "value":
-                        module_definition += f"        bins pkt_type_tb = {{{item}}};\n"
-                    elif item_type == "range":
-                        min_val, max_val = item
-                        min_str = str(min_val) if min_val != float('-inf') else "inf"
-                        max_str = str(max_val) if max_val != float('inf') else "$"
-                        module_definition += f"        bins pkt_type_tb = {{[{min_str}:{max_str}]}};\n"
-                module_definition += "    }\n"
-
-            for param in parameters:
-                if param == "pkt_type":
-                    continue  # Skip pkt_type as it's already handled
-                if param in user_inputs and user_inputs[param]['use_default']:
-                    if param in allowed_values[gen] and allowed_values[gen][param]:
-                        coverpoint_name = f"cov_{param.lower()}"
-                        module_definition += f"    {coverpoint_name}: coverpoint {param.lower()} {{\n"
-                        for item_type, item in allowed_values[gen][param]:
-                            if item_type == "range":
-                                min_val, max_val = item
-                                min_str = str(min_val) if min_val != float('-inf') else "inf"
-                                max_str = str(max_val) if max_val != float('inf') else "$"
-                                default_bins_count = user_inputs[param]['default_bins']
-                                if default_bins_count is not None and default_bins_count > 1:
-                                    bin_name = f"{param.lower()}_v{min_str}_{max_str}"
-                                    module_definition += f"        bins {bin_name}[] = {{[{min_str}:{max_str}]}};\n"
-                                else:
-                                    bin_name = f"{param.lower()}_v{min_str}_{max_str}"
-                                    module_definition += f"        bins {bin_name}[] = {{[{min_str}:{max_str}]}};\n"
-                            elif item_type == "value":
-                                bin_name = f"{param.lower()}_v{item}_{item}"
-                                module_definition += f"        bins {bin_name}[] = {{{item}}};\n"
-                        module_definition += "    }\n"
-                else:
-                    if param in user_inputs and user_inputs[param]['custom_bins']:
-                        coverpoint_name = f"cov_{param.lower()}"
-                        module_definition += f"    {coverpoint_name}: coverpoint {param.lower()} {{\n"
-                        for bin_code in user_inputs[param]['custom_bins']:
-                            module_definition += bin_code + "\n"
-                        module_definition += "    }\n"
-
-            if gen in user_inputs and 'cross_coverage' in user_inputs[gen]:
-                for cross_code in user_inputs[gen]['cross_coverage']:
-                    module_definition += cross_code + "\n"
-
-            module_definition += f"endgroup: {covergroup_name}\n"
-            module_definition += f"{covergroup_name} = new();\n\n"
-        
-        module_definition += "// Tasks\n"
-        module_definition += "task run(integer dpi);\n"
-        module_definition += "    cover_rxpktgen(dpi);\n"
-        module_definition += "    -> trigger_cov;\n"
-        
-        # Generate if statements based on pkt_type values from Excel
-        pkt_type_row = df[df["Parameters"] == "pkt_type"]
-        for idx, gen in enumerate(generations):
-            pkt_type_value = pkt_type_row[gen].iloc[0] if not pkt_type_row.empty else None
-            if pd.notna(pkt_type_value):
-                try:
-                    pkt_type = int(pkt_type_value)
-                    gen_name = gen.lower().replace(" ", "_")
-                    module_definition += f"    if (pkt_type == {pkt_type}) -> trigger_{gen_name}_cov;\n"
-                except (ValueError, TypeError):
-                    print(f"Warning: Invalid pkt_type value for {gen}: {pkt_type_value}")
-        module_definition += "endtask: run\n\n"
-        
-        # Generate cover_rxpktgen task with parameters from Excel (excluding pkt_type)
-        task_params = [param.lower() for param in parameters if param != "pkt_type"]
-        module_definition += "task cover_rxpktgen(integer dpi);\n"
-        module_definition += f"    doi_rxpktgen_GetPktFuncCov(dpi, {', '.join(task_params)});\n"
-        module_definition += "endtask: cover_rxpktgen\n\n"
-        
-        module_definition += "endmodule\n"
-        return module_definition
-    except Exception as e:
-        print(f"Error generating combined module definition: {e}")
-        return ""
-
-# Check if Excel file exists
-excel_file = "data_fc_2.xlsx"
-if not os.path.exists(excel_file):
-    print(f"Error: Excel file '{excel_file}' not found in current directory.")
-    print(f"Current directory: {os.getcwd()}")
-    print("Please make sure the Excel file is in the same directory as this script.")
-    sys.exit(1)
-
-# Read Excel file with better error handling
+# Load and validate the spec workbook
+excel_file = DEFAULT_SPEC_FILE
 try:
-    df = pd.read_excel(excel_file, sheet_name="Sheet1", engine='openpyxl')
-    print(f"Successfully loaded Excel file: {excel_file}")
-    print(f"DataFrame shape: {df.shape}")
-    print(f"Columns: {df.columns.tolist()}")
-except FileNotFoundError:
-    print(f"Error: Excel file '{excel_file}' not found.")
-    sys.exit(1)
-except Exception as e:
-    print(f"Error reading Excel file: {e}")
-    print("Please check if the file is corrupted or in use by another application.")
+    spec = load_spec_cached(excel_file, DEFAULT_SHEET_NAME)
+except SpecError as e:
+    print(f"Error: {e}")
+    print("Please make sure the Excel file is in the same directory as this script.")
     sys.exit(1)
 
-# Validate DataFrame structure
-if df.empty:
-    print("Error: Excel file is empty.")
-    sys.exit(1)
+for warning in duplicate_row_warnings(spec):
+    print(f"Warning: {warning}")
 
-if "Parameters" not in df.columns:
-    print("Error: 'Parameters' column not found in Excel file.")
-    print(f"Available columns: {df.columns.tolist()}")
-    sys.exit(1)
+parameters = spec["parameters"]
+generations = spec["generations"]
+allowed_values = spec["allowed_values"]
+default_bins = spec["default_bins"]
+domain_index = get_domain_index(spec)
 
-if len(df.columns) < 3:
-    print("Error: Excel file must have at least 3 columns (Parameters, Bins, and at least one covergroup).")
-    sys.exit(1)
-
-try:
-    parameters = df["Parameters"].dropna().tolist()
-    if not parameters:
-        print("Error: No valid parameters found in 'Parameters' column.")
-        sys.exit(1)
-    
-    bins_column = df.columns[1]
-    print(f"Bins column: {bins_column}")
-    
-    generations = [col for col in df.columns[2:] if col.strip()]
-    if not generations:
-        print("Error: No generation columns found (should start from column 3).")
-        sys.exit(1)
-    
-    print(f"Found {len(parameters)} parameters and {len(generations)} generations")
-    print(f"Parameters: {parameters}")
-    print(f"Generations: {generations}")
-    
-except Exception as e:
-    print(f"Error processing DataFrame: {e}")
-    sys.exit(1)
-
-# Parse allowed values and default bins with better error handling
-try:
-    allowed_values = {}
-    default_bins = {}
-    
-    for param in parameters:
-        try:
-            param_rows = df[df["Parameters"] == param]
-            if param_rows.empty:
-                print(f"Warning: Parameter '{param}' not found in DataFrame")
-                default_bins[param] = None
-                continue
-            bins_value = param_rows[bins_column].iloc[0]
-            if pd.isna(bins_value):
-                default_bins[param] = None
-            else:
-                try:
-                    default_bins[param] = int(bins_value)
-                except (ValueError, TypeError):
-                    print(f"Warning: Invalid bins value for parameter '{param}': {bins_value}. Using default value None.")
-                    default_bins[param] = None
-        except Exception as e:
-            print(f"Error parsing default bins for parameter '{param}': {e}")
-            default_bins[param] = None
-    
-    for gen in generations:
-        allowed_values[gen] = {}
-        for param in parameters:
-            try:
-                param_rows = df[df["Parameters"] == param]
-                if param_rows.empty:
-                    print(f"Warning: Parameter '{param}' not found in DataFrame")
-                    allowed_values[gen][param] = []
-                    continue
-                cell_value = param_rows[gen].iloc[0]
-                parsed_values = parse_allowed_values(cell_value)
-                allowed_values[gen][param] = parsed_values
-            except Exception as e:
-                print(f"Error parsing values for parameter '{param}', generation '{gen}': {e}")
-                allowed_values[gen][param] = []
-    
-    print("Successfully parsed allowed values and default bins")
-    print(f"Default bins: {default_bins}")
-except Exception as e:
-    print(f"Error creating allowed_values dictionary: {e}")
-    sys.exit(1)
+print(f"Successfully loaded Excel file: {excel_file}")
+print(f"Found {len(parameters)} parameters and {len(generations)} generations")
+print(f"Parameters: {parameters}")
+print(f"Generations: {generations}")
+print(f"Default bins: {default_bins}")
 
 # Create GUI with error handling
 try:
@@ -716,7 +123,7 @@ try:
     canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
     note_label = ttk.Label(scrollable_frame,
-        text="Enhanced Note: Generates COMBINED functional coverage for all WiFi specifications in a single output file. Bin names default to {parameter}_v{start}_{end} format. Tick checkbox for default values from Excel. Use '+' to add up to 10 input fields for parameters and cross coverage models. Range field automatically divides a range into equal bins. The code automatically adapts to any number of WiFi specification columns in the Excel file. pkt_type is automatically set from Excel and not user-configurable.",
+        text="Enhanced Note: Generates COMBINED functional coverage for all WiFi specifications in a single output file. Bin names default to {parameter}_v{start}_{end} format. Tick checkbox for default values from Excel. Use '+' to add up to 10 input fields per parameter and any number of cross coverage models ('-' removes one). Range field automatically divides a range into equal bins, or log:N / pow2 / quantile:N bins. The code automatically adapts to any number of WiFi specification columns in the Excel file. pkt_type is automatically set from Excel and not user-configurable.",
         wraplength=1750, foreground="blue", font=("Arial", 10))
     note_label.grid(row=0, column=0, columnspan=12, pady=10, sticky="w")
 
@@ -727,9 +134,12 @@ try:
     bin_name_entries = {}
     check_vars = {}
     error_labels = {}
+    add_input_fields = {}
     
     cross_coverage_frames = {}
-    cross_coverage_entries = {}
+    # Cross definitions live in the model; the rows only display and edit it
+    cross_model = CrossModel.from_inputs(generations, {})
+    cross_row_vars = {}
 
     def toggle_entry_state(param):
         try:
@@ -843,16 +253,11 @@ try:
                     print(f"Error adding input field for {param}: {e}")
             
             add_input_field(input_frame, 0, param)
+            add_input_fields[param] = (add_input_field, input_frame)
             
             current_row += 1
             
-            combined_min, combined_max = get_combined_allowed_range(param, allowed_values)
-            if combined_min is not None and combined_max is not None:
-                min_str = str(combined_min) if combined_min != float('-inf') else "inf"
-                max_str = str(combined_max) if combined_max != float('inf') else "$"
-                info_text = f"Combined range: [{min_str}:{max_str}]"
-            else:
-                info_text = "No valid range found"
+            info_text = domain_index.combined_range_text(param)
             
             info_label = ttk.Label(param_frame, text=info_text, font=("Arial", 8), foreground="gray")
             info_label.grid(row=1, column=1, columnspan=2, sticky="w", padx=(0, 10))
@@ -868,6 +273,86 @@ try:
     cross_coverage_label.grid(row=current_row, column=0, sticky="w", pady=(20, 10))
     current_row += 1
     
+    def render_cross_rows(gen):
+        try:
+            frame = cross_coverage_frames[gen]
+            for widget in frame.winfo_children():
+                widget.destroy()
+            cross_row_vars[gen] = []
+            
+            header_frame = ttk.Frame(frame)
+            header_frame.grid(row=0, column=0, columnspan=8, sticky="ew", pady=(0, 5))
+            
+            header_frame.grid_columnconfigure(0, weight=1, minsize=200)
+            header_frame.grid_columnconfigure(1, weight=2, minsize=400)
+            header_frame.grid_columnconfigure(2, weight=2, minsize=400)
+            header_frame.grid_columnconfigure(3, weight=1, minsize=100)
+            header_frame.grid_columnconfigure(4, weight=2, minsize=400)
+            header_frame.grid_columnconfigure(5, weight=0, minsize=80)
+            header_frame.grid_columnconfigure(6, weight=0, minsize=140)
+            
+            ttk.Label(header_frame, text="Cross Name", font=("Arial", 9)).grid(row=0, column=0, sticky="w", padx=5, pady=2)
+            ttk.Label(header_frame, text="Coverpoints (comma-separated)", font=("Arial", 9)).grid(row=0, column=1, sticky="w", padx=5, pady=2)
+            ttk.Label(header_frame, text="Illegal Bins (semicolon-separated)", font=("Arial", 9)).grid(row=0, column=2, sticky="w", padx=5, pady=2)
+            ttk.Label(header_frame, text="Operator", font=("Arial", 9)).grid(row=0, column=3, sticky="w", padx=5, pady=2)
+            ttk.Label(header_frame, text="Ignore Bins", font=("Arial", 9)).grid(row=0, column=4, sticky="w", padx=5, pady=2)
+            ttk.Label(header_frame, text="Auto Ignore", font=("Arial", 9)).grid(row=0, column=5, sticky="w", padx=5, pady=2)
+            ttk.Label(header_frame, text="Mode", font=("Arial", 9)).grid(row=0, column=6, sticky="w", padx=5, pady=2)
+            
+            for index, cross in enumerate(cross_model.crosses[gen]):
+                add_cross_row(frame, gen, index, cross)
+            
+            add_btn = ttk.Button(frame, text="+", width=3, command=lambda: add_cross(gen))
+            add_btn.grid(row=len(cross_model.crosses[gen]) + 1, column=7, padx=5, pady=2)
+        except Exception as e:
+            print(f"Error rendering cross coverage rows for {gen}: {e}")
+    
+    # One row of widgets bound to cross_model.crosses[gen][index]: every edit
+    # is written straight into the model, which generation reads
+    def add_cross_row(frame, gen, index, cross):
+        input_row = index + 1
+        row_vars = {}
+        
+        def bind(var, field):
+            var.trace_add("write", lambda *_: cross_model.update(gen, index, field, var.get()))
+            row_vars[field] = var
+            return var
+        
+        cross_name_entry = ttk.Entry(frame, width=25, textvariable=bind(tk.StringVar(value=cross["cross_name"]), "cross_name"))
+        cross_name_entry.grid(row=input_row, column=0, sticky="ew", padx=5, pady=2)
+        
+        coverpoints_entry = ttk.Entry(frame, width=50, textvariable=bind(tk.StringVar(value=cross["coverpoints"]), "coverpoints"))
+        coverpoints_entry.grid(row=input_row, column=1, sticky="ew", padx=5, pady=2)
+        
+        illegal_entry = ttk.Entry(frame, width=50, textvariable=bind(tk.StringVar(value=cross["illegal_bins"]), "illegal_bins"))
+        illegal_entry.grid(row=input_row, column=2, sticky="ew", padx=5, pady=2)
+        
+        operator_entry = ttk.Entry(frame, width=10, textvariable=bind(tk.StringVar(value=cross["operator"]), "operator"))
+        operator_entry.grid(row=input_row, column=3, sticky="ew", padx=5, pady=2)
+        
+        ignore_entry = ttk.Entry(frame, width=50, textvariable=bind(tk.StringVar(value=cross["ignore_bins"]), "ignore_bins"))
+        ignore_entry.grid(row=input_row, column=4, sticky="ew", padx=5, pady=2)
+        
+        auto_ignore_check = ttk.Checkbutton(frame, variable=bind(tk.BooleanVar(value=bool(cross["auto_ignore"])), "auto_ignore"))
+        auto_ignore_check.grid(row=input_row, column=5, padx=5, pady=2)
+        
+        mode_entry = ttk.Entry(frame, width=16, textvariable=bind(tk.StringVar(value=cross["cross_mode"]), "cross_mode"))
+        mode_entry.grid(row=input_row, column=6, sticky="ew", padx=5, pady=2)
+        
+        remove_btn = ttk.Button(frame, text="-", width=3, command=lambda: remove_cross(gen, index))
+        remove_btn.grid(row=input_row, column=7, padx=5, pady=2)
+        
+        # Tk variables are unset once their Python object is collected
+        cross_row_vars[gen].append(row_vars)
+    
+    def add_cross(gen):
+        cross_model.add(gen)
+        render_cross_rows(gen)
+    
+    def remove_cross(gen, index):
+        cross_model.remove(gen, index)
+        render_cross_rows(gen)
+    
     for gen in generations:
         try:
             cross_frame = ttk.LabelFrame(scrollable_frame, text=f"Cross Coverage for {gen}", 
@@ -880,64 +365,7 @@ try:
             cross_frame.grid_columnconfigure(4, weight=2)
             cross_coverage_frames[gen] = cross_frame
             
-            cross_coverage_entries[gen] = []
-            
-            def add_cross_coverage_field(frame, row, gen=gen):
-                try:
-                    if row >= 10:
-                        return
-                    
-                    if row == 0:
-                        header_frame = ttk.Frame(frame)
-                        header_frame.grid(row=0, column=0, columnspan=5, sticky="ew", pady=(0, 5))
-                        
-                        header_frame.grid_columnconfigure(0, weight=1, minsize=200)
-                        header_frame.grid_columnconfigure(1, weight=2, minsize=400)
-                        header_frame.grid_columnconfigure(2, weight=2, minsize=400)
-                        header_frame.grid_columnconfigure(3, weight=1, minsize=100)
-                        header_frame.grid_columnconfigure(4, weight=2, minsize=400)
-                        
-                        ttk.Label(header_frame, text="Cross Name", font=("Arial", 9)).grid(row=0, column=0, sticky="w", padx=5, pady=2)
-                        ttk.Label(header_frame, text="Coverpoints (comma-separated)", font=("Arial", 9)).grid(row=0, column=1, sticky="w", padx=5, pady=2)
-                        ttk.Label(header_frame, text="Illegal Bins (semicolon-separated)", font=("Arial", 9)).grid(row=0, column=2, sticky="w", padx=5, pady=2)
-                        ttk.Label(header_frame, text="Operator", font=("Arial", 9)).grid(row=0, column=3, sticky="w", padx=5, pady=2)
-                        ttk.Label(header_frame, text="Ignore Bins", font=("Arial", 9)).grid(row=0, column=4, sticky="w", padx=5, pady=2)
-                    
-                    input_row = row + 1
-                    
-                    cross_name_entry = ttk.Entry(frame, width=25)
-                    cross_name_entry.insert(0, f"cross_{gen.lower().replace(' ', '_')}_{row + 1}")
-                    cross_name_entry.grid(row=input_row, column=0, sticky="ew", padx=5, pady=2)
-                    
-                    coverpoints_entry = ttk.Entry(frame, width=50)
-                    coverpoints_entry.grid(row=input_row, column=1, sticky="ew", padx=5, pady=2)
-                    
-                    illegal_entry = ttk.Entry(frame, width=50)
-                    illegal_entry.grid(row=input_row, column=2, sticky="ew", padx=5, pady=2)
-                    
-                    operator_entry = ttk.Entry(frame, width=10)
-                    operator_entry.insert(0, "&&")
-                    operator_entry.grid(row=input_row, column=3, sticky="ew", padx=5, pady=2)
-                    
-                    ignore_entry = ttk.Entry(frame, width=50)
-                    ignore_entry.grid(row=input_row, column=4, sticky="ew", padx=5, pady=2)
-                    
-                    cross_coverage_entries[gen].append({
-                        'name': cross_name_entry,
-                        'coverpoints': coverpoints_entry,
-                        'illegal': illegal_entry,
-                        'operator': operator_entry,
-                        'ignore': ignore_entry
-                    })
-                    
-                    if row < 9:
-                        plus_btn = ttk.Button(frame, text="+", width=3,
-                                              command=lambda: add_cross_coverage_field(frame, row + 1, gen))
-                        plus_btn.grid(row=input_row, column=5, padx=5, pady=2)
-                except Exception as e:
-                    print(f"Error adding cross coverage field for {gen}: {e}")
-            
-            add_cross_coverage_field(cross_frame, 0, gen)
+            render_cross_rows(gen)
             
             current_row += 1
             
@@ -961,96 +389,150 @@ try:
     
     current_row += 1
     
+    split_output_var = tk.BooleanVar(value=False)
+    split_checkbox = ttk.Checkbutton(scrollable_frame, text="Split output: one coverage_<gen>.sv per WiFi specification, included from the combined file",
+                                     variable=split_output_var)
+    split_checkbox.grid(row=current_row, column=0, sticky="w", padx=5, pady=5)
+    
+    current_row += 1
+    
     def generate_coverage():
         try:
-            user_inputs = {}
+            inputs_data = collect_inputs(entries, bins_entries, range_entries, bin_name_entries,
+                                         check_vars, cross_model, wifi_specs_vars)
+            user_inputs, errors = build_user_inputs(spec, inputs_data, samples=value_samples)
             
-            for param in parameters:
-                if param == "pkt_type":
-                    user_inputs[param] = {
-                        'use_default': True,  # Always use default for pkt_type
-                        'default_bins': default_bins[param],
-                        'custom_bins': []
-                    }
-                    continue
-                user_inputs[param] = {
-                    'use_default': check_vars[param].get(),
-                    'default_bins': default_bins[param],
-                    'custom_bins': []
-                }
-                
-                if not check_vars[param].get():
-                    for i, entry in enumerate(entries[param]):
-                        input_text = entry.get().strip()
-                        if not input_text:
-                            continue
-                        
-                        if i < len(error_labels[param]):
-                            error_labels[param][i].config(text="")
-                        
-                        parsed = parse_user_input(input_text)
-                        if parsed is None:
-                            if i < len(error_labels[param]):
-                                error_labels[param][i].config(text="Invalid input format")
-                            continue
-                        
-                        if not is_input_within_combined_range(parsed, param, allowed_values):
-                            max_range = get_max_allowed_range(param, allowed_values)
-                            if i < len(error_labels[param]):
-                                error_labels[param][i].config(text=f"Out of range: {max_range}")
-                            continue
-                        
-                        bins_count = None
-                        range_div = None
-                        bin_name = ""
-                        
-                        if i < len(bins_entries[param]):
-                            bins_count = parse_bins_input(bins_entries[param][i].get())
-                       874
-                        if i < len(range_entries[param]):
-                            range_div = parse_range_input(range_entries[param][i].get())
-                        if i < len(bin_name_entries[param]):
-                            bin_name = bin_name_entries[param][i].get().strip()
-                        
-                        if not bin_name:
-                            bin_name = get_default_bin_name(parsed, param.lower())
-                        
-                        bin_code = generate_systemverilog_bins(parsed, bins_count, range_div, bin_name, param.lower())
-                        if bin_code:
-                            user_inputs[param]['custom_bins'].append(bin_code)
+            for param in error_labels:
+                for i, error_label in enumerate(error_labels[param]):
+                    error_label.config(text=errors.get(param, {}).get(i, ""))
             
-            for gen in generations:
-                if gen in cross_coverage_entries:
-                    user_inputs[gen] = {'cross_coverage': []}
-                    for cross_entry in cross_coverage_entries[gen]:
-                        cross_name = cross_entry['name'].get().strip()
-                        coverpoints_text = cross_entry['coverpoints'].get().strip()
-                        illegal_text = cross_entry['illegal'].get().strip()
-                        ignore_text = cross_entry['ignore'].get().strip()
-                        operator = cross_entry['operator'].get().strip() or "&&"
-                        
-                        if cross_name and coverpoints_text:
-                            coverpoints = [cp.strip() for cp in coverpoints_text.split(',') if cp.strip()]
-                            if coverpoints:
-                                illegal_bins = parse_illegal_bins(illegal_text)
-                                ignore_bins = parse_ignore_bins(ignore_text)
-                                cross_code = generate_cross_coverage_code(cross_name, coverpoints, illegal_bins, ignore_bins, operator)
-                                user_inputs[gen]['cross_coverage'].append(cross_code)
+            wifi_specs = {gen: var.get() for gen, var in wifi_specs_vars.items()}
+            problems = check_bin_budget(estimate_bins(spec, user_inputs, wifi_specs))
+            if problems and not messagebox.askyesno(
+                    "Bin Budget Exceeded",
+                    "The following coverpoints/crosses exceed the bin budget:\n" + "\n".join(problems) + "\n\nGenerate anyway?"):
+                return
             
-            combined_code = generate_combined_module_definition(
-                parameters, generations, allowed_values, wifi_specs_vars, user_inputs
-            )
+            if split_output_var.get():
+                results = write_split_output(parameters, generations, allowed_values, wifi_specs, user_inputs,
+                                             spec["pkt_types"], DEFAULT_OUTPUT_FILE)
+                report = "\n".join(f"{'Rewritten' if changed else 'Unchanged'}: {path}" for path, changed in results)
+                messagebox.showinfo("Success", f"Split functional coverage generated successfully!\n{report}")
+                return
             
-            output_file = "combined_wifi_functional_coverage.sv"
-            with open(output_file, 'w') as f:
-                f.write(combined_code)
+            output_file, changed = write_output(iter_combined_module(
+                parameters, generations, allowed_values, wifi_specs, user_inputs, spec["pkt_types"]
+            ), DEFAULT_OUTPUT_FILE)
             
-            messagebox.showinfo("Success", f"Combined functional coverage generated successfully!\nSaved to: {output_file}")
+            if changed:
+                messagebox.showinfo("Success", f"Combined functional coverage generated successfully!\nSaved to: {output_file}")
+            else:
+                messagebox.showinfo("Success", f"Combined functional coverage is unchanged.\n{output_file} was not rewritten.")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error generating coverage: {str(e)}")
             print(f"Detailed error: {e}")
     
+    def show_bin_estimate():
+        try:
+            inputs_data = collect_inputs(entries, bins_entries, range_entries, bin_name_entries,
+                                         check_vars, cross_model, wifi_specs_vars)
+            user_inputs, _ = build_user_inputs(spec, inputs_data, samples=value_samples)
+            wifi_specs = {gen: var.get() for gen, var in wifi_specs_vars.items()}
+            estimate = estimate_bins(spec, user_inputs, wifi_specs)
+            problems = check_bin_budget(estimate)
+            text = format_estimate(estimate)
+            notes = check_cross_clauses(estimate)
+            if notes:
+                text += "\n\nCross clauses:\n" + "\n".join(notes)
+            if problems:
+                text += "\n\nOver budget:\n" + "\n".join(problems)
+            messagebox.showinfo("Bin Count Estimate", text)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error estimating bins: {str(e)}")
+            print(f"Detailed error: {e}")
+    
+    # Observed values per parameter for quantile:N splits, loaded on demand
+    value_samples = {}
+    
+    def load_value_samples():
+        try:
+            path = filedialog.askopenfilename(title="Load Value Samples",
+                                              filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
+            if not path:
+                return
+            from bin_strategies import load_samples
+            value_samples.clear()
+            value_samples.update(load_samples(path))
+            counts = ", ".join(f"{param}: {len(values)}" for param, values in value_samples.items())
+            messagebox.showinfo("Samples Loaded", f"Loaded value samples from {path}\n{counts}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error loading value samples: {str(e)}")
+            print(f"Detailed error: {e}")
+    
+    def save_session():
+        try:
+            path = filedialog.asksaveasfilename(title="Save Session", defaultextension=".json",
+                                                filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
+            if not path:
+                return
+            inputs_data = collect_inputs(entries, bins_entries, range_entries, bin_name_entries,
+                                         check_vars, cross_model, wifi_specs_vars)
+            _, changed = save_inputs(inputs_data, path)
+            if changed:
+                messagebox.showinfo("Session Saved", f"Session saved to: {path}")
+            else:
+                messagebox.showinfo("Session Saved", f"Session is unchanged.\n{path} was not rewritten.")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error saving session: {str(e)}")
+            print(f"Detailed error: {e}")
+    
+    # Restore parameter rows, crosses and WiFi specification selections from a
+    # session or saved-inputs file
+    def load_session():
+        try:
+            path = filedialog.askopenfilename(title="Load Session",
+                                              filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
+            if not path:
+                return
+            inputs_data = load_inputs(path)
+            
+            dropped = []
+            for param, param_data in inputs_data["parameters"].items():
+                if param not in add_input_fields:
+                    continue
+                rows = param_data.get("inputs", [])
+                add_input_field, input_frame = add_input_fields[param]
+                while len(entries[param]) < min(len(rows), 10):
+                    add_input_field(input_frame, len(entries[param]), param)
+                if len(rows) > len(entries[param]):
+                    dropped.append(param)
+                for i in range(len(entries[param])):
+                    row = rows[i] if i < len(rows) else {}
+                    for field, widgets in (("input", entries), ("bins", bins_entries),
+                                           ("range", range_entries), ("bin_name", bin_name_entries)):
+                        widget = widgets[param][i]
+                        widget.configure(state="normal")
+                        widget.delete(0, tk.END)
+                        widget.insert(0, row.get(field, ""))
+                check_vars[param].set(bool(param_data.get("use_default", False)))
+                toggle_entry_state(param)
+            
+            cross_model.load(inputs_data["cross_coverage"])
+            for gen in generations:
+                render_cross_rows(gen)
+            
+            for gen, var in wifi_specs_vars.items():
+                var.set(bool(inputs_data["wifi_specifications"].get(gen, True)))
+            
+            message = f"Session loaded from: {path}\n{len(cross_model)} cross coverage models"
+            if dropped:
+                message += f"\nOnly the first 10 input rows were loaded for: {', '.join(dropped)}"
+            messagebox.showinfo("Session Loaded", message)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error loading session: {str(e)}")
+            print(f"Detailed error: {e}")
+    
     # Create a frame to hold buttons for centering
     button_frame = ttk.Frame(scrollable_frame)
     button_frame.grid(row=current_row, column=0, sticky="ew", pady=10)
@@ -1063,15 +545,27 @@ try:
     save_inputs_btn = ttk.Button(button_frame, text="Save Inputs to JSON", 
                                 command=lambda: save_inputs_to_json(entries, bins_entries, range_entries, 
                                                                    bin_name_entries, check_vars, 
-                                                                   cross_coverage_entries, wifi_specs_vars))
+                                                                   cross_model, wifi_specs_vars))
     save_inputs_btn.pack(side="left", padx=10, pady=10)
     
     download_inputs_btn = ttk.Button(button_frame, text="Download Input Fields", 
                                     command=lambda: save_inputs_to_txt(entries, bins_entries, range_entries, 
                                                                       bin_name_entries, check_vars, 
-                                                                      cross_coverage_entries, wifi_specs_vars))
+                                                                      cross_model, wifi_specs_vars))
     download_inputs_btn.pack(side="left", padx=10, pady=10)
     
+    estimate_btn = ttk.Button(button_frame, text="Estimate Bin Counts", command=show_bin_estimate)
+    estimate_btn.pack(side="left", padx=10, pady=10)
+    
+    samples_btn = ttk.Button(button_frame, text="Load Value Samples", command=load_value_samples)
+    samples_btn.pack(side="left", padx=10, pady=10)
+    
+    save_session_btn = ttk.Button(button_frame, text="Save Session", command=save_session)
+    save_session_btn.pack(side="left", padx=10, pady=10)
+    
+    load_session_btn = ttk.Button(button_frame, text="Load Session", command=load_session)
+    load_session_btn.pack(side="left", padx=10, pady=10)
+    
     current_row += 1
     
     instructions = """
@@ -1079,17 +573,24 @@ try:
     1. Check the checkbox to use default values from Excel for a parameter
     2. When unchecked, enter custom values in the format: [min:max] for ranges or val1,val2,val3 for lists
     3. Use the Bins field to specify number of bins (optional)
-    4. Use the Range field to divide a range into equal-sized bins (optional)
+    4. Use the Range field to divide a range into equal-sized bins (optional). Enter log:N for N log-scale bins, pow2 for power-of-two boundaries, or quantile:N for N bins holding equal shares of the loaded value samples
     5. Bin Name will be auto-generated if left empty in format: {parameter}_v{start}_{end}
-    6. Configure multiple cross coverage models for each WiFi specification using '+' button
-    7. Illegal bins are optional and should be semicolon-separated
-    8. Ignore bins are optional, format: binsof(cov_name) intersect {val1,val2} && binsof(cov_name2) intersect {val3}
-    9. Operator field specifies the operator (e.g., &&) between ignore bins clauses
-    10. Select which WiFi specifications to include in the combined output
-    11. Click 'Generate' to create a single combined functional coverage file
-    12. Click 'Save Inputs to JSON' to save all user inputs to a JSON file
-    13. Click 'Download Input Fields' to save all user inputs to a text file in JSON format
-    14. pkt_type is automatically set from Excel and not user-configurable
+    6. Configure any number of cross coverage models for each WiFi specification using the '+' button; '-' removes a model
+    7. Illegal bins are optional and should be semicolon-separated conditions on the crossed parameters, e.g. mcs=3; mcs!=3 && chan_bw inside {[20:40]}; !(nss<2 || mcs>=8)
+    8. Ignore bins are optional, format: binsof(cov_name) intersect {val1,[lo:hi]} && binsof(cov_name2) intersect {val3}; || , !, parentheses and $ bounds are supported
+    9. Tick Auto Ignore to add ignore bins for cross bins this WiFi specification's allowed values make unreachable
+    10. Operator field (&& or ||) joins the clauses of each plain binsof && binsof ignore bins term; the estimate counts what is emitted
+    11. Select which WiFi specifications to include in the combined output
+    12. Click 'Generate' to create a single combined functional coverage file (you are asked first if any coverpoint or cross exceeds the bin budget)
+    13. Click 'Save Inputs to JSON' to save all user inputs to a JSON file
+    14. Click 'Download Input Fields' to save all user inputs to a text file in JSON format
+    15. pkt_type is automatically set from Excel and not user-configurable
+    16. Click 'Estimate Bin Counts' to see per-coverpoint bin counts and exact per-cross counts after ignore/illegal bins, plus clauses that match nothing or overlap
+    17. Click 'Load Value Samples' to load observed values per parameter (JSON: {"pkt_len": [64, 1500, ...]}) for quantile:N splits
+    18. Input rows of a parameter that overlap are checked on Generate: exact duplicates are dropped, per-value rows lose values an earlier per-value row already bins, and every other overlap is flagged next to the row
+    19. Tick 'Split output' to write each WiFi specification's covergroup to its own coverage_<gen>.sv, included from the combined file; only files whose content changed are rewritten
+    20. Click 'Save Session' to save all inputs, including every cross coverage model, to a file of your choice, and 'Load Session' to restore them (saved inputs JSON files load too)
+    21. Mode of a wide cross: full (default) crosses every bin; pairwise or N-wise keeps only a covering array of tuples, as named cross bins, in which every combination of bins of any 2 (or N) coverpoints appears; pairwise crosses or N-wise crosses emits one full cross per 2 (or N) coverpoints instead. 3-wise and above over many wide coverpoints can take minutes to build, during which the window does not respond
     
     The generated code will automatically handle all WiFi specifications in a single module.
     """
@@ -0,0 +1,125 @@
+import math
+import itertools
+
+import numpy as np
+
+from bin_estimator import coverpoint_bin_groups, coverpoint_names
+from cross_reachability import reachable_bin_sets
+
+# t-wise covering arrays for wide crosses. A full cross of six or seven
+# coverpoints has millions of bins that never close; a covering array is a
+# much smaller set of rows (one bin index per coverpoint) in which every
+# combination of bins of any t coverpoints appears in at least one row.
+#
+# Built with IPOG (in-parameter-order): start from the full product of the t
+# largest coverpoints, then add one coverpoint at a time. Horizontal growth
+# gives each existing row the bin that covers the most still-uncovered
+# t-tuples; vertical growth places the leftovers into rows with free slots or
+# new rows. Uncovered t-tuples are kept per (t-1)-subset of earlier coverpoints
+# as NumPy boolean arrays, so a row's gain for every candidate bin is a sum of
+# array slices. Slots no tuple needed are filled with bin 0.
+
+# Rows of a strength-t covering array over coverpoints with the given bin
+# counts; each row is a tuple of bin indices in the order of sizes
+def covering_array(sizes, strength=2):
+    n = len(sizes)
+    if n == 0 or min(sizes) == 0:
+        return []
+    t = max(1, min(strength, n))
+    order = sorted(range(n), key=lambda p: -sizes[p])
+    s = [sizes[p] for p in order]
+
+    rows = [list(row) for row in itertools.product(*(range(v) for v in s[:t]))]
+    for k in range(t, n):
+        uncovered = {subset: np.ones([s[p] for p in subset] + [s[k]], dtype=bool)
+                     for subset in itertools.combinations(range(k), t - 1)}
+
+        # Horizontal growth
+        for row in rows:
+            gain = np.zeros(s[k], dtype=np.int64)
+            hit = []
+            for subset, arr in uncovered.items():
+                index = tuple(row[p] for p in subset)
+                if None in index:
+                    continue
+                gain += arr[index]
+                hit.append((arr, index))
+            best = int(gain.argmax())
+            if gain[best] == 0:
+                row.append(None)
+                continue
+            row.append(best)
+            for arr, index in hit:
+                arr[index + (best,)] = False
+
+        # Vertical growth; a row without free slots cannot take an uncovered tuple
+        open_rows = [row for row in rows if None in row]
+        for subset, arr in uncovered.items():
+            columns = subset + (k,)
+            for combo in np.argwhere(arr):
+                combo = tuple(int(v) for v in combo)
+                if not arr[combo]:
+                    continue
+                for row in open_rows:
+                    if all(row[p] is None or row[p] == v for p, v in zip(columns, combo)):
+                        break
+                else:
+                    row = [None] * (k + 1)
+                    rows.append(row)
+                    open_rows.append(row)
+                for p, v in zip(columns, combo):
+                    row[p] = v
+                # Filling slots may complete other tuples of this row
+                for other, other_arr in uncovered.items():
+                    index = tuple(row[p] for p in other + (k,))
+                    if None not in index:
+                        other_arr[index] = False
+
+    position = {p: i for i, p in enumerate(order)}
+    return [tuple(0 if row[position[p]] is None else row[position[p]] for p in range(n)) for row in rows]
+
+# Above this many t-tuples to cover, building the array takes seconds to
+# minutes (3-wise over 6 coverpoints of 20 bins: 160000 tuples, about 20 s)
+SLOW_TUPLE_COUNT = 50000
+
+# Number of t-tuples of bins a strength-t covering array has to cover
+def count_t_tuples(sizes, strength=2):
+    t = min(strength, len(sizes))
+    return sum(math.prod(sizes[p] for p in columns) for columns in itertools.combinations(range(len(sizes)), t))
+
+# t-tuples of bins ({(coverpoint, bin), ...} combinations) no row covers
+def uncovered_tuples(rows, sizes, strength=2):
+    t = min(strength, len(sizes))
+    missing = []
+    for columns in itertools.combinations(range(len(sizes)), t):
+        seen = {tuple(row[p] for p in columns) for row in rows}
+        for combo in itertools.product(*(range(sizes[p]) for p in columns)):
+            if combo not in seen:
+                missing.append(tuple(zip(columns, combo)))
+    return missing
+
+# Cross bins of a strength-t covering-array cross of gen, each a dict
+# {coverpoint: IntervalSet of the values in that coverpoint's bin}. Only bins
+# gen's allowed values can reach take part; a tuple holding an unreachable bin
+# could never be hit, so the cross could never close.
+def covering_tuples(spec, user_inputs, gen, coverpoints, strength=2):
+    names = coverpoint_names(spec)
+    groups = coverpoint_bin_groups(spec, user_inputs, gen)
+    bins = []
+    for cp in coverpoints:
+        if names.get(cp) not in groups:
+            raise ValueError(f"'{cp}' is not a coverpoint of {gen}")
+        try:
+            cp_bins = reachable_bin_sets(spec, gen, names[cp], groups[names[cp]])
+        except ValueError as e:
+            raise ValueError(f"{cp} {e}") from None
+        if not cp_bins:
+            raise ValueError(f"{cp} has no bin {gen} can reach")
+        bins.append(cp_bins)
+    sizes = [len(cp_bins) for cp_bins in bins]
+    tuples = count_t_tuples(sizes, strength)
+    if tuples > SLOW_TUPLE_COUNT:
+        print(f"Warning: the {strength}-wise covering array of {gen} {', '.join(coverpoints)} has {tuples} "
+              "bin combinations to cover; building it may take minutes")
+    return [{cp: bins[p][index] for p, (cp, index) in enumerate(zip(coverpoints, row))}
+            for row in covering_array(sizes, strength)]
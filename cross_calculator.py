@@ -0,0 +1,152 @@
+import numpy as np
+
+from interval_set import IntervalSet
+from bin_expressions import Binsof, Not, And, render_select, select_terms
+
+# Exact effective bin count of a cross after ignore_bins and illegal_bins.
+#
+# A select expression only looks at each coverpoint through its binsof atoms,
+# so the bins of a coverpoint fall into classes with the same atom results
+# (which binsof ... intersect {...} sets they touch). The cross is counted over
+# the product of classes, weighted by class sizes, instead of over the product
+# of bins: a 65535-value pkt_len coverpoint crossed with anything collapses to
+# at most 2^atoms classes. The class product is enumerated in chunks with NumPy
+# so even large products never build one big array.
+
+CHUNK_SIZE = 1 << 16
+
+# Binsof atoms of an expression, grouped by coverpoint: {cp: [items, ...]}
+def _collect_atoms(node, atoms):
+    if isinstance(node, Binsof):
+        if node.items is not None and node.items not in atoms.setdefault(node.coverpoint, []):
+            atoms[node.coverpoint].append(node.items)
+    elif isinstance(node, Not):
+        _collect_atoms(node.operand, atoms)
+    else:
+        for child in node.operands:
+            _collect_atoms(child, atoms)
+    return atoms
+
+# Split a coverpoint's bins into classes by which atom sets they intersect.
+# Returns {signature: count}; count is None when the class is unbounded.
+def coverpoint_classes(groups, atom_sets):
+    classes = {}
+
+    def add(signature, count):
+        if signature not in classes:
+            classes[signature] = count
+        elif classes[signature] is None or count is None:
+            classes[signature] = None
+        else:
+            classes[signature] += count
+
+    for group in groups:
+        if group.mode == "each":
+            # One bin per value: refine the value set by each atom set in turn
+            parts = [(group.values, ())]
+            for atom in atom_sets:
+                refined = []
+                for part, signature in parts:
+                    inside, outside = part & atom, part - atom
+                    if inside:
+                        refined.append((inside, signature + (True,)))
+                    if outside:
+                        refined.append((outside, signature + (False,)))
+                parts = refined
+            for part, signature in parts:
+                add(signature, part.cardinality())
+        elif group.is_open and group.mode == "fixed":
+            # Open-ended fixed bins are split by the tool; the atoms decide nothing here
+            add(tuple(bool(group.values & atom) for atom in atom_sets), group.size)
+        else:
+            for bin_values in group.iter_bin_sets():
+                add(tuple(bool(bin_values & atom) for atom in atom_sets), 1)
+    return classes
+
+# Vectorized evaluation of a select AST; columns[cp] is a (rows x atoms) bool array
+def _evaluate(node, columns, atom_index, rows):
+    if isinstance(node, Binsof):
+        if node.coverpoint not in columns:
+            return np.zeros(rows, dtype=bool)
+        if node.items is None:
+            return np.ones(rows, dtype=bool)
+        return columns[node.coverpoint][:, atom_index[node.coverpoint][node.items]]
+    if isinstance(node, Not):
+        return ~_evaluate(node.operand, columns, atom_index, rows)
+    results = [_evaluate(child, columns, atom_index, rows) for child in node.operands]
+    return np.logical_and.reduce(results) if isinstance(node, And) else np.logical_or.reduce(results)
+
+# Exact counts for one cross. cp_groups maps each crossed coverpoint to its
+# BinGroups; ignore_expr is a select AST (or None) and illegal_exprs a list of
+# select ASTs. Returns {"bins", "ignored", "illegal", "effective", "clauses",
+# "dead", "overlaps"}; counts are None when a coverpoint is unbounded.
+# Clauses are the ignore expression's top-level || terms and each illegal
+# condition; a dead clause matches no cross bin, an overlap is a pair of
+# clauses that both match some cross bin.
+def effective_cross_bins(cp_groups, ignore_expr=None, illegal_exprs=()):
+    ignore_terms = select_terms(ignore_expr)
+    clauses = ([("ignore", f"ignore {k}", term) for k, term in enumerate(ignore_terms, 1)] +
+               [("illegal", f"illegal {k}", expr) for k, expr in enumerate(illegal_exprs, 1)])
+    atoms = {}
+    for _, _, node in clauses:
+        _collect_atoms(node, atoms)
+
+    cps = list(cp_groups)
+    atom_index = {cp: {items: k for k, items in enumerate(atoms.get(cp, []))} for cp in cps}
+    signatures, counts = [], []
+    for cp in cps:
+        classes = coverpoint_classes(cp_groups[cp], [IntervalSet.from_items(items) for items in atoms.get(cp, [])])
+        signatures.append(np.array(list(classes), dtype=bool).reshape(len(classes), len(atom_index[cp])))
+        counts.append(list(classes.values()))
+
+    bounded = all(c is not None for cp_counts in counts for c in cp_counts)
+    total = 1
+    for cp_counts in counts:
+        total *= sum(c for c in cp_counts if c is not None) if bounded else 1
+    # int64 weights while the whole cross fits; Python ints beyond that
+    dtype = np.int64 if total < (1 << 62) else object
+    weights_by_cp = [np.array([c if bounded else 1 for c in cp_counts], dtype=dtype) for cp_counts in counts]
+
+    shape = tuple(len(cp_counts) for cp_counts in counts)
+    n_combos = int(np.prod(shape, dtype=object)) if cps else 0
+    n = len(clauses)
+    matched = [0] * n
+    pair_counts = {}
+    excluded = 0
+    illegal_count = 0
+    for start in range(0, n_combos, CHUNK_SIZE):
+        flat = np.arange(start, min(start + CHUNK_SIZE, n_combos))
+        index = np.unravel_index(flat, shape)
+        rows = len(flat)
+        columns = {cp: signatures[k][index[k]] for k, cp in enumerate(cps)}
+        weight = weights_by_cp[0][index[0]]
+        for k in range(1, len(cps)):
+            weight = weight * weights_by_cp[k][index[k]]
+        hits = [_evaluate(node, columns, atom_index, rows) for _, _, node in clauses]
+        any_illegal = np.zeros(rows, dtype=bool)
+        any_clause = np.zeros(rows, dtype=bool)
+        for i, (kind, _, _) in enumerate(clauses):
+            matched[i] += int(weight[hits[i]].sum())
+            any_clause |= hits[i]
+            if kind == "illegal":
+                any_illegal |= hits[i]
+            for j in range(i + 1, n):
+                both = hits[i] & hits[j]
+                if both.any():
+                    pair_counts[(i, j)] = pair_counts.get((i, j), 0) + int(weight[both].sum())
+        excluded += int(weight[any_clause].sum())
+        illegal_count += int(weight[any_illegal].sum())
+
+    texts = {i: f"{label}: {render_select(node)}" for i, (_, label, node) in enumerate(clauses)}
+    if n_combos == 0:
+        total = excluded = illegal_count = 0
+        bounded = True
+    return {
+        "bins": total if bounded else None,
+        "ignored": excluded - illegal_count if bounded else None,
+        "illegal": illegal_count if bounded else None,
+        "effective": total - excluded if bounded else None,
+        "clauses": [texts[i] for i in range(n)],
+        "dead": [texts[i] for i in range(n) if matched[i] == 0],
+        "overlaps": [(texts[i], texts[j], count if bounded else None) for (i, j), count in sorted(pair_counts.items())],
+    }
@@ -0,0 +1,71 @@
+# In-memory cross coverage definitions, independent of any widget. The GUI binds
+# its cross rows to a CrossModel and generation reads the model directly, so
+# there is no limit on crosses per generation. to_inputs/from_inputs use the
+# "cross_coverage" layout of saved inputs and session files.
+
+CROSS_FIELDS = ("cross_name", "coverpoints", "illegal_bins", "ignore_bins", "operator", "auto_ignore", "cross_mode")
+
+# A blank cross as the GUI offers it: named cross_<gen>_<n>, && between clauses
+def default_cross(gen, number):
+    return {
+        "cross_name": f"cross_{gen.lower().replace(' ', '_')}_{number}",
+        "coverpoints": "",
+        "illegal_bins": "",
+        "ignore_bins": "",
+        "operator": "&&",
+        "auto_ignore": False,
+        "cross_mode": "full"
+    }
+
+class CrossModel:
+    def __init__(self, generations):
+        self.crosses = {gen: [] for gen in generations}
+
+    def __len__(self):
+        return sum(len(crosses) for crosses in self.crosses.values())
+
+    # Append a cross to gen, blank unless fields are given; returns its index
+    def add(self, gen, fields=None):
+        cross = default_cross(gen, len(self.crosses[gen]) + 1)
+        for field, value in (fields or {}).items():
+            if field in CROSS_FIELDS:
+                cross[field] = value
+        self.crosses.setdefault(gen, []).append(cross)
+        return len(self.crosses[gen]) - 1
+
+    def update(self, gen, index, field, value):
+        if field not in CROSS_FIELDS:
+            raise KeyError(f"Unknown cross field '{field}'")
+        self.crosses[gen][index][field] = value
+
+    def remove(self, gen, index):
+        del self.crosses[gen][index]
+
+    # Crosses worth emitting: named and with at least one coverpoint
+    def defined(self, gen):
+        return [cross for cross in self.crosses.get(gen, [])
+                if str(cross["cross_name"]).strip() and str(cross["coverpoints"]).strip()]
+
+    # Saved-inputs "cross_coverage" mapping, with text fields stripped
+    def to_inputs(self):
+        return {
+            gen: [{field: value.strip() if isinstance(value, str) else value for field, value in cross.items()}
+                  for cross in crosses]
+            for gen, crosses in self.crosses.items()
+        }
+
+    # Replace every cross with those of a saved-inputs "cross_coverage" mapping;
+    # generations without saved crosses get one blank cross, as a fresh GUI shows
+    def load(self, cross_coverage, blank_if_empty=True):
+        for gen in self.crosses:
+            self.crosses[gen] = []
+            for cross in cross_coverage.get(gen, []):
+                self.add(gen, cross)
+            if blank_if_empty and not self.crosses[gen]:
+                self.add(gen)
+
+    @classmethod
+    def from_inputs(cls, generations, cross_coverage, blank_if_empty=True):
+        model = cls(generations)
+        model.load(cross_coverage, blank_if_empty)
+        return model
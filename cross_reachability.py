@@ -0,0 +1,87 @@
+from interval_set import IntervalSet
+from bin_expressions import Binsof, Or, select_terms
+from bin_estimator import coverpoint_bin_groups, coverpoint_names, coverpoint_bin_sets
+
+# Derive ignore_bins for cross bins that cannot be hit in a generation.
+# Custom bins are shared by every generation, but each generation only allows
+# some values of each parameter (spec["allowed_values"]). The spec has no joint
+# constraints between parameters, so a cross bin is unreachable exactly when
+# one of its coverpoint bins holds no value the generation allows. For each
+# crossed coverpoint the values of its unreachable bins are collected as an
+# IntervalSet, minus any value a reachable bin also holds so the clause cannot
+# catch a reachable bin, and emitted as one range-compressed
+#     binsof(cov_x) intersect {[a:b],...}
+# term per coverpoint.
+
+# A bin can be hit in a generation when it holds a value the generation allows
+def is_reachable_bin(bin_values, allowed):
+    return bool(bin_values & allowed)
+
+# Value sets of the bins of one parameter's coverpoint that gen can reach, in
+# order; raises ValueError for coverpoints with open-ended bins
+def reachable_bin_sets(spec, gen, param, groups):
+    allowed = IntervalSet.from_items(spec["allowed_values"][gen].get(param, []))
+    return [bin_values for bin_values in coverpoint_bin_sets(groups) if is_reachable_bin(bin_values, allowed)]
+
+# (unreachable, reachable) value sets over a coverpoint's bins
+def _split_reachable(groups, allowed):
+    unreachable = IntervalSet()
+    reachable = IntervalSet()
+    for group in groups:
+        if group.mode == "each":
+            # One bin per value: the bins outside allowed are exactly values - allowed
+            unreachable = unreachable | (group.values - allowed)
+            reachable = reachable | (group.values & allowed)
+        elif group.is_open and group.mode != "single":
+            # Bin boundaries over an open range are tool-defined; assume reachable
+            reachable = reachable | group.values
+        else:
+            for bin_values in group.iter_bin_sets():
+                if is_reachable_bin(bin_values, allowed):
+                    reachable = reachable | bin_values
+                else:
+                    unreachable = unreachable | bin_values
+    return unreachable, reachable
+
+# Values selecting only the unreachable bins of one parameter's coverpoint in gen
+def unreachable_values(spec, user_inputs, gen, param, groups=None):
+    if groups is None:
+        groups = coverpoint_bin_groups(spec, user_inputs, gen).get(param, [])
+    allowed = IntervalSet.from_items(spec["allowed_values"][gen].get(param, []))
+    unreachable, reachable = _split_reachable(groups, allowed)
+    return unreachable - reachable
+
+# Values of each coverpoint the user's ignore expression already ignores
+# outright: top-level terms that are a single binsof(cp) [intersect {...}].
+# None means every bin of the coverpoint is ignored.
+def _ignored_values(ignore_expr):
+    ignored = {}
+    for term in select_terms(ignore_expr):
+        if not isinstance(term, Binsof) or term.coverpoint in ignored and ignored[term.coverpoint] is None:
+            continue
+        if term.items is None:
+            ignored[term.coverpoint] = None
+        else:
+            ignored[term.coverpoint] = ignored.get(term.coverpoint, IntervalSet()) | IntervalSet.from_items(term.items)
+    return ignored
+
+# Select expression ignoring every unreachable bin of a cross in gen, or None.
+# Values the user's ignore_expr already ignores are left out, so no derived
+# term repeats (or overlaps) a clause the user typed.
+def derive_ignore_bins(spec, user_inputs, gen, coverpoints, ignore_expr=None):
+    names = coverpoint_names(spec)
+    groups = coverpoint_bin_groups(spec, user_inputs, gen)
+    ignored = _ignored_values(ignore_expr)
+    terms = []
+    for cp in coverpoints:
+        param = names.get(cp)
+        if param not in groups or (cp in ignored and ignored[cp] is None):
+            continue
+        values = unreachable_values(spec, user_inputs, gen, param, groups[param])
+        if cp in ignored:
+            values = values - ignored[cp]
+        if values:
+            terms.append(Binsof(cp, tuple(values.to_items())))
+    if not terms:
+        return None
+    return terms[0] if len(terms) == 1 else Or(tuple(terms))
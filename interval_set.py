@@ -0,0 +1,183 @@
+import heapq
+from bisect import bisect_right
+
+# "$" bounds are integer sentinels rather than float infinities, so every bound
+# is an int and domains pack into int64 arrays. The sentinels sit far outside
+# any real coverpoint value and leave int64 headroom for the +1/-1 used when
+# merging and splitting intervals.
+OPEN_LOW = -(1 << 62)
+OPEN_HIGH = 1 << 62
+
+def is_open_low(bound):
+    return bound <= OPEN_LOW
+
+def is_open_high(bound):
+    return bound >= OPEN_HIGH
+
+# A typed bound past the sentinels ("$" is exactly OPEN_LOW / OPEN_HIGH) lies
+# outside every allowed set and does not fit an int64 array
+def within_sentinels(bound):
+    return OPEN_LOW <= bound <= OPEN_HIGH
+
+# Sorted, merged set of closed integer intervals [a:b]. Bounds may be
+# OPEN_LOW / OPEN_HIGH for "$". Touching intervals are merged
+# ([1:3] + [4:6] -> [1:6]) since coverpoint values are integers, so every
+# set has exactly one canonical form and membership is a single bisect.
+class IntervalSet:
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, intervals=()):
+        self.starts = []
+        self.ends = []
+        for a, b in sorted((a, b) for a, b in intervals if a <= b):
+            if self.ends and a <= self.ends[-1] + 1:
+                if b > self.ends[-1]:
+                    self.ends[-1] = b
+            else:
+                self.starts.append(a)
+                self.ends.append(b)
+
+    # Build from parse_allowed_values output: [("range", (a, b)), ("value", v), ...]
+    @classmethod
+    def from_items(cls, items):
+        return cls((item, item) if item_type == "value" else item for item_type, item in items)
+
+    @classmethod
+    def from_values(cls, values):
+        return cls((v, v) for v in values)
+
+    # Build from parse_user_input output ({"type": "range"|"list", ...})
+    @classmethod
+    def from_parsed(cls, parsed):
+        if parsed["type"] == "range":
+            return cls([parsed["range"]])
+        return cls.from_values(parsed["values"])
+
+    @classmethod
+    def _from_sorted(cls, starts, ends):
+        result = cls.__new__(cls)
+        result.starts = starts
+        result.ends = ends
+        return result
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __bool__(self):
+        return bool(self.starts)
+
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self):
+        return f"IntervalSet({list(self)})"
+
+    @property
+    def min(self):
+        return self.starts[0] if self.starts else None
+
+    @property
+    def max(self):
+        return self.ends[-1] if self.ends else None
+
+    @property
+    def open_low(self):
+        return bool(self.starts) and is_open_low(self.starts[0])
+
+    @property
+    def open_high(self):
+        return bool(self.ends) and is_open_high(self.ends[-1])
+
+    # Number of integers in the set, or None when it is open-ended
+    def cardinality(self):
+        if self.open_low or self.open_high:
+            return None
+        return sum(b - a + 1 for a, b in self)
+
+    def __contains__(self, value):
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    def contains_range(self, a, b):
+        i = bisect_right(self.starts, a) - 1
+        return i >= 0 and b <= self.ends[i]
+
+    # Every value in the list is a member; sorting first lets one forward scan
+    # replace a bisect per value
+    def contains_all(self, values):
+        starts, ends = self.starts, self.ends
+        n = len(starts)
+        i = 0
+        for v in sorted(values):
+            while i < n and ends[i] < v:
+                i += 1
+            if i == n or v < starts[i]:
+                return False
+        return True
+
+    def issubset(self, other):
+        return all(other.contains_range(a, b) for a, b in self)
+
+    def union(self, other):
+        return IntervalSet(list(self) + list(other))
+
+    def intersection(self, other):
+        starts, ends = [], []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            a = max(self.starts[i], other.starts[j])
+            b = min(self.ends[i], other.ends[j])
+            if a <= b:
+                starts.append(a)
+                ends.append(b)
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_sorted(starts, ends)
+
+    def difference(self, other):
+        starts, ends = [], []
+        j = 0
+        for a, b in self:
+            while j < len(other.starts) and other.ends[j] < a:
+                j += 1
+            k = j
+            while a is not None and k < len(other.starts) and other.starts[k] <= b:
+                if other.starts[k] > a:
+                    starts.append(a)
+                    ends.append(other.starts[k] - 1)
+                # Compare before adding 1 so an open end never runs past OPEN_HIGH
+                a = None if other.ends[k] >= b else max(a, other.ends[k] + 1)
+                k += 1
+            if a is not None:
+                starts.append(a)
+                ends.append(b)
+        return IntervalSet._from_sorted(starts, ends)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    # Back to the ("range", (a, b)) / ("value", v) item list used by the emitters
+    def to_items(self):
+        return [("value", a) if a == b else ("range", (a, b)) for a, b in self]
+
+# Index pairs (i, j), i < j, of sets in the list that share at least one value.
+# Each set is already sorted, so a k-way merge yields every interval in start
+# order; the sweep keeps the furthest end reached by each set so far and checks
+# the new interval against those, O(n log k + n * k) for n intervals in k sets.
+def overlapping_pairs(sets):
+    streams = [zip(s.starts, s.ends, [i] * len(s)) for i, s in enumerate(sets)]
+    reach = {}
+    pairs = set()
+    for a, b, i in heapq.merge(*streams):
+        for j, end in reach.items():
+            if j != i and end >= a:
+                pairs.add((min(i, j), max(i, j)))
+        if b > reach.get(i, b - 1):
+            reach[i] = b
+    return sorted(pairs)
@@ -0,0 +1,103 @@
+import os
+import re
+import json
+import tempfile
+
+from coverage_engine import DEFAULT_SHEET_NAME, load_spec, file_sha256
+
+# On-disk cache of parsed spec workbooks. Entries are keyed by the SHA-256 of
+# the workbook bytes plus the sheet name, so an unchanged spec loads straight
+# from JSON without pandas or openpyxl, and any edit to the workbook misses
+# the cache and triggers a rebuild.
+
+CACHE_VERSION = 3
+DEFAULT_CACHE_DIR = ".spec_cache"
+
+# SHA-256 of the workbook contents, read in chunks
+def workbook_hash(excel_file):
+    return file_sha256(excel_file)
+
+# Cache file prefix shared by every version of one workbook/sheet pair
+def _cache_prefix(excel_file, sheet_name):
+    base = os.path.splitext(os.path.basename(excel_file))[0]
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", f"{base}.{sheet_name}") + "."
+
+def cache_path(excel_file, sheet_name, content_hash, cache_dir):
+    return os.path.join(cache_dir, f"{_cache_prefix(excel_file, sheet_name)}{content_hash[:16]}.json")
+
+# JSON stores tuples as lists; restore the ("range", (a, b)) / ("value", v) shape
+def _restore_allowed_values(raw):
+    allowed_values = {}
+    for gen, params in raw.items():
+        allowed_values[gen] = {}
+        for param, items in params.items():
+            allowed_values[gen][param] = [
+                (item_type, tuple(item) if item_type == "range" else item) for item_type, item in items
+            ]
+    return allowed_values
+
+def _read_cache(path, content_hash, sheet_name):
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (data.get("version") != CACHE_VERSION or data.get("hash") != content_hash
+            or data.get("sheet") != sheet_name):
+        return None
+    spec = data["spec"]
+    spec["allowed_values"] = _restore_allowed_values(spec["allowed_values"])
+    return spec
+
+# Write atomically so a crashed run never leaves a truncated cache entry
+def _write_cache(path, content_hash, sheet_name, spec):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Derived lookups (domain_index) are rebuilt on load, not cached
+    spec = {key: value for key, value in spec.items() if key != "domain_index"}
+    data = {"version": CACHE_VERSION, "hash": content_hash, "sheet": sheet_name, "spec": spec}
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+# Drop cache entries left behind by earlier versions of the same workbook/sheet
+def _remove_stale_entries(path, excel_file, sheet_name, cache_dir):
+    prefix = _cache_prefix(excel_file, sheet_name)
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    for name in names:
+        stale = os.path.join(cache_dir, name)
+        if name.startswith(prefix) and name.endswith(".json") and stale != path:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+# load_spec with a content-hash cache in front of it. The cache lives next to
+# the workbook unless cache_dir is given.
+def load_spec_cached(excel_file, sheet_name=DEFAULT_SHEET_NAME, cache_dir=None, reader="stream"):
+    if not os.path.exists(excel_file):
+        return load_spec(excel_file, sheet_name, reader)  # raises the usual SpecError
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(excel_file)), DEFAULT_CACHE_DIR)
+
+    content_hash = workbook_hash(excel_file)
+    path = cache_path(excel_file, sheet_name, content_hash, cache_dir)
+    spec = _read_cache(path, content_hash, sheet_name)
+    if spec is not None:
+        return spec
+
+    spec = load_spec(excel_file, sheet_name, reader)
+    try:
+        _write_cache(path, content_hash, sheet_name, spec)
+        _remove_stale_entries(path, excel_file, sheet_name, cache_dir)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: could not write spec cache '{path}': {e}")
+    return spec
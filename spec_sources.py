@@ -0,0 +1,139 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from coverage_engine import DEFAULT_SHEET_NAME, SpecError, load_spec
+from spec_cache import load_spec_cached
+from interval_set import IntervalSet
+
+# Specs split across several workbooks/sheets (one per PHY family) are loaded
+# in parallel, one process per source, and merged into a single spec with the
+# same layout load_spec returns. Disagreements between sources are collected
+# in spec["conflicts"] rather than silently resolved.
+
+# "book.xlsx" or "book.xlsx:Sheet2"; a drive letter such as "C:\..." is not a sheet
+def parse_source(text, default_sheet=DEFAULT_SHEET_NAME):
+    path, sep, sheet = text.rpartition(":")
+    if sep and len(path) > 1 and sheet and not any(c in sheet for c in "/\\"):
+        return path, sheet
+    return text, default_sheet
+
+def source_label(source):
+    path, sheet = source
+    return f"{os.path.basename(path)}:{sheet}"
+
+# Top-level so ProcessPoolExecutor can pickle it
+def _load_source(job):
+    path, sheet, reader, use_cache = job
+    if use_cache:
+        return load_spec_cached(path, sheet, reader=reader)
+    return load_spec(path, sheet, reader)
+
+# Load every (path, sheet) source, in parallel when there is more than one
+def load_sources(sources, reader="stream", use_cache=True, max_workers=None):
+    jobs = [(path, sheet, reader, use_cache) for path, sheet in sources]
+    if len(jobs) <= 1:
+        return [_load_source(job) for job in jobs]
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_load_source, jobs))
+
+def _conflict(conflicts, kind, gen, param, labels, values):
+    conflicts.append({
+        "kind": kind,
+        "generation": gen,
+        "parameter": param,
+        "sources": labels,
+        "values": values,
+    })
+    where = f"'{param}'" + (f" in '{gen}'" if gen is not None else "")
+    print(f"Warning: conflicting {kind} for {where}: " +
+          "; ".join(f"{label} = {value}" for label, value in zip(labels, values)) +
+          f". Using {labels[0]}.")
+
+# Merge loaded specs in source order. The first source to give a non-empty value
+# wins; a later non-empty value covering different values is recorded as a
+# conflict ([0:7] and 0,1,2,3,4,5,6,7 agree). Repeated parameter rows are kept
+# as (source label, sheet row) pairs, and parameter_sources names the source
+# that first listed each parameter, which takes precedence.
+def merge_specs(specs, labels):
+    parameters = []
+    generations = []
+    allowed_values = {}
+    default_bins = {}
+    pkt_types = {}
+    duplicate_rows = {}
+    parameter_sources = {}
+    conflicts = []
+    origin = {}  # (kind, gen, param) -> label of the source that set it
+
+    for spec, label in zip(specs, labels):
+        for param in spec["parameters"]:
+            if param not in default_bins:
+                parameters.append(param)
+                default_bins[param] = None
+                parameter_sources[param] = label
+        for gen in spec["generations"]:
+            if gen not in allowed_values:
+                generations.append(gen)
+                allowed_values[gen] = {}
+                pkt_types[gen] = None
+
+        for param in spec["parameters"]:
+            bins_value = spec["default_bins"].get(param)
+            if bins_value is None:
+                continue
+            if default_bins[param] is None:
+                default_bins[param] = bins_value
+                origin[("default_bins", None, param)] = label
+            elif default_bins[param] != bins_value:
+                _conflict(conflicts, "default_bins", None, param,
+                          [origin[("default_bins", None, param)], label], [default_bins[param], bins_value])
+
+        for gen in spec["generations"]:
+            for param, values in spec["allowed_values"][gen].items():
+                current = allowed_values[gen].get(param)
+                if not current:
+                    allowed_values[gen][param] = values
+                    if values:
+                        origin[("allowed_values", gen, param)] = label
+                elif values and IntervalSet.from_items(values) != IntervalSet.from_items(current):
+                    _conflict(conflicts, "allowed_values", gen, param,
+                              [origin[("allowed_values", gen, param)], label], [current, values])
+
+            pkt_type = spec["pkt_types"].get(gen)
+            if pkt_type is None:
+                continue
+            if pkt_types[gen] is None:
+                pkt_types[gen] = pkt_type
+                origin[("pkt_type", gen, "pkt_type")] = label
+            elif str(pkt_types[gen]) != str(pkt_type):
+                _conflict(conflicts, "pkt_type", gen, "pkt_type",
+                          [origin[("pkt_type", gen, "pkt_type")], label], [pkt_types[gen], pkt_type])
+
+        # Row numbers are only meaningful next to the source that reported them
+        for param, rows in spec.get("duplicate_rows", {}).items():
+            duplicate_rows.setdefault(param, []).extend((label, row) for row in rows)
+
+    # Every generation carries every parameter, as in a single-sheet spec
+    for gen in generations:
+        allowed_values[gen] = {param: allowed_values[gen].get(param, []) for param in parameters}
+
+    return {
+        "parameters": parameters,
+        "generations": generations,
+        "allowed_values": allowed_values,
+        "default_bins": default_bins,
+        "pkt_types": pkt_types,
+        "duplicate_rows": duplicate_rows,
+        "parameter_sources": parameter_sources,
+        "conflicts": conflicts,
+    }
+
+# Load and merge several workbook/sheet sources into one spec
+def load_merged_spec(sources, reader="stream", use_cache=True, max_workers=None):
+    if not sources:
+        raise SpecError("No spec sources given.")
+    specs = load_sources(sources, reader, use_cache, max_workers)
+    if len(specs) == 1:
+        return specs[0]
+    return merge_specs(specs, [source_label(source) for source in sources])